@@ -0,0 +1,280 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from analytics_service import ANALYTICS_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_INTERVAL_SECONDS = int(os.environ.get("ANALYTICS_ROLLUP_INTERVAL_SECONDS", 60))
+ROLLUP_CHUNK_SIZE = int(os.environ.get("ANALYTICS_ROLLUP_CHUNK_SIZE", 50000))
+
+# Buckets are aligned to IST so hour and day rollups match the newsroom's clock
+ROLLUP_TZ_OFFSET_SECONDS = 19800
+
+# granularity -> (bucket size in seconds, retention in seconds or None to keep forever)
+GRANULARITIES = {
+    "minute": (60, 2 * 86400),
+    "hour": (3600, 90 * 86400),
+    "day": (86400, None),
+}
+
+CREATE_ROLLUP_TABLES = """
+    CREATE TABLE IF NOT EXISTS analytics_rollups (
+        granularity TEXT NOT NULL,
+        bucket_start INTEGER NOT NULL,
+        article_id INTEGER NOT NULL DEFAULT 0,
+        category TEXT NOT NULL DEFAULT '',
+        state TEXT NOT NULL DEFAULT '',
+        language TEXT NOT NULL DEFAULT '',
+        event_count INTEGER NOT NULL DEFAULT 0,
+        view_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (granularity, bucket_start, article_id, category, state, language)
+    );
+    CREATE INDEX IF NOT EXISTS ix_analytics_rollups_article
+        ON analytics_rollups (granularity, article_id, bucket_start);
+    CREATE TABLE IF NOT EXISTS analytics_rollup_state (
+        name TEXT PRIMARY KEY,
+        last_event_id INTEGER NOT NULL
+    );
+"""
+
+# Only explicit article views count as reads; gallery and image views also end
+# in "_view" but are not about the article
+ARTICLE_VIEW_ACTIONS = ("view", "article_view")
+VIEW_CASE = (
+    "CASE WHEN article_id IS NOT NULL AND action IN ("
+    + ", ".join(f"'{action}'" for action in ARTICLE_VIEW_ACTIONS)
+    + ") THEN 1 ELSE 0 END"
+)
+
+ROLLUP_UPSERT = f"""
+    INSERT INTO analytics_rollups
+        (granularity, bucket_start, article_id, category, state, language, event_count, view_count)
+    SELECT
+        :granularity,
+        ((CAST(received_at AS INTEGER) + :offset) / :size) * :size - :offset AS bucket,
+        COALESCE(article_id, 0),
+        COALESCE(category, ''),
+        COALESCE(state, ''),
+        COALESCE(language, ''),
+        COUNT(*),
+        SUM({VIEW_CASE})
+    FROM analytics_events
+    WHERE id > :low AND id <= :high
+    GROUP BY 2, 3, 4, 5, 6
+    ON CONFLICT (granularity, bucket_start, article_id, category, state, language) DO UPDATE SET
+        event_count = event_count + excluded.event_count,
+        view_count = view_count + excluded.view_count
+"""
+
+# Dimensions the query API can group by
+ROLLUP_DIMENSIONS = ("article_id", "category", "state", "language")
+
+
+class AnalyticsRollupService:
+    """Incrementally aggregates raw analytics events into per-minute/hour/day buckets"""
+
+    def __init__(self, db_path=ANALYTICS_DB_PATH):
+        self.db_path = db_path
+        self.scheduler = BackgroundScheduler()
+        self.job_id = "rollup_analytics_events"
+        self._lock = threading.Lock()
+        self._connection = None
+        self.last_run_at = None
+        self.last_run_duration = None
+        self.last_event_id = 0
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(CREATE_ROLLUP_TABLES)
+            self._connection = connection
+        return self._connection
+
+    def _events_table_exists(self, connection: sqlite3.Connection) -> bool:
+        return connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='analytics_events'"
+        ).fetchone() is not None
+
+    def run_rollup(self) -> int:
+        """Fold events newer than the stored watermark into the rollup buckets.
+
+        Each chunk of events is aggregated and the watermark advanced in the
+        same transaction, so an interrupted run never double counts.
+        """
+        with self._lock:
+            started = time.perf_counter()
+            processed = 0
+            try:
+                connection = self._get_connection()
+                if not self._events_table_exists(connection):
+                    return 0
+
+                low = 0
+                while True:
+                    # The watermark is read inside the write transaction, so two
+                    # processes can never fold the same range of events
+                    connection.execute("BEGIN IMMEDIATE")
+                    try:
+                        row = connection.execute(
+                            "SELECT last_event_id FROM analytics_rollup_state WHERE name = 'events'"
+                        ).fetchone()
+                        low = row["last_event_id"] if row else 0
+                        max_id = connection.execute("SELECT MAX(id) FROM analytics_events").fetchone()[0] or 0
+                        if low >= max_id:
+                            connection.rollback()
+                            break
+                        high = min(low + ROLLUP_CHUNK_SIZE, max_id)
+                        for granularity, (size, _) in GRANULARITIES.items():
+                            connection.execute(ROLLUP_UPSERT, {
+                                "granularity": granularity,
+                                "size": size,
+                                "offset": ROLLUP_TZ_OFFSET_SECONDS,
+                                "low": low,
+                                "high": high
+                            })
+                        connection.execute(
+                            "INSERT INTO analytics_rollup_state (name, last_event_id) VALUES ('events', ?) "
+                            "ON CONFLICT (name) DO UPDATE SET last_event_id = excluded.last_event_id",
+                            (high,)
+                        )
+                        connection.commit()
+                    except Exception:
+                        connection.rollback()
+                        raise
+                    processed += high - low
+                    low = high
+
+                self.last_event_id = low
+                self._prune(connection)
+            except Exception as e:
+                logger.error(f"Failed to roll up analytics events: {str(e)}")
+            self.last_run_at = time.time()
+            self.last_run_duration = time.perf_counter() - started
+            if processed:
+                logger.info(f"Rolled up {processed} analytics events in {self.last_run_duration:.3f}s")
+            return processed
+
+    def _prune(self, connection: sqlite3.Connection):
+        """Drop fine-grained buckets that are past their retention window"""
+        now = int(time.time())
+        with connection:
+            for granularity, (_, retention) in GRANULARITIES.items():
+                if retention is None:
+                    continue
+                connection.execute(
+                    "DELETE FROM analytics_rollups WHERE granularity = ? AND bucket_start < ?",
+                    (granularity, now - retention)
+                )
+
+    def query(
+        self,
+        granularity: str,
+        start: float,
+        end: float,
+        article_id: Optional[int] = None,
+        category: Optional[str] = None,
+        state: Optional[str] = None,
+        language: Optional[str] = None,
+        group_by: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Time series of event and view counts between start and end (epoch seconds)"""
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unknown granularity '{granularity}'")
+        group_by = [dimension for dimension in (group_by or []) if dimension in ROLLUP_DIMENSIONS]
+
+        conditions = ["granularity = ?", "bucket_start >= ?", "bucket_start < ?"]
+        params: List[Any] = [granularity, int(start), int(end)]
+        for column, value in (("article_id", article_id), ("category", category),
+                              ("state", state), ("language", language)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+
+        columns = ", ".join(["bucket_start"] + group_by)
+        sql = (
+            f"SELECT {columns}, SUM(event_count) AS events, SUM(view_count) AS views "
+            f"FROM analytics_rollups WHERE {' AND '.join(conditions)} "
+            f"GROUP BY {columns} ORDER BY bucket_start"
+        )
+        with self._lock:
+            rows = self._get_connection().execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def most_read(
+        self,
+        window_seconds: int,
+        limit: int = 15,
+        category: Optional[str] = None,
+        state: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> List[Dict[str, int]]:
+        """Article ids ranked by views over a sliding window ending now"""
+        granularity = self.granularity_for_window(window_seconds)
+        since = int(time.time()) - window_seconds
+        # Start from the bucket containing `since` so a partial bucket is included
+        size = GRANULARITIES[granularity][0]
+        since = ((since + ROLLUP_TZ_OFFSET_SECONDS) // size) * size - ROLLUP_TZ_OFFSET_SECONDS
+
+        conditions = ["granularity = ?", "bucket_start >= ?", "article_id != 0"]
+        params: List[Any] = [granularity, since]
+        for column, value in (("category", category), ("state", state), ("language", language)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        params.append(limit)
+
+        sql = (
+            "SELECT article_id, SUM(view_count) AS views FROM analytics_rollups "
+            f"WHERE {' AND '.join(conditions)} "
+            "GROUP BY article_id HAVING views > 0 ORDER BY views DESC LIMIT ?"
+        )
+        with self._lock:
+            rows = self._get_connection().execute(sql, params).fetchall()
+        return [{"article_id": row["article_id"], "views": row["views"]} for row in rows]
+
+    @staticmethod
+    def granularity_for_window(window_seconds: int) -> str:
+        """Pick the coarsest granularity that still resolves the window reasonably"""
+        if window_seconds <= 6 * 3600:
+            return "minute"
+        if window_seconds <= 14 * 86400:
+            return "hour"
+        return "day"
+
+    def start(self, interval_seconds: int = ROLLUP_INTERVAL_SECONDS):
+        """Start the background rollup job"""
+        self.scheduler.add_job(
+            func=self.run_rollup,
+            trigger=IntervalTrigger(seconds=interval_seconds),
+            id=self.job_id,
+            name="Roll up analytics events",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
+        if not self.scheduler.running:
+            self.scheduler.start()
+            logger.info(f"Analytics rollups started (every {interval_seconds}s)")
+
+    def stop(self):
+        """Stop the background rollup job"""
+        if self.scheduler.running:
+            self.scheduler.shutdown()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        logger.info("Analytics rollups stopped")
+
+
+# Global analytics rollup instance
+analytics_rollups = AnalyticsRollupService()
@@ -0,0 +1,256 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).parent
+
+# Analytics events live in their own SQLite file so ingestion never contends
+# with the CMS database writer lock
+ANALYTICS_DB_PATH = Path(os.environ.get("ANALYTICS_DB_PATH", ROOT_DIR / "analytics.db"))
+ANALYTICS_BUFFER_SIZE = int(os.environ.get("ANALYTICS_BUFFER_SIZE", 100000))
+ANALYTICS_FLUSH_BATCH_SIZE = int(os.environ.get("ANALYTICS_FLUSH_BATCH_SIZE", 5000))
+ANALYTICS_FLUSH_INTERVAL_SECONDS = int(os.environ.get("ANALYTICS_FLUSH_INTERVAL_SECONDS", 2))
+ANALYTICS_MAX_EVENTS_PER_REQUEST = 500
+ANALYTICS_MAX_PROPS_BYTES = 4096
+
+# Compact event schema: column -> (accepted payload keys, type, max length).
+# Gallery ids share a number space with article ids, so galleryId stays in props
+EVENT_SCHEMA = (
+    ("action", ("action", "userAction", "event"), str, 64),
+    ("article_id", ("articleId", "article_id"), int, None),
+    ("category", ("category", "section"), str, 64),
+    ("state", ("state",), str, 16),
+    ("language", ("language", "lang"), str, 8),
+    ("source", ("source",), str, 64),
+    ("session_id", ("sessionId", "session_id"), str, 64),
+    ("client_ts", ("timestamp",), str, 40),
+)
+SCHEMA_KEYS = frozenset(key for _, keys, _, _ in EVENT_SCHEMA for key in keys)
+EVENT_COLUMNS = ("received_at",) + tuple(column for column, _, _, _ in EVENT_SCHEMA) + ("props",)
+
+CREATE_EVENTS_TABLE = """
+    CREATE TABLE IF NOT EXISTS analytics_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        received_at REAL NOT NULL,
+        action TEXT NOT NULL,
+        article_id INTEGER,
+        category TEXT,
+        state TEXT,
+        language TEXT,
+        source TEXT,
+        session_id TEXT,
+        client_ts TEXT,
+        props TEXT
+    )
+"""
+
+INSERT_EVENT = f"""
+    INSERT INTO analytics_events ({", ".join(EVENT_COLUMNS)})
+    VALUES ({", ".join("?" for _ in EVENT_COLUMNS)})
+"""
+
+
+def _coerce(value: Any, value_type: type, max_length: Optional[int]):
+    """Coerce a payload value to its schema type, returning None when it does not fit"""
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    if value_type is int:
+        if isinstance(value, bool):
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+    value = str(value)
+    return value[:max_length] if max_length else value
+
+
+def normalize_event(payload: Any, received_at: float) -> Optional[Tuple]:
+    """Validate a raw tracking payload against the compact event schema.
+
+    Returns a row tuple ordered like EVENT_COLUMNS, or None if the payload is
+    not an object or carries no action. Keys outside the schema are kept as a
+    size-capped JSON blob so existing frontend payloads lose nothing useful.
+    """
+    if not isinstance(payload, dict):
+        return None
+
+    row = [received_at]
+    for column, keys, value_type, max_length in EVENT_SCHEMA:
+        value = None
+        for key in keys:
+            if key in payload:
+                value = _coerce(payload[key], value_type, max_length)
+                if value is not None:
+                    break
+        row.append(value)
+
+    if not row[1]:
+        return None
+
+    extra = {key: value for key, value in payload.items() if key not in SCHEMA_KEYS}
+    props = None
+    if extra:
+        try:
+            props = json.dumps(extra, separators=(",", ":"), default=str)
+        except (TypeError, ValueError):
+            props = None
+        if props and len(props) > ANALYTICS_MAX_PROPS_BYTES:
+            props = None
+    row.append(props)
+    return tuple(row)
+
+
+class AnalyticsIngestionService:
+    """Buffers tracking events in memory and flushes them to the analytics store in batches"""
+
+    def __init__(self, db_path: Path = ANALYTICS_DB_PATH, buffer_size: int = ANALYTICS_BUFFER_SIZE):
+        self.db_path = Path(db_path)
+        self.buffer = deque(maxlen=buffer_size)
+        self.scheduler = BackgroundScheduler()
+        self.job_id = "flush_analytics_events"
+        self._flush_lock = threading.Lock()
+        self._connection = None
+        self._listeners: List[Callable[[List[Tuple]], None]] = []
+        self.accepted_count = 0
+        self.rejected_count = 0
+        self.dropped_count = 0
+        self.flushed_count = 0
+        self.last_flush_at = None
+        self.last_flush_duration = None
+
+    def ingest(self, payloads: Iterable[Any]) -> Tuple[int, int]:
+        """Validate and buffer events without touching any database.
+
+        Returns (accepted, rejected). When the ring buffer is full the oldest
+        buffered events are overwritten and counted as dropped.
+        """
+        received_at = time.time()
+        accepted = 0
+        rejected = 0
+        for payload in payloads:
+            row = normalize_event(payload, received_at)
+            if row is None:
+                rejected += 1
+                continue
+            if len(self.buffer) == self.buffer.maxlen:
+                self.dropped_count += 1
+            self.buffer.append(row)
+            accepted += 1
+        self.accepted_count += accepted
+        self.rejected_count += rejected
+        return accepted, rejected
+
+    def add_listener(self, callback: Callable[[List[Tuple]], None]):
+        """Register a callback that receives each batch of rows once it is persisted; registering twice is a no-op"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def _notify(self, batch: List[Tuple]):
+        for callback in self._listeners:
+            try:
+                callback(batch)
+            except Exception as e:
+                logger.error(f"Analytics listener {callback} failed: {str(e)}")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(CREATE_EVENTS_TABLE)
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def _drain(self, limit: int) -> List[Tuple]:
+        batch = []
+        buffer = self.buffer
+        while buffer and len(batch) < limit:
+            try:
+                batch.append(buffer.popleft())
+            except IndexError:
+                break
+        return batch
+
+    def flush(self) -> int:
+        """Write all buffered events to the analytics store, one transaction per batch"""
+        with self._flush_lock:
+            started = time.perf_counter()
+            written = 0
+            try:
+                connection = self._get_connection()
+                while True:
+                    batch = self._drain(ANALYTICS_FLUSH_BATCH_SIZE)
+                    if not batch:
+                        break
+                    try:
+                        with connection:
+                            connection.executemany(INSERT_EVENT, batch)
+                    except sqlite3.Error:
+                        # Put the batch back so the next flush can retry it
+                        self.buffer.extendleft(reversed(batch))
+                        raise
+                    written += len(batch)
+                    self._notify(batch)
+            except Exception as e:
+                logger.error(f"Failed to flush analytics events: {str(e)}")
+            self.flushed_count += written
+            self.last_flush_at = time.time()
+            self.last_flush_duration = time.perf_counter() - started
+            if written:
+                logger.debug(f"Flushed {written} analytics events in {self.last_flush_duration:.3f}s")
+            return written
+
+    def start(self, interval_seconds: int = ANALYTICS_FLUSH_INTERVAL_SECONDS):
+        """Start the background flush job"""
+        self.scheduler.add_job(
+            func=self.flush,
+            trigger=IntervalTrigger(seconds=interval_seconds),
+            id=self.job_id,
+            name="Flush buffered analytics events",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
+        if not self.scheduler.running:
+            self.scheduler.start()
+            logger.info(f"Analytics ingestion started (flush every {interval_seconds}s)")
+
+    def stop(self):
+        """Stop the background flush job and write whatever is still buffered"""
+        if self.scheduler.running:
+            self.scheduler.shutdown()
+        self.flush()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        logger.info("Analytics ingestion stopped")
+
+    def stats(self) -> Dict[str, Any]:
+        """Ingestion counters for the admin status endpoint"""
+        return {
+            "buffered": len(self.buffer),
+            "buffer_capacity": self.buffer.maxlen,
+            "accepted": self.accepted_count,
+            "rejected": self.rejected_count,
+            "dropped": self.dropped_count,
+            "flushed": self.flushed_count,
+            "last_flush_at": self.last_flush_at,
+            "last_flush_duration_seconds": self.last_flush_duration
+        }
+
+
+# Global analytics ingestion instance
+analytics_service = AnalyticsIngestionService()
@@ -1,12 +1,8 @@
 import os
 from datetime import datetime, timedelta
 from typing import List
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from fastapi import Depends, HTTPException, status
-from motor.motor_asyncio import AsyncIOMotorClient
-from bson import ObjectId
 from models.auth_models import UserInDB, UserResponse
 
 # Configuration
@@ -14,8 +10,15 @@ SECRET_KEY = os.environ.get("SECRET_KEY", "tadka-secret-key-change-in-production
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 480  # 8 hours
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing; passlib and jose are imported on first use to keep them off the startup path
+_pwd_context = None
+
+def get_pwd_context():
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+        _pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return _pwd_context
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
@@ -23,21 +26,30 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 # MongoDB connection
 MONGO_URL = os.environ.get("MONGO_URL", "mongodb://localhost:27017")
 DB_NAME = os.environ.get("DB_NAME", "test_database")
+# Fail auth requests fast instead of hanging for pymongo's 30s default when Mongo is unreachable
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get("MONGO_SERVER_SELECTION_TIMEOUT_MS", 5000))
+
+_client = None
 
-client = AsyncIOMotorClient(MONGO_URL)
-db = client[DB_NAME]
-users_collection = db.users
+def get_users_collection():
+    """Users collection; the Motor client is created on first use rather than at import"""
+    global _client
+    if _client is None:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        _client = AsyncIOMotorClient(MONGO_URL, serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS)
+    return _client[DB_NAME].users
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password"""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """Hash a password"""
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     """Create JWT access token"""
+    from jose import jwt
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
@@ -50,7 +62,7 @@ def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
 
 async def get_user_by_username(username: str) -> UserInDB:
     """Get user from database by username"""
-    user_data = await users_collection.find_one({"username": username})
+    user_data = await get_users_collection().find_one({"username": username})
     if user_data:
         user_data["_id"] = str(user_data["_id"])
         return UserInDB(**user_data)
@@ -67,6 +79,7 @@ async def authenticate_user(username: str, password: str) -> UserInDB:
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserResponse:
     """Get current user from JWT token"""
+    from jose import JWTError, jwt
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -118,7 +131,7 @@ require_viewer = require_roles(["Viewer", "Author", "Publisher", "Admin"])
 
 async def create_default_admin():
     """Create default admin user if it doesn't exist"""
-    admin_exists = await users_collection.find_one({"username": "admin"})
+    admin_exists = await get_users_collection().find_one({"username": "admin"})
     if not admin_exists:
         admin_user = {
             "username": "admin",
@@ -129,7 +142,12 @@ async def create_default_admin():
             "password": "admin123"  # This will be removed after hashing
         }
         del admin_user["password"]  # Remove plain password
-        await users_collection.insert_one(admin_user)
+        await get_users_collection().insert_one(admin_user)
         print("✅ Default admin user created: username='admin', password='admin123'")
         return True
-    return False
\ No newline at end of file
+    return False
+
+if __name__ == "__main__":
+    # Out-of-band bootstrap for deployments that run with CREATE_DEFAULT_ADMIN=false
+    import asyncio
+    asyncio.run(create_default_admin())
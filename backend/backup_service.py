@@ -0,0 +1,417 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from analytics_service import ANALYTICS_DB_PATH
+from database import DB_PATH
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).parent
+BACKUP_DIR = Path(os.environ.get("BACKUP_DIR", ROOT_DIR / "backups"))
+BACKUP_UPLOAD_DIR = Path(os.environ.get("BACKUP_UPLOAD_DIR", ROOT_DIR / "uploads"))
+BACKUP_INTERVAL_HOURS = int(os.environ.get("BACKUP_INTERVAL_HOURS", 6))
+BACKUP_VERIFY_INTERVAL_HOURS = int(os.environ.get("BACKUP_VERIFY_INTERVAL_HOURS", 24))
+BACKUP_RETENTION = int(os.environ.get("BACKUP_RETENTION", 7))
+# Pages copied per backup step; the source is only locked while a step runs
+BACKUP_PAGES_PER_STEP = int(os.environ.get("BACKUP_PAGES_PER_STEP", 256))
+# Pause between steps so CMS and scheduler writes get the database in between
+BACKUP_STEP_SLEEP_SECONDS = float(os.environ.get("BACKUP_STEP_SLEEP_SECONDS", 0.005))
+# Wait before retrying a step that found the source busy or locked
+BACKUP_BUSY_RETRY_SECONDS = float(os.environ.get("BACKUP_BUSY_RETRY_SECONDS", 0.25))
+# Restored upload files whose hash is re-checked during verification (sizes are checked for all)
+BACKUP_VERIFY_SAMPLE_FILES = int(os.environ.get("BACKUP_VERIFY_SAMPLE_FILES", 100))
+
+BACKUP_DATABASES = {
+    "blog_cms.db": DB_PATH,
+    "analytics.db": ANALYTICS_DB_PATH,
+}
+
+SNAPSHOT_METADATA_FILE = "backup.json"
+UPLOADS_MANIFEST_FILE = "uploads_manifest.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _throughput(size: int, seconds: float) -> float:
+    return round(size / seconds / (1024 * 1024), 2) if seconds > 0 else 0.0
+
+
+class BackupService:
+    """Consistent online backups of the SQLite databases plus incremental upload snapshots"""
+
+    def __init__(self, backup_dir: Path = BACKUP_DIR, upload_dir: Path = BACKUP_UPLOAD_DIR,
+                 databases: Dict[str, Path] = None):
+        self.backup_dir = Path(backup_dir)
+        self.upload_dir = Path(upload_dir)
+        self.databases = databases if databases is not None else BACKUP_DATABASES
+        self.scheduler = BackgroundScheduler()
+        self.job_id = "run_backup"
+        self.verify_job_id = "verify_backup"
+        self._lock = threading.Lock()
+        self.last_backup: Optional[Dict[str, Any]] = None
+        self.last_verification: Optional[Dict[str, Any]] = None
+
+    @property
+    def snapshots_dir(self) -> Path:
+        return self.backup_dir / "snapshots"
+
+    @property
+    def objects_dir(self) -> Path:
+        # Upload files stored once by content hash and shared by every snapshot
+        return self.backup_dir / "objects"
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / sha256
+
+    def backup_database(self, source: Path, destination: Path) -> Dict[str, Any]:
+        """Copy a live database page by page with the SQLite online backup API"""
+        started = time.perf_counter()
+        tmp_destination = destination.with_suffix(destination.suffix + ".tmp")
+        tmp_destination.unlink(missing_ok=True)
+        steps = 0
+
+        def progress(status, remaining, total):
+            nonlocal steps
+            steps += 1
+            # The backup API only sleeps on BUSY/LOCKED, so yield to writers here
+            if remaining and BACKUP_STEP_SLEEP_SECONDS > 0:
+                time.sleep(BACKUP_STEP_SLEEP_SECONDS)
+
+        source_connection = sqlite3.connect(str(source), timeout=30)
+        destination_connection = sqlite3.connect(str(tmp_destination))
+        try:
+            source_connection.backup(
+                destination_connection,
+                pages=BACKUP_PAGES_PER_STEP,
+                progress=progress,
+                sleep=BACKUP_BUSY_RETRY_SECONDS
+            )
+            # A self-contained file is easier to restore than one with a WAL beside it
+            destination_connection.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            destination_connection.close()
+            source_connection.close()
+        os.replace(tmp_destination, destination)
+
+        duration = time.perf_counter() - started
+        size = destination.stat().st_size
+        return {
+            "bytes": size,
+            "steps": steps,
+            "duration_seconds": round(duration, 3),
+            "throughput_mb_per_second": _throughput(size, duration)
+        }
+
+    def _latest_uploads_manifest(self) -> Dict[str, dict]:
+        for snapshot in reversed(self.list_snapshots()):
+            path = self.snapshots_dir / snapshot["id"] / UPLOADS_MANIFEST_FILE
+            try:
+                return json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+        return {}
+
+    def backup_uploads(self, snapshot_dir: Path) -> Dict[str, Any]:
+        """Write a hash manifest of the upload directory, storing only files not already backed up"""
+        started = time.perf_counter()
+        previous = self._latest_uploads_manifest()
+        manifest = {}
+        new_files = new_bytes = hashed_files = total_bytes = 0
+
+        if self.upload_dir.exists():
+            for path in sorted(self.upload_dir.rglob("*")):
+                if not path.is_file():
+                    continue
+                relative = path.relative_to(self.upload_dir).as_posix()
+                stat = path.stat()
+                entry = previous.get(relative)
+                # Unchanged size and mtime: reuse the previous hash instead of re-reading the file
+                if not entry or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+                    entry = {"sha256": _sha256_file(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+                    hashed_files += 1
+                object_path = self._object_path(entry["sha256"])
+                if not object_path.exists():
+                    object_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = object_path.with_suffix(".tmp")
+                    shutil.copyfile(path, tmp_path)
+                    os.replace(tmp_path, object_path)
+                    new_files += 1
+                    new_bytes += entry["size"]
+                manifest[relative] = entry
+                total_bytes += entry["size"]
+
+        (snapshot_dir / UPLOADS_MANIFEST_FILE).write_text(json.dumps(manifest, separators=(",", ":")))
+        duration = time.perf_counter() - started
+        return {
+            "files": len(manifest),
+            "bytes": total_bytes,
+            "hashed_files": hashed_files,
+            "new_files": new_files,
+            "new_bytes": new_bytes,
+            "duration_seconds": round(duration, 3),
+            "throughput_mb_per_second": _throughput(new_bytes, duration)
+        }
+
+    def run_backup(self) -> Dict[str, Any]:
+        """Take a full snapshot: every database plus the upload manifest"""
+        with self._lock:
+            started = time.perf_counter()
+            snapshot_id = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")[:-3]
+            snapshot_dir = self.snapshots_dir / snapshot_id
+            tmp_dir = self.snapshots_dir / f".{snapshot_id}.tmp"
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir(parents=True)
+
+            try:
+                databases = {}
+                for name, source in self.databases.items():
+                    if Path(source).exists():
+                        databases[name] = self.backup_database(Path(source), tmp_dir / name)
+                uploads = self.backup_uploads(tmp_dir)
+                duration = time.perf_counter() - started
+                total_bytes = sum(result["bytes"] for result in databases.values()) + uploads["new_bytes"]
+                metadata = {
+                    "id": snapshot_id,
+                    "created_at": datetime.utcnow().isoformat(),
+                    "databases": databases,
+                    "uploads": uploads,
+                    "duration_seconds": round(duration, 3),
+                    "throughput_mb_per_second": _throughput(total_bytes, duration)
+                }
+                (tmp_dir / SNAPSHOT_METADATA_FILE).write_text(json.dumps(metadata, indent=2))
+                os.replace(tmp_dir, snapshot_dir)
+            except Exception:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise
+
+            self.prune()
+            self.last_backup = metadata
+            logger.info(
+                f"Backup {snapshot_id} done in {metadata['duration_seconds']}s "
+                f"({metadata['throughput_mb_per_second']} MB/s, {uploads['new_files']} new upload files)"
+            )
+            return metadata
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        """Completed snapshots, oldest first"""
+        snapshots = []
+        if not self.snapshots_dir.exists():
+            return snapshots
+        for path in sorted(self.snapshots_dir.iterdir()):
+            if path.name.startswith("."):
+                continue
+            try:
+                snapshots.append(json.loads((path / SNAPSHOT_METADATA_FILE).read_text()))
+            except (OSError, ValueError):
+                continue
+        return snapshots
+
+    def prune(self, retention: int = BACKUP_RETENTION):
+        """Drop snapshots beyond the retention count and upload objects no snapshot references"""
+        snapshots = self.list_snapshots()
+        for snapshot in snapshots[:-retention] if retention > 0 else []:
+            shutil.rmtree(self.snapshots_dir / snapshot["id"], ignore_errors=True)
+
+        referenced = set()
+        for snapshot in self.list_snapshots():
+            try:
+                manifest = json.loads((self.snapshots_dir / snapshot["id"] / UPLOADS_MANIFEST_FILE).read_text())
+            except (OSError, ValueError):
+                # Cannot tell what this snapshot needs, so keep every object
+                return
+            referenced.update(entry["sha256"] for entry in manifest.values())
+        if self.objects_dir.exists():
+            for object_path in self.objects_dir.glob("*/*"):
+                if object_path.name not in referenced:
+                    object_path.unlink(missing_ok=True)
+
+    def restore(self, snapshot_id: str, target_dir: Path) -> Dict[str, Any]:
+        """Restore a snapshot's databases and upload files into target_dir"""
+        snapshot_dir = self.snapshots_dir / snapshot_id
+        metadata = json.loads((snapshot_dir / SNAPSHOT_METADATA_FILE).read_text())
+        target_dir = Path(target_dir)
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        for name in metadata["databases"]:
+            shutil.copyfile(snapshot_dir / name, target_dir / name)
+
+        manifest = json.loads((snapshot_dir / UPLOADS_MANIFEST_FILE).read_text())
+        upload_target = target_dir / "uploads"
+        for relative, entry in manifest.items():
+            destination = upload_target / relative
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self._object_path(entry["sha256"]), destination)
+        return {"databases": list(metadata["databases"]), "upload_files": len(manifest)}
+
+    def verify(self, snapshot_id: Optional[str] = None) -> Dict[str, Any]:
+        """Restore a snapshot (the latest by default) into a temp dir and check it is usable"""
+        snapshots = self.list_snapshots()
+        if snapshot_id is None:
+            if not snapshots:
+                raise ValueError("No backups to verify")
+            snapshot_id = snapshots[-1]["id"]
+        started = time.perf_counter()
+        errors = []
+        tables = {}
+
+        with tempfile.TemporaryDirectory(prefix="backup_verify_") as tmp:
+            restored = self.restore(snapshot_id, Path(tmp))
+            for name in restored["databases"]:
+                connection = sqlite3.connect(str(Path(tmp) / name))
+                try:
+                    result = connection.execute("PRAGMA integrity_check").fetchone()[0]
+                    if result != "ok":
+                        errors.append(f"{name}: integrity_check returned {result}")
+                    table_names = [row[0] for row in connection.execute(
+                        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+                    )]
+                    tables[name] = {
+                        table: connection.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+                        for table in table_names
+                    }
+                except sqlite3.Error as e:
+                    errors.append(f"{name}: {str(e)}")
+                finally:
+                    connection.close()
+
+            manifest = json.loads((self.snapshots_dir / snapshot_id / UPLOADS_MANIFEST_FILE).read_text())
+            upload_root = Path(tmp) / "uploads"
+            for relative, entry in manifest.items():
+                if (upload_root / relative).stat().st_size != entry["size"]:
+                    errors.append(f"uploads/{relative}: size mismatch")
+            sample = random.sample(list(manifest.items()), min(BACKUP_VERIFY_SAMPLE_FILES, len(manifest)))
+            for relative, entry in sample:
+                if _sha256_file(upload_root / relative) != entry["sha256"]:
+                    errors.append(f"uploads/{relative}: hash mismatch")
+
+        result = {
+            "snapshot_id": snapshot_id,
+            "verified_at": datetime.utcnow().isoformat(),
+            "ok": not errors,
+            "errors": errors[:50],
+            "tables": tables,
+            "upload_files": len(manifest),
+            "hashed_upload_files": len(sample),
+            "duration_seconds": round(time.perf_counter() - started, 3)
+        }
+        self.last_verification = result
+        if errors:
+            logger.error(f"Backup {snapshot_id} failed verification: {errors[:5]}")
+        else:
+            logger.info(f"Backup {snapshot_id} verified in {result['duration_seconds']}s")
+        return result
+
+    def _run_scheduled_backup(self):
+        try:
+            self.run_backup()
+        except Exception as e:
+            logger.error(f"Scheduled backup failed: {str(e)}")
+
+    def _run_scheduled_verification(self):
+        try:
+            self.verify()
+        except Exception as e:
+            logger.error(f"Scheduled backup verification failed: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Recent backup and verification results for the admin endpoint"""
+        return {
+            "backup_dir": str(self.backup_dir),
+            "snapshots": [
+                {
+                    "id": snapshot["id"],
+                    "created_at": snapshot["created_at"],
+                    "duration_seconds": snapshot["duration_seconds"],
+                    "throughput_mb_per_second": snapshot["throughput_mb_per_second"]
+                }
+                for snapshot in self.list_snapshots()
+            ],
+            "last_backup": self.last_backup,
+            "last_verification": self.last_verification
+        }
+
+    def start(self):
+        """Schedule periodic backups and verification restores"""
+        self.scheduler.add_job(
+            func=self._run_scheduled_backup,
+            trigger=IntervalTrigger(hours=BACKUP_INTERVAL_HOURS),
+            id=self.job_id,
+            name="Back up databases and uploads",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
+        self.scheduler.add_job(
+            func=self._run_scheduled_verification,
+            trigger=IntervalTrigger(hours=BACKUP_VERIFY_INTERVAL_HOURS),
+            id=self.verify_job_id,
+            name="Verify latest backup",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
+        if not self.scheduler.running:
+            self.scheduler.start()
+            logger.info(f"Backup service started (every {BACKUP_INTERVAL_HOURS}h)")
+
+    def stop(self):
+        """Stop the backup jobs"""
+        if self.scheduler.running:
+            self.scheduler.shutdown()
+            logger.info("Backup service stopped")
+
+
+# Global backup service instance
+backup_service = BackupService()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Back up, verify and restore the CMS databases and uploads")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("backup", help="Take a snapshot now")
+    verify_parser = subparsers.add_parser("verify", help="Restore a snapshot into a temp dir and check it")
+    verify_parser.add_argument("snapshot_id", nargs="?")
+    subparsers.add_parser("list", help="List snapshots")
+    restore_parser = subparsers.add_parser("restore", help="Restore a snapshot into a directory")
+    restore_parser.add_argument("snapshot_id")
+    restore_parser.add_argument("target_dir")
+    args = parser.parse_args(argv)
+
+    if args.command == "backup":
+        result = backup_service.run_backup()
+    elif args.command == "verify":
+        result = backup_service.verify(args.snapshot_id)
+    elif args.command == "list":
+        result = backup_service.list_snapshots()
+    else:
+        result = backup_service.restore(args.snapshot_id, Path(args.target_dir))
+    print(json.dumps(result, indent=2))
+    return 0 if not isinstance(result, dict) or result.get("ok", True) else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
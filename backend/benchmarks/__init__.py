@@ -0,0 +1,13 @@
+"""
+API performance benchmarks.
+
+Generates a synthetic database at a configurable scale, drives the FastAPI app
+in-process through an ASGI client and writes JSON reports with throughput,
+latency percentiles and SQL statements per request for each endpoint. Two
+reports can be compared to catch regressions.
+
+Usage (from backend/):
+    python -m benchmarks generate --db /tmp/bench.db --articles 50000
+    python -m benchmarks run --db /tmp/bench.db --output report.json
+    python -m benchmarks compare baseline.json report.json
+"""
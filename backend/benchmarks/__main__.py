@@ -0,0 +1,134 @@
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+DEFAULT_DB_PATH = Path(tempfile.gettempdir()) / "blog_cms_benchmark.db"
+
+
+def _use_benchmark_database(db_path: Path):
+    """Point the app and its side stores at scratch locations; must run before the app modules are imported"""
+    scratch = Path(tempfile.mkdtemp(prefix="blog_cms_benchmark_"))
+    os.environ["BLOG_CMS_DB_PATH"] = str(db_path)
+    os.environ.setdefault("ANALYTICS_DB_PATH", str(scratch / "analytics.db"))
+    os.environ.setdefault("HOMEPAGE_SNAPSHOT_DIR", str(scratch / "snapshots"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="API performance benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = subparsers.add_parser("generate", help="Create a synthetic benchmark database")
+    generate_parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="Database file to create (replaced)")
+    generate_parser.add_argument("--articles", type=int, default=20000)
+    generate_parser.add_argument("--topics", type=int, default=200)
+    generate_parser.add_argument("--galleries", type=int, default=500)
+    generate_parser.add_argument("--releases", type=int, default=1000, help="Theater and OTT releases each")
+    generate_parser.add_argument("--seed", type=int, default=42)
+
+    run_parser = subparsers.add_parser("run", help="Benchmark the API against a generated database")
+    run_parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="Database created by 'generate'")
+    run_parser.add_argument("--requests", type=int, default=200, help="Measured requests per endpoint")
+    run_parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per endpoint")
+    run_parser.add_argument("--concurrency", type=int, default=1, help="Requests in flight per endpoint")
+    run_parser.add_argument("--endpoint", action="append", dest="endpoints", help="Only run this endpoint (repeatable)")
+    run_parser.add_argument("--output", default=None, help="Write the JSON report here")
+
+    serialization_parser = subparsers.add_parser(
+        "serialization", help="Compare JSON serialization paths for list responses (no database needed)")
+    serialization_parser.add_argument("--items", type=int, default=100, help="Items per response")
+    serialization_parser.add_argument("--iterations", type=int, default=200, help="Responses rendered per path")
+
+    startup_parser = subparsers.add_parser(
+        "startup", help="Measure cold import (python -X importtime) and time until the app is ready")
+    startup_parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="Database created by 'generate'")
+    startup_parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to measure")
+    startup_parser.add_argument("--output", default=None, help="Write the JSON report here")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two reports and flag regressions")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=None,
+                                help="Allowed latency growth as a fraction (default 0.2)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.command == "compare":
+        from benchmarks.runner import DEFAULT_REGRESSION_THRESHOLD, compare_reports
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.current, encoding="utf-8") as f:
+            current = json.load(f)
+        threshold = DEFAULT_REGRESSION_THRESHOLD if args.threshold is None else args.threshold
+        if "startup" in current:
+            from benchmarks.startup import compare_startup
+            rows = compare_startup(baseline, current, threshold)
+            for row in rows:
+                change = f"{row['change']:+.1%}" if row["change"] is not None else "n/a"
+                flag = "  REGRESSION: " + "; ".join(row["regressions"]) if row["regressions"] else ""
+                print(f"{row['metric']:12s} {row['values'][0]:9.1f}ms -> {row['values'][1]:9.1f}ms  {change:>8s}{flag}")
+            return 1 if any(row["regressions"] for row in rows) else 0
+        rows = compare_reports(baseline, current, threshold)
+        for row in rows:
+            p50 = f"{row['p50_change']:+.1%}" if row["p50_change"] is not None else "n/a"
+            p99 = f"{row['p99_change']:+.1%}" if row["p99_change"] is not None else "n/a"
+            flag = "  REGRESSION: " + "; ".join(row["regressions"]) if row["regressions"] else ""
+            print(f"{row['endpoint']:28s} p50 {p50:>8s}  p99 {p99:>8s}  "
+                  f"sql/req {row['sql_per_request'][0]} -> {row['sql_per_request'][1]}{flag}")
+        return 1 if any(row["regressions"] for row in rows) else 0
+
+    if args.command == "serialization":
+        from benchmarks.serialization import run_serialization_benchmark
+        print(f"Rendering List[ArticleListResponse] with {args.items} items")
+        for name, result in run_serialization_benchmark(args.items, args.iterations).items():
+            print(f"  {name:16s} {result['per_item_us']:8.2f} us/item  {result['per_response_ms']:8.3f} ms/response  "
+                  f"{result['speedup']:5.2f}x  {result['body_bytes']} bytes")
+        return 0
+
+    db_path = Path(args.db).resolve()
+    _use_benchmark_database(db_path)
+
+    if args.command == "generate":
+        from benchmarks.dataset import generate_dataset
+        from related_content_service import related_content
+        counts = generate_dataset(db_path, articles=args.articles, topics=args.topics,
+                                  galleries=args.galleries, releases=args.releases, seed=args.seed)
+        # Persist neighbour lists so runs start with the related content engine warm
+        related_content.rebuild()
+        print(json.dumps(counts, indent=2))
+        return 0
+
+    if not db_path.exists():
+        print(f"❌ {db_path} not found; create it with 'python -m benchmarks generate' first")
+        return 1
+    if args.command == "startup":
+        from benchmarks.runner import write_report
+        from benchmarks.startup import run_startup_benchmark
+        report = run_startup_benchmark(db_path, runs=args.runs)
+        startup = report["startup"]
+        for metric in ("import_ms", "process_ms", "ready_ms"):
+            print(f"  {metric:12s} median {startup[metric]['median']:8.1f}ms  "
+                  f"min {startup[metric]['min']:8.1f}ms  max {startup[metric]['max']:8.1f}ms")
+        print("  Slowest imports of server.py:")
+        for row in startup["top_imports"]:
+            print(f"    {row['median_ms']:8.1f}ms  {row['module']}")
+        if args.output:
+            write_report(report, args.output)
+            print(f"Report written to {args.output}")
+        return 0
+    from benchmarks.runner import run_benchmarks, write_report
+    print(f"Benchmarking against {db_path}")
+    report = run_benchmarks(db_path, requests=args.requests, warmup=args.warmup,
+                            concurrency=args.concurrency, only=args.endpoints)
+    if args.output:
+        write_report(report, args.output)
+        print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
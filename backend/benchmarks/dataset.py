@@ -0,0 +1,185 @@
+import json
+import random
+import sqlite3
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict
+
+from sqlalchemy import create_engine
+
+from database import Base
+import models  # noqa: F401  registers the tables on Base.metadata
+from crud import get_ott_platforms
+from seed_data import CATEGORIES
+
+# Approximate production mix: about half the articles are universal (states=null),
+# the rest are dominated by the two Telugu states
+STATE_MIX = [
+    (None, 0.45),
+    (["ap", "ts"], 0.22),
+    (["ap"], 0.11),
+    (["ts"], 0.11),
+    (["ka"], 0.03),
+    (["tn"], 0.03),
+    (["dl"], 0.02),
+    (["mh"], 0.02),
+    (["ka", "tn"], 0.01),
+]
+LANGUAGE_MIX = [("en", 0.6), ("te", 0.3), ("hi", 0.1)]
+CONTENT_TYPE_MIX = [("post", 0.7), ("video", 0.15), ("photo", 0.1), ("movie_review", 0.05)]
+TOPIC_CATEGORIES = ["Movies", "Politics", "Sports", "TV", "Travel"]
+RELEASE_LANGUAGES = ["Telugu", "Hindi", "Tamil", "English", "Malayalam", "Kannada"]
+WORDS = (
+    "election minister assembly cabinet budget cricket match wicket century trailer teaser box office "
+    "collection release theater ott review rating director hero heroine song music market sensex nifty "
+    "startup ai model launch fashion beauty travel temple beach festival hyderabad amaravati vizag "
+    "warangal tirupati delhi mumbai bengaluru chennai policy farmers water project metro airport"
+).split()
+
+DEFAULT_SCALE = {
+    "articles": 20000,
+    "topics": 200,
+    "galleries": 500,
+    "releases": 1000,
+}
+
+
+def _weighted(rng: random.Random, mix):
+    values, weights = zip(*mix)
+    return rng.choices(values, weights=weights, k=1)[0]
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(WORDS, k=words))
+
+
+def _timestamp(value: datetime) -> str:
+    return value.isoformat(sep=" ")
+
+
+def generate_dataset(db_path, articles: int = DEFAULT_SCALE["articles"], topics: int = DEFAULT_SCALE["topics"],
+                     galleries: int = DEFAULT_SCALE["galleries"], releases: int = DEFAULT_SCALE["releases"],
+                     seed: int = 42) -> Dict[str, int]:
+    """Create a fresh database at db_path filled with synthetic content and return row counts"""
+    db_path = Path(db_path)
+    db_path.unlink(missing_ok=True)
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+
+    rng = random.Random(seed)
+    now = datetime.utcnow().replace(microsecond=0)
+    today = date.today()
+    category_slugs = [category["slug"] for category in CATEGORIES]
+    started = time.perf_counter()
+
+    connection = sqlite3.connect(str(db_path), isolation_level=None)
+    try:
+        connection.execute("PRAGMA synchronous=OFF")
+        connection.execute("PRAGMA journal_mode=MEMORY")
+        connection.execute("BEGIN")
+
+        connection.executemany(
+            "INSERT INTO categories (name, slug, description, created_at) VALUES (?, ?, ?, ?)",
+            [(category["name"], category["slug"], category["description"], _timestamp(now))
+             for category in CATEGORIES]
+        )
+
+        article_rows = []
+        english_ids = []
+        for article_id in range(1, articles + 1):
+            language = _weighted(rng, LANGUAGE_MIX)
+            content_type = _weighted(rng, CONTENT_TYPE_MIX)
+            states = _weighted(rng, STATE_MIX)
+            title = _text(rng, rng.randint(6, 12)).title()
+            published = rng.random() < 0.95
+            scheduled = not published and rng.random() < 0.5
+            created_at = now - timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+            # Some Telugu and Hindi articles are translations of an English one
+            original_id = rng.choice(english_ids) if language != "en" and english_ids and rng.random() < 0.2 else None
+            if language == "en":
+                english_ids.append(article_id)
+            article_rows.append((
+                article_id, title, title[:40], f"synthetic-{article_id}", _text(rng, rng.randint(150, 600)),
+                _text(rng, 25), f"Reporter {rng.randint(1, 80)}", language,
+                json.dumps(states) if states else None, rng.choice(category_slugs), content_type,
+                f"https://cdn.example.com/images/{article_id}.jpg",
+                f"https://www.youtube.com/watch?v=vid{article_id}" if content_type == "video" else None,
+                ",".join(rng.sample(WORDS, 3)),
+                str(rng.choice([2.5, 3, 3.25, 3.5, 4, 4.5])) if content_type == "movie_review" else None,
+                int(rng.random() < 0.01), int(published), int(scheduled),
+                _timestamp(now + timedelta(hours=rng.randint(1, 72))) if scheduled else None,
+                original_id, rng.randint(0, 50000),
+                _timestamp(created_at), _timestamp(created_at), _timestamp(created_at) if published else None
+            ))
+        connection.executemany(
+            "INSERT INTO articles (id, title, short_title, slug, content, summary, author, language, states, "
+            "category, content_type, image, youtube_url, tags, movie_rating, is_featured, is_published, "
+            "is_scheduled, scheduled_publish_at, original_article_id, view_count, created_at, updated_at, "
+            "published_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            article_rows
+        )
+        del article_rows
+
+        connection.executemany(
+            "INSERT INTO topics (id, title, slug, description, category, language, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(topic_id, _text(rng, 3).title(), f"topic-{topic_id}", _text(rng, 20),
+              rng.choice(TOPIC_CATEGORIES), "en", _timestamp(now), _timestamp(now))
+             for topic_id in range(1, topics + 1)]
+        )
+        if topics:
+            connection.executemany(
+                "INSERT OR IGNORE INTO article_topics (article_id, topic_id) VALUES (?, ?)",
+                [(article_id, rng.randint(1, topics))
+                 for article_id in range(1, articles + 1) for _ in range(rng.randint(0, 3))]
+            )
+
+        connection.executemany(
+            "INSERT INTO galleries (id, gallery_id, title, artists, images, gallery_type, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(gallery_id, f"GAL-{gallery_id}", _text(rng, 4).title(), json.dumps([f"Artist {rng.randint(1, 100)}"]),
+              json.dumps([{"id": i, "name": f"{gallery_id}-{i}.jpg", "data": f"/uploads/galleries/{gallery_id}/{i}.jpg"}
+                          for i in range(rng.randint(5, 20))]),
+              rng.choice(["vertical", "horizontal"]), _timestamp(now), _timestamp(now))
+             for gallery_id in range(1, galleries + 1)]
+        )
+        if topics:
+            connection.executemany(
+                "INSERT OR IGNORE INTO gallery_topics (gallery_id, topic_id) VALUES (?, ?)",
+                [(gallery_id, rng.randint(1, topics)) for gallery_id in range(1, galleries + 1)]
+            )
+
+        # Releases cluster around today so the this-week and upcoming windows are populated
+        platforms = get_ott_platforms()
+        connection.executemany(
+            "INSERT INTO theater_releases (movie_name, movie_banner, language, release_date, created_by, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(_text(rng, 2).title(), _text(rng, 2).title(), rng.choice(RELEASE_LANGUAGES),
+              (today + timedelta(days=rng.randint(-90, 90))).isoformat(), "benchmark",
+              _timestamp(now), _timestamp(now))
+             for _ in range(releases)]
+        )
+        connection.executemany(
+            "INSERT INTO ott_releases (movie_name, ott_platform, language, release_date, created_by, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(_text(rng, 2).title(), rng.choice(platforms), rng.choice(RELEASE_LANGUAGES),
+              (today + timedelta(days=rng.randint(-90, 90))).isoformat(), "benchmark",
+              _timestamp(now), _timestamp(now))
+             for _ in range(releases)]
+        )
+
+        connection.execute("COMMIT")
+        connection.execute("ANALYZE")
+        connection.execute("PRAGMA journal_mode=DELETE")
+        counts = {
+            table: connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("categories", "articles", "article_topics", "topics", "galleries",
+                          "gallery_topics", "theater_releases", "ott_releases")
+        }
+    finally:
+        connection.close()
+
+    counts["seconds"] = round(time.perf_counter() - started, 2)
+    return counts
@@ -0,0 +1,244 @@
+import asyncio
+import json
+import platform
+import random
+import sqlite3
+import subprocess
+import time
+from collections import Counter
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+from sqlalchemy import event
+
+# (name, path template); placeholders are filled per request from the dataset
+ENDPOINTS = [
+    ("homepage", "/api/homepage?states={states}"),
+    ("categories", "/api/categories"),
+    ("articles", "/api/articles?limit=20"),
+    ("articles_by_category", "/api/articles/category/{category}?limit=20"),
+    ("section_latest_news", "/api/articles/sections/latest-news"),
+    ("section_politics", "/api/articles/sections/politics"),
+    ("section_movies", "/api/articles/sections/movies"),
+    ("section_sports", "/api/articles/sections/sports"),
+    ("section_trending_videos", "/api/articles/sections/trending-videos"),
+    ("article", "/api/articles/{article_id}"),
+    ("article_related", "/api/articles/{article_id}/related"),
+    ("article_related_videos", "/api/articles/{article_id}/related-videos"),
+    ("most_read", "/api/articles/most-read"),
+    ("trending", "/api/articles/trending"),
+    ("related_articles_page", "/api/related-articles/latest-news"),
+    ("theater_ott_releases", "/api/releases/theater-ott"),
+    ("release_calendar_month", "/api/releases/calendar/{year}/{month}"),
+    ("cms_config", "/api/cms/config"),
+    ("cms_articles", "/api/cms/articles?limit=20"),
+]
+STATE_COHORTS = ["all", "ap", "ts", "ap,ts", "ka"]
+# A regression is flagged when a latency percentile grows by more than this fraction
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+# ...and by at least this much, so sub-millisecond jitter is not reported
+REGRESSION_MIN_DELTA_MS = 1.0
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+class StatementCounter:
+    """Counts SQL statements issued through an engine"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+class PathSampler:
+    """Fills endpoint path templates with ids and values that exist in the dataset"""
+
+    def __init__(self, db_path: Path, seed: int = 7):
+        self.rng = random.Random(seed)
+        connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            self.article_ids = [row[0] for row in connection.execute(
+                "SELECT id FROM articles WHERE is_published = 1 ORDER BY id"
+            )]
+            self.categories = [row[0] for row in connection.execute("SELECT slug FROM categories")]
+        finally:
+            connection.close()
+        today = date.today()
+        self.values = {"year": today.year, "month": today.month}
+
+    def path(self, template: str) -> str:
+        if "{" not in template:
+            return template
+        return template.format(
+            states=self.rng.choice(STATE_COHORTS),
+            category=self.rng.choice(self.categories),
+            article_id=self.rng.choice(self.article_ids),
+            **self.values
+        )
+
+
+def dataset_counts(db_path: Path) -> Dict[str, int]:
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        return {
+            table: connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("articles", "topics", "galleries", "theater_releases", "ott_releases")
+        }
+    finally:
+        connection.close()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=Path(__file__).parent, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+async def _measure_endpoint(client: httpx.AsyncClient, sampler: PathSampler, counter: StatementCounter,
+                            template: str, requests: int, warmup: int, concurrency: int) -> Dict[str, Any]:
+    for _ in range(warmup):
+        await client.get(sampler.path(template))
+
+    latencies = []
+    status_codes = Counter()
+    paths = [sampler.path(template) for _ in range(requests)]
+    queue = iter(paths)
+
+    async def worker():
+        for path in queue:
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - started)
+            status_codes[response.status_code] += 1
+
+    statements_before = counter.count
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    statements = counter.count - statements_before
+
+    latencies.sort()
+    return {
+        "path": template,
+        "requests": requests,
+        "errors": sum(count for status, count in status_codes.items() if status >= 400),
+        "status_codes": {str(status): count for status, count in sorted(status_codes.items())},
+        "throughput_rps": round(requests / elapsed, 1) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 0.5) * 1000, 3),
+        "p90_ms": round(percentile(latencies, 0.9) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+        "sql_per_request": round(statements / requests, 2)
+    }
+
+
+async def _run(db_path: Path, requests: int, warmup: int, concurrency: int, endpoints) -> Dict[str, Dict[str, Any]]:
+    # Imported here so BLOG_CMS_DB_PATH is already pointing at the benchmark database
+    import server
+    from database import SessionLocal, engine, init_db
+    from reference_data import reference_data
+    from related_content_service import related_content
+
+    init_db()
+    db = SessionLocal()
+    try:
+        reference_data.refresh_categories(db)
+    finally:
+        db.close()
+    if not related_content.load():
+        related_content.rebuild()
+
+    sampler = PathSampler(db_path)
+    results = {}
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        with StatementCounter(engine) as counter:
+            for name, template in endpoints:
+                results[name] = await _measure_endpoint(
+                    client, sampler, counter, template, requests, warmup, concurrency
+                )
+                result = results[name]
+                print(f"  {name:28s} {result['throughput_rps']:9.1f} req/s  p50 {result['p50_ms']:8.2f}ms  "
+                      f"p99 {result['p99_ms']:8.2f}ms  sql/req {result['sql_per_request']:6.2f}"
+                      + (f"  errors {result['errors']}" if result["errors"] else ""))
+    return results
+
+
+def run_benchmarks(db_path, requests: int = 200, warmup: int = 20, concurrency: int = 1,
+                   only: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Benchmark every endpoint against the database at db_path and return the report"""
+    db_path = Path(db_path)
+    endpoints = [(name, template) for name, template in ENDPOINTS if not only or name in only]
+    results = asyncio.run(_run(db_path, requests, warmup, concurrency, endpoints))
+    return {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "dataset": dataset_counts(db_path),
+            "requests_per_endpoint": requests,
+            "warmup_per_endpoint": warmup,
+            "concurrency": concurrency
+        },
+        "endpoints": results
+    }
+
+
+def write_report(report: Dict[str, Any], path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> List[Dict[str, Any]]:
+    """Per-endpoint deltas between two reports; entries with regressions have a non-empty 'regressions' list"""
+    rows = []
+    for name, new in current["endpoints"].items():
+        old = baseline["endpoints"].get(name)
+        if old is None:
+            continue
+        regressions = []
+        for metric in ("p50_ms", "p99_ms"):
+            if (old[metric] > 0 and new[metric] > old[metric] * (1 + threshold)
+                    and new[metric] - old[metric] >= REGRESSION_MIN_DELTA_MS):
+                regressions.append(f"{metric} {old[metric]} -> {new[metric]}")
+        # Statement counts are deterministic, so any increase is a real change
+        if new["sql_per_request"] > old["sql_per_request"] + 0.01:
+            regressions.append(f"sql_per_request {old['sql_per_request']} -> {new['sql_per_request']}")
+        if new["errors"] > old["errors"]:
+            regressions.append(f"errors {old['errors']} -> {new['errors']}")
+        rows.append({
+            "endpoint": name,
+            "p50_change": round(new["p50_ms"] / old["p50_ms"] - 1, 3) if old["p50_ms"] else None,
+            "p99_change": round(new["p99_ms"] / old["p99_ms"] - 1, 3) if old["p99_ms"] else None,
+            "sql_per_request": [old["sql_per_request"], new["sql_per_request"]],
+            "regressions": regressions
+        })
+    return rows
@@ -0,0 +1,103 @@
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+import orjson
+from pydantic import TypeAdapter
+
+import schemas
+from benchmarks.dataset import CONTENT_TYPE_MIX, LANGUAGE_MIX, WORDS
+from json_responses import project
+from seed_data import CATEGORIES
+
+
+def _weighted(rng: random.Random, mix):
+    values, weights = zip(*mix)
+    return rng.choices(values, weights=weights)[0]
+
+
+def sample_list_items(count: int = 100, seed: int = 42) -> List[Dict[str, Any]]:
+    """List cards shaped like the handlers build them, including the extra keys the schema drops"""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    items = []
+    for i in range(count):
+        published_at = now - timedelta(minutes=rng.randint(0, 60 * 24 * 30))
+        images = [{"url": f"/uploads/galleries/{i + 1}/{n}.jpg"} for n in range(6)]
+        items.append({
+            "id": i + 1,
+            "title": " ".join(rng.choices(WORDS, k=10)).capitalize(),
+            "short_title": " ".join(rng.choices(WORDS, k=4)).capitalize(),
+            "summary": " ".join(rng.choices(WORDS, k=40)).capitalize() + ".",
+            "content": " ".join(rng.choices(WORDS, k=400)),
+            "slug": f"article-{i + 1}",
+            "image_url": f"/uploads/articles/{i + 1}.jpg",
+            "youtube_url": None,
+            "author": "Benchmark Desk",
+            "language": _weighted(rng, LANGUAGE_MIX),
+            "category": rng.choice(CATEGORIES)["slug"],
+            "content_type": _weighted(rng, CONTENT_TYPE_MIX),
+            "artists": None,
+            "states": '["ap", "ts"]' if rng.random() < 0.5 else None,
+            "gallery": {
+                "gallery_id": i + 1, "gallery_title": "Gallery", "images": images, "first_image": images[0]
+            } if rng.random() < 0.1 else None,
+            "is_published": True,
+            "is_scheduled": False,
+            "scheduled_publish_at": None,
+            "published_at": published_at,
+            "created_at": published_at,
+            "updated_at": published_at,
+            "view_count": rng.randint(0, 50000)
+        })
+    return items
+
+
+def run_serialization_benchmark(items: int = 100, iterations: int = 200) -> Dict[str, Dict[str, float]]:
+    """Per-item cost of rendering a List[ArticleListResponse] body along each serialization path"""
+    data = sample_list_items(items)
+    adapter = TypeAdapter(List[schemas.ArticleListResponse])
+
+    def validated_json() -> bytes:
+        # What FastAPI does for a response_model endpoint returning plain data
+        content = adapter.dump_python(adapter.validate_python(data), mode="json")
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+    def validated_orjson() -> bytes:
+        content = adapter.dump_python(adapter.validate_python(data), mode="json")
+        return orjson.dumps(content)
+
+    def trusted_orjson() -> bytes:
+        return orjson.dumps([project(item, schemas.ArticleListResponse) for item in data],
+                            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+    paths: Dict[str, Callable[[], bytes]] = {
+        "validate_json": validated_json,
+        "validate_orjson": validated_orjson,
+        "trusted_orjson": trusted_orjson,
+    }
+    # Every path has to produce the same document before its timing means anything
+    reference = json.loads(validated_json())
+    for name, render in paths.items():
+        if json.loads(render()) != reference:
+            raise AssertionError(f"{name} output differs from the validated response")
+
+    results = {}
+    for name, render in paths.items():
+        for _ in range(max(1, iterations // 10)):
+            render()
+        started = time.perf_counter()
+        for _ in range(iterations):
+            body = render()
+        elapsed = time.perf_counter() - started
+        results[name] = {
+            "per_response_ms": round(elapsed / iterations * 1000, 3),
+            "per_item_us": round(elapsed / iterations / items * 1_000_000, 2),
+            "body_bytes": len(body)
+        }
+    baseline = results["validate_json"]["per_item_us"]
+    for result in results.values():
+        result["speedup"] = round(baseline / result["per_item_us"], 2) if result["per_item_us"] else None
+    return results
@@ -0,0 +1,144 @@
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.runner import DEFAULT_REGRESSION_THRESHOLD, _git_commit
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+# A startup regression must also grow by at least this much, so interpreter jitter is not reported
+STARTUP_REGRESSION_MIN_DELTA_MS = 20.0
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$")
+
+# Imports the app, then runs its startup handlers and reports how long each phase took
+_READY_SCRIPT = """
+import json, time
+started = time.perf_counter()
+import server
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(server.app):
+    ready = time.perf_counter()
+print(json.dumps({"import_ms": (imported - started) * 1000, "ready_ms": (ready - started) * 1000}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Rows of `python -X importtime` output as dicts with self/cumulative microseconds and nesting depth"""
+    rows = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append({
+                "module": module,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": len(indent) // 2
+            })
+    return rows
+
+
+def _environment(db_path: Path, scratch: Path) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.update({
+        "BLOG_CMS_DB_PATH": str(db_path),
+        "ANALYTICS_DB_PATH": str(scratch / "analytics.db"),
+        "HOMEPAGE_SNAPSHOT_DIR": str(scratch / "snapshots"),
+        "PYTHONPATH": str(BACKEND_DIR),
+        # Startup must not depend on Mongo; the benchmark keeps it out of the picture entirely
+        "CREATE_DEFAULT_ADMIN": "false",
+    })
+    return env
+
+
+def _run(args: List[str], env: Dict[str, str]) -> subprocess.CompletedProcess:
+    completed = subprocess.run(args, cwd=BACKEND_DIR, env=env, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Startup benchmark subprocess failed:\n{completed.stderr[-2000:]}")
+    return completed
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+    return {
+        "median": round(statistics.median(values), 1),
+        "min": round(min(values), 1),
+        "max": round(max(values), 1)
+    }
+
+
+def run_startup_benchmark(db_path, runs: int = 5, top: int = 15) -> Dict[str, Any]:
+    """Measure cold `import server` (via -X importtime) and time-to-ready over fresh interpreters"""
+    db_path = Path(db_path)
+    scratch = Path(tempfile.mkdtemp(prefix="blog_cms_startup_"))
+    env = _environment(db_path, scratch)
+
+    import_times, wall_times, ready_times = [], [], []
+    modules: Dict[str, List[int]] = {}
+    for _ in range(runs):
+        started = time.perf_counter()
+        completed = _run([sys.executable, "-X", "importtime", "-c", "import server"], env)
+        wall_times.append((time.perf_counter() - started) * 1000)
+        rows = parse_importtime(completed.stderr)
+        server_row = next(row for row in reversed(rows) if row["module"] == "server")
+        import_times.append(server_row["cumulative_us"] / 1000)
+        # Direct imports of server.py, plus server's own module body
+        for row in rows:
+            if row["depth"] == 1 or row is server_row:
+                modules.setdefault(row["module"], []).append(
+                    row["self_us"] if row is server_row else row["cumulative_us"]
+                )
+
+        completed = _run([sys.executable, "-c", _READY_SCRIPT], env)
+        ready_times.append(json.loads(completed.stdout.strip().splitlines()[-1])["ready_ms"])
+
+    top_imports = sorted(
+        ({"module": "server (module body)" if module == "server" else module,
+          "median_ms": round(statistics.median(values) / 1000, 1)} for module, values in modules.items()),
+        key=lambda row: row["median_ms"], reverse=True
+    )[:top]
+    return {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": runs
+        },
+        "startup": {
+            "import_ms": _summary(import_times),
+            "process_ms": _summary(wall_times),
+            "ready_ms": _summary(ready_times),
+            "top_imports": top_imports
+        }
+    }
+
+
+def compare_startup(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = DEFAULT_REGRESSION_THRESHOLD) -> List[Dict[str, Any]]:
+    """Median deltas between two startup reports; rows with regressions have a non-empty 'regressions' list"""
+    rows = []
+    for metric in ("import_ms", "process_ms", "ready_ms"):
+        old = baseline["startup"].get(metric, {}).get("median")
+        new = current["startup"].get(metric, {}).get("median")
+        if old is None or new is None:
+            continue
+        regressions = []
+        if old > 0 and new > old * (1 + threshold) and new - old >= STARTUP_REGRESSION_MIN_DELTA_MS:
+            regressions.append(f"{metric} {old} -> {new}")
+        rows.append({
+            "metric": metric,
+            "change": round(new / old - 1, 3) if old else None,
+            "values": [old, new],
+            "regressions": regressions
+        })
+    return rows
+
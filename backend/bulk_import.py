@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Bulk loader for database exports.
+
+Loads a directory written by database_export.py into a SQLite database as fast
+as SQLite allows: secondary indexes and triggers are dropped for the duration
+of the load, rows are inserted with executemany in large transactions with
+PRAGMA synchronous=OFF, and indexes, triggers and planner statistics (ANALYZE)
+are rebuilt once at the end. NDJSON files are preferred; SQL files are
+streamed statement by statement when that is all the export contains.
+
+Usage:
+    python bulk_import.py load --export-dir ../database_export --db blog_cms.db
+    python bulk_import.py benchmark --articles 1000000
+"""
+
+import argparse
+import gzip
+import json
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from itertools import chain, islice
+from pathlib import Path
+
+from database_export import (
+    DEFAULT_OUTPUT_DIR, INDEXES_FILE, MANIFEST_FILE, SCHEMA_FILE,
+    list_tables, quote_identifier, write_schema
+)
+
+ROOT_DIR = Path(__file__).parent
+DEFAULT_DB_PATH = ROOT_DIR / "blog_cms.db"
+DEFAULT_BATCH_SIZE = 5000
+# Rows per transaction; large transactions amortize the commit cost
+DEFAULT_TRANSACTION_ROWS = 250000
+
+
+def iter_sql_statements(lines):
+    """Yield complete SQL statements from an iterable of lines"""
+    statement = ""
+    for line in lines:
+        statement += line
+        if sqlite3.complete_statement(statement):
+            yield statement
+            statement = ""
+
+
+def _execute_ddl(connection: sqlite3.Connection, statements):
+    """Run DDL statements, skipping objects that already exist"""
+    for statement in statements:
+        try:
+            connection.execute(statement)
+        except sqlite3.OperationalError as e:
+            if "already exists" not in str(e):
+                raise
+
+
+def _drop_secondary_objects(connection: sqlite3.Connection, tables):
+    """Drop indexes and triggers on the given tables and return the SQL to recreate them"""
+    placeholders = ", ".join("?" for _ in tables)
+    rows = connection.execute(
+        f"SELECT type, name, sql FROM sqlite_master WHERE type IN ('index', 'trigger') "
+        f"AND sql IS NOT NULL AND tbl_name IN ({placeholders})",
+        list(tables)
+    ).fetchall()
+    indexes, triggers = [], []
+    for object_type, name, sql in rows:
+        connection.execute(f"DROP {object_type.upper()} {quote_identifier(name)}")
+        (indexes if object_type == "index" else triggers).append(sql)
+    return indexes, triggers
+
+
+def _blob_columns(connection: sqlite3.Connection, table: str):
+    return {row[1] for row in connection.execute(f"PRAGMA table_info({quote_identifier(table)})")
+            if "BLOB" in (row[2] or "").upper()}
+
+
+def _load_ndjson(connection: sqlite3.Connection, table: str, path: Path,
+                 batch_size: int, transaction_rows: int) -> int:
+    blob_columns = _blob_columns(connection, table)
+    loaded = 0
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        first_line = f.readline()
+        if not first_line.strip():
+            return 0
+        # Every line of an export has the same keys, in table column order
+        columns = list(json.loads(first_line))
+        column_list = ", ".join(quote_identifier(column) for column in columns)
+        insert = (f"INSERT INTO {quote_identifier(table)} ({column_list}) "
+                  f"VALUES ({', '.join('?' for _ in columns)})")
+        blob_positions = [i for i, column in enumerate(columns) if column in blob_columns]
+
+        def rows():
+            for line in chain([first_line], f):
+                if not line.strip():
+                    continue
+                values = list(json.loads(line).values())
+                for i in blob_positions:
+                    if values[i] is not None:
+                        values[i] = bytes.fromhex(values[i])
+                yield values
+
+        row_iter = rows()
+        connection.execute("BEGIN")
+        in_transaction = 0
+        while True:
+            batch = list(islice(row_iter, batch_size))
+            if not batch:
+                break
+            connection.executemany(insert, batch)
+            loaded += len(batch)
+            in_transaction += len(batch)
+            if in_transaction >= transaction_rows:
+                connection.execute("COMMIT")
+                connection.execute("BEGIN")
+                in_transaction = 0
+        connection.execute("COMMIT")
+    return loaded
+
+
+def _load_sql(connection: sqlite3.Connection, path: Path, transaction_rows: int) -> int:
+    loaded = 0
+    connection.execute("BEGIN")
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for statement in iter_sql_statements(f):
+            keyword = statement.strip().rstrip(";").strip().upper()
+            # The file's own per-segment transactions are replaced by larger ones
+            if keyword in ("BEGIN TRANSACTION", "BEGIN", "COMMIT"):
+                continue
+            connection.execute(statement)
+            loaded += 1
+            if loaded % transaction_rows == 0:
+                connection.execute("COMMIT")
+                connection.execute("BEGIN")
+    connection.execute("COMMIT")
+    return loaded
+
+
+def bulk_load(export_dir=DEFAULT_OUTPUT_DIR, db_path=DEFAULT_DB_PATH, fmt: str = None,
+              batch_size: int = DEFAULT_BATCH_SIZE, transaction_rows: int = DEFAULT_TRANSACTION_ROWS,
+              tables=None, log=print) -> dict:
+    """Load an export into db_path and return per-table row counts and timings"""
+    export_dir = Path(export_dir)
+    with open(export_dir / MANIFEST_FILE, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    fmt = fmt or ("ndjson" if "ndjson" in manifest["formats"] else "sql")
+    if fmt not in manifest["formats"]:
+        raise ValueError(f"The export does not contain {fmt} files")
+    table_order = [table for table in manifest["table_order"] if not tables or table in tables]
+
+    started = time.perf_counter()
+    connection = sqlite3.connect(str(db_path), isolation_level=None)
+    try:
+        # Durability is pointless mid-load: a failed load is simply rerun
+        connection.execute("PRAGMA synchronous=OFF")
+        connection.execute("PRAGMA journal_mode=MEMORY")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute("PRAGMA cache_size=-262144")
+        connection.execute("PRAGMA foreign_keys=OFF")
+
+        with open(export_dir / manifest.get("schema", SCHEMA_FILE), "r", encoding="utf-8") as f:
+            _execute_ddl(connection, iter_sql_statements(f))
+        existing_indexes, triggers = _drop_secondary_objects(connection, table_order)
+
+        results = {}
+        for table in table_order:
+            table_started = time.perf_counter()
+            path = export_dir / manifest["tables"][table]["files"][fmt]
+            if fmt == "ndjson":
+                rows = _load_ndjson(connection, table, path, batch_size, transaction_rows)
+            else:
+                rows = _load_sql(connection, path, transaction_rows)
+            seconds = time.perf_counter() - table_started
+            results[table] = {"rows": rows, "seconds": round(seconds, 3)}
+            log(f"   {table}: {rows} records loaded in {seconds:.2f}s")
+
+        index_started = time.perf_counter()
+        _execute_ddl(connection, existing_indexes)
+        with open(export_dir / manifest.get("indexes", INDEXES_FILE), "r", encoding="utf-8") as f:
+            _execute_ddl(connection, iter_sql_statements(f))
+        _execute_ddl(connection, triggers)
+        index_seconds = time.perf_counter() - index_started
+        log(f"   indexes and triggers rebuilt in {index_seconds:.2f}s")
+
+        connection.execute("ANALYZE")
+        connection.execute("PRAGMA synchronous=FULL")
+        connection.execute("PRAGMA journal_mode=DELETE")
+    finally:
+        connection.close()
+
+    total_rows = sum(result["rows"] for result in results.values())
+    seconds = time.perf_counter() - started
+    return {
+        "format": fmt,
+        "total_records": total_rows,
+        "seconds": round(seconds, 3),
+        "index_seconds": round(index_seconds, 3),
+        "rows_per_second": round(total_rows / seconds) if seconds > 0 else 0,
+        "tables": results
+    }
+
+
+def _synthetic_article(article_id: int, now: datetime) -> dict:
+    created_at = now - timedelta(minutes=article_id)
+    words = random.choices(("movie", "review", "box", "office", "election", "cricket", "market", "trailer",
+                            "telangana", "andhra", "release", "ott", "song", "stock", "ai", "news"), k=12)
+    return {
+        "id": article_id,
+        "title": " ".join(words[:8]).title(),
+        "short_title": " ".join(words[:4]).title(),
+        "slug": f"article-{article_id}",
+        "content": " ".join(words * 20),
+        "summary": " ".join(words),
+        "author": f"Author {article_id % 50}",
+        "language": random.choice(("en", "te", "hi")),
+        "states": '["ap", "ts"]' if article_id % 3 else '["all"]',
+        "category": random.choice(("latest-news", "politics", "movies", "sports", "stock-market", "ai")),
+        "content_type": "post",
+        "is_featured": int(article_id % 97 == 0),
+        "is_published": 1,
+        "is_scheduled": 0,
+        "view_count": random.randint(0, 10000),
+        "created_at": created_at.isoformat(sep=" "),
+        "updated_at": created_at.isoformat(sep=" "),
+        "published_at": created_at.isoformat(sep=" "),
+    }
+
+
+def write_synthetic_export(output_dir: Path, articles: int) -> dict:
+    """Write an export containing the full schema and `articles` synthetic articles"""
+    from sqlalchemy import create_engine
+    from database import Base
+    import models  # noqa: F401  registers the tables on Base.metadata
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    schema_db = output_dir / "schema.db"
+    engine = create_engine(f"sqlite:///{schema_db}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    connection = sqlite3.connect(str(schema_db))
+    try:
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(articles)")]
+        write_schema(connection, output_dir, list_tables(connection))
+    finally:
+        connection.close()
+    schema_db.unlink()
+
+    now = datetime.utcnow()
+    column_list = ", ".join(quote_identifier(column) for column in columns)
+    with gzip.open(output_dir / "articles.ndjson.gz", "wt", encoding="utf-8", compresslevel=1) as ndjson_file, \
+            gzip.open(output_dir / "articles.sql.gz", "wt", encoding="utf-8", compresslevel=1) as sql_file:
+        sql_file.write("BEGIN TRANSACTION;\n")
+        for article_id in range(1, articles + 1):
+            article = _synthetic_article(article_id, now)
+            values = [article.get(column) for column in columns]
+            ndjson_file.write(json.dumps(dict(zip(columns, values))) + "\n")
+            sql_values = ", ".join("NULL" if value is None else repr(value) if isinstance(value, int)
+                                   else "'" + value.replace("'", "''") + "'" for value in values)
+            sql_file.write(f"INSERT INTO articles ({column_list}) VALUES ({sql_values});\n")
+        sql_file.write("COMMIT;\n")
+
+    manifest = {
+        "export_timestamp": now.isoformat(),
+        "formats": ["ndjson", "sql"],
+        "schema": SCHEMA_FILE,
+        "indexes": INDEXES_FILE,
+        "table_order": ["articles"],
+        "total_tables": 1,
+        "total_records": articles,
+        "tables": {"articles": {"table": "articles", "rows": articles,
+                                "files": {"ndjson": "articles.ndjson.gz", "sql": "articles.sql.gz"}}}
+    }
+    with open(output_dir / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def run_benchmark(articles: int, formats=("ndjson", "sql"), work_dir: str = None) -> dict:
+    """Time loading `articles` synthetic articles from each export format into a fresh database"""
+    with tempfile.TemporaryDirectory(prefix="bulk_import_bench_", dir=work_dir) as tmp:
+        tmp = Path(tmp)
+        generate_started = time.perf_counter()
+        write_synthetic_export(tmp / "export", articles)
+        print(f"Generated {articles} synthetic articles in {time.perf_counter() - generate_started:.1f}s")
+
+        results = {"articles": articles}
+        for fmt in formats:
+            db_path = tmp / f"{fmt}.db"
+            result = bulk_load(tmp / "export", db_path, fmt=fmt, log=lambda message: None)
+            connection = sqlite3.connect(str(db_path))
+            try:
+                loaded = connection.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+            finally:
+                connection.close()
+            results[fmt] = {
+                "seconds": result["seconds"],
+                "index_seconds": result["index_seconds"],
+                "rows_per_second": result["rows_per_second"],
+                "rows_loaded": loaded,
+                "db_bytes": db_path.stat().st_size
+            }
+            print(f"{fmt}: {loaded} articles in {result['seconds']:.1f}s "
+                  f"({result['rows_per_second']} rows/s, indexes {result['index_seconds']:.1f}s)")
+        return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk load a database export, or benchmark the loader")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    load_parser = subparsers.add_parser("load", help="Load an export into a database")
+    load_parser.add_argument("--export-dir", default=str(DEFAULT_OUTPUT_DIR), help="Directory written by database_export.py")
+    load_parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="SQLite database to load into")
+    load_parser.add_argument("--format", choices=("ndjson", "sql"), default=None, help="Export format to read")
+    load_parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per executemany call")
+    load_parser.add_argument("--transaction-rows", type=int, default=DEFAULT_TRANSACTION_ROWS, help="Rows per transaction")
+    load_parser.add_argument("--table", action="append", dest="tables", help="Only load this table (repeatable)")
+    benchmark_parser = subparsers.add_parser("benchmark", help="Load synthetic articles into a scratch database")
+    benchmark_parser.add_argument("--articles", type=int, default=1000000, help="Synthetic articles to load")
+    benchmark_parser.add_argument("--format", action="append", choices=("ndjson", "sql"), dest="formats",
+                                  help="Formats to time (repeatable, default: both)")
+    benchmark_parser.add_argument("--work-dir", default=None, help="Where to put the scratch files")
+    args = parser.parse_args(argv)
+
+    if args.command == "benchmark":
+        results = run_benchmark(args.articles, tuple(args.formats or ("ndjson", "sql")), args.work_dir)
+        print(json.dumps(results, indent=2))
+        return 0
+
+    try:
+        result = bulk_load(args.export_dir, args.db, fmt=args.format, batch_size=args.batch_size,
+                           transaction_rows=args.transaction_rows, tables=args.tables)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    print(f"✅ Loaded {result['total_records']} records in {result['seconds']}s "
+          f"({result['rows_per_second']} rows/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
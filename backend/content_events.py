@@ -0,0 +1,39 @@
+import logging
+from typing import Callable, Iterable, List, Set
+
+logger = logging.getLogger(__name__)
+
+# Pseudo-categories for content that is not an article category
+THEATER_RELEASES = "theater-releases"
+OTT_RELEASES = "ott-releases"
+
+_subscribers: List[Callable[[Set[str]], None]] = []
+_article_subscribers: List[Callable[[Set[int]], None]] = []
+
+
+def subscribe(callback: Callable[[Set[str]], None]):
+    """Register a callback invoked with the set of category slugs touched by a content write"""
+    _subscribers.append(callback)
+
+
+def subscribe_articles(callback: Callable[[Set[int]], None]):
+    """Register a callback invoked with the ids of articles created, updated, published or deleted"""
+    _article_subscribers.append(callback)
+
+
+def _dispatch(subscribers: list, payload: set):
+    for callback in subscribers:
+        try:
+            callback(payload)
+        except Exception as e:
+            logger.error(f"Content change subscriber {callback} failed: {str(e)}")
+
+
+def notify_content_changed(categories: Iterable[str], article_ids: Iterable[int] = ()):
+    """Tell caches and derived outputs that content in these categories (and these articles) changed"""
+    touched = {category for category in categories if category}
+    if touched:
+        _dispatch(_subscribers, touched)
+    changed_articles = {article_id for article_id in article_ids if article_id}
+    if changed_articles:
+        _dispatch(_article_subscribers, changed_articles)
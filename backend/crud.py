@@ -1,9 +1,15 @@
 from sqlalchemy.orm import Session
 import models, schemas
-from typing import List, Optional
-from sqlalchemy import desc, and_, or_
-from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import desc, and_, or_, case, func, select, union_all, literal, null
+from datetime import datetime, timedelta, time as dt_time
+from pytz import timezone
 import json
+import threading
+import time
+import metrics
+from reference_data import reference_data, state_code_for
+from content_events import notify_content_changed, subscribe, THEATER_RELEASES, OTT_RELEASES
 
 # Category CRUD operations
 def get_category(db: Session, category_id: int):
@@ -28,6 +34,8 @@ def create_category(db: Session, category: schemas.CategoryCreate):
     db.add(db_category)
     db.commit()
     db.refresh(db_category)
+    # Categories are cached in the reference data registry
+    reference_data.refresh_categories(db)
     return db_category
 
 # Article CRUD operations
@@ -91,11 +99,54 @@ def get_articles_by_states(db: Session, category_slug: str, state_codes: List[st
 def get_most_read_articles(db: Session, limit: int = 100):
     return db.query(models.Article).order_by(desc(models.Article.view_count)).limit(limit).all()
 
+def get_articles_by_ids(db: Session, article_ids: List[int], published_only: bool = True):
+    """Get articles by id in a single query, preserving the order of article_ids"""
+    if not article_ids:
+        return []
+    query = db.query(models.Article).filter(models.Article.id.in_(article_ids))
+    if published_only:
+        query = query.filter(models.Article.is_published == True)
+    articles_by_id = {article.id: article for article in query.all()}
+    return [articles_by_id[article_id] for article_id in article_ids if article_id in articles_by_id]
+
+def get_language_variants(db: Session, article_ids: List[int], language: str) -> Dict[int, models.Article]:
+    """Published translations of the given articles into one language, keyed by original article id"""
+    if not article_ids:
+        return {}
+    variants = db.query(models.Article).filter(
+        models.Article.original_article_id.in_(set(article_ids)),
+        models.Article.language == language,
+        models.Article.is_published == True
+    ).all()
+    return {article.original_article_id: article for article in variants}
+
+def resolve_language_variants(db: Session, language: Optional[str], *article_lists: List[models.Article]) -> List[List[models.Article]]:
+    """Swap each article for its published translation into language, keeping the original where there is none.
+
+    All the lists are resolved with a single query, so a response with several tabs costs one extra query.
+    A translation that was already listed next to its original appears only once.
+    """
+    if not language or language == "en":
+        return [list(articles) for articles in article_lists]
+    article_ids = [article.id for articles in article_lists for article in articles if article.language != language]
+    variants = get_language_variants(db, article_ids, language)
+    resolved = []
+    for articles in article_lists:
+        seen = set()
+        resolved.append([])
+        for article in articles:
+            article = variants.get(article.id, article)
+            if article.id not in seen:
+                seen.add(article.id)
+                resolved[-1].append(article)
+    return resolved
+
 def create_article(db: Session, article: schemas.ArticleCreate):
     db_article = models.Article(**article.dict())
     db.add(db_article)
     db.commit()
     db.refresh(db_article)
+    notify_content_changed([db_article.category], article_ids=[db_article.id])
     return db_article
 
 # Movie Review CRUD operations
@@ -134,44 +185,7 @@ def get_articles_for_cms(db: Session, language: str = "en", skip: int = 0, limit
         query = query.filter(models.Article.category == category)
     
     if state:
-        # Map display state names to database state codes (31 states - AP & Telangana split)
-        state_code_map = {
-            'Andhra Pradesh': 'ap',
-            'Arunachal Pradesh': 'ar',
-            'Assam': 'as',
-            'Bihar': 'br',
-            'Chhattisgarh': 'cg',
-            'Delhi': 'dl',
-            'Goa': 'ga',
-            'Gujarat': 'gj',
-            'Haryana': 'hr',
-            'Himachal Pradesh': 'hp',
-            'Jammu and Kashmir': 'jk',
-            'Jharkhand': 'jh',
-            'Karnataka': 'ka',
-            'Kerala': 'kl',
-            'Ladakh': 'ld',
-            'Madhya Pradesh': 'mp',
-            'Maharashtra': 'mh',
-            'Manipur': 'mn',
-            'Meghalaya': 'ml',
-            'Mizoram': 'mz',
-            'Nagaland': 'nl',
-            'Odisha': 'or',
-            'Punjab': 'pb',
-            'Rajasthan': 'rj',
-            'Sikkim': 'sk',
-            'Tamil Nadu': 'tn',
-            'Telangana': 'ts',
-            'Tripura': 'tr',
-            'Uttar Pradesh': 'up',
-            'Uttarakhand': 'uk',
-            'West Bengal': 'wb',
-            # Legacy support for existing articles
-            'AP & Telangana': 'ap_ts'
-        }
-        
-        state_code = state_code_map.get(state, state.lower())
+        state_code = state_code_for(state)
         
         # Filter articles where states field contains the state code
         query = query.filter(
@@ -223,11 +237,13 @@ def create_article_cms(db: Session, article: schemas.ArticleCreate, slug: str, s
     db.add(db_article)
     db.commit()
     db.refresh(db_article)
+    notify_content_changed([db_article.category], article_ids=[db_article.id])
     return db_article
 
 def update_article_cms(db: Session, article_id: int, article_update: schemas.ArticleUpdate):
     """Update article via CMS"""
     db_article = db.query(models.Article).filter(models.Article.id == article_id).first()
+    previous_category = db_article.category
     
     update_data = article_update.dict(exclude_unset=True)
     
@@ -250,27 +266,42 @@ def update_article_cms(db: Session, article_id: int, article_update: schemas.Art
     
     db.commit()
     db.refresh(db_article)
+    notify_content_changed([previous_category, db_article.category], article_ids=[article_id])
     return db_article
 
 def delete_article(db: Session, article_id: int):
     """Delete article"""
     db_article = db.query(models.Article).filter(models.Article.id == article_id).first()
+    association = models.article_related_videos
+    db.execute(association.delete().where(
+        or_(association.c.article_id == article_id, association.c.video_id == article_id)
+    ))
     db.delete(db_article)
     db.commit()
+    notify_content_changed([db_article.category], article_ids=[article_id])
     return db_article
 
-def create_translated_article(db: Session, original_article: models.Article, target_language: str):
-    """Create translated version of article"""
+# Article fields a translator rewrites; everything else is copied from the original
+TRANSLATABLE_FIELDS = ("title", "short_title", "summary", "content", "seo_title", "seo_description")
+
+def create_translated_article(db: Session, original_article: models.Article, target_language: str,
+                              translations: Optional[Dict[str, str]] = None):
+    """Create translated version of article from translated field values (placeholder copy when none are given)"""
     # Generate new slug with language suffix
     original_slug = original_article.slug
     new_slug = f"{original_slug}-{target_language}"
+    fields = {field: getattr(original_article, field) for field in TRANSLATABLE_FIELDS}
+    if translations is None:
+        fields["title"] = f"[{target_language.upper()}] {original_article.title}"  # Placeholder for actual translation
+    else:
+        fields.update(translations)
     
     translated_article = models.Article(
-        title=f"[{target_language.upper()}] {original_article.title}",  # Placeholder for actual translation
-        short_title=original_article.short_title,
+        title=fields["title"],
+        short_title=fields["short_title"],
         slug=new_slug,
-        content=original_article.content,  # This would be translated by translation service
-        summary=original_article.summary,  # This would be translated by translation service
+        content=fields["content"],
+        summary=fields["summary"],
         author=original_article.author,
         language=target_language,
         states=original_article.states,
@@ -281,8 +312,8 @@ def create_translated_article(db: Session, original_article: models.Article, tar
         is_featured=original_article.is_featured,
         is_published=False,  # Set as draft initially
         original_article_id=original_article.id,
-        seo_title=original_article.seo_title,
-        seo_description=original_article.seo_description,
+        seo_title=fields["seo_title"],
+        seo_description=fields["seo_description"],
         seo_keywords=original_article.seo_keywords
     )
     
@@ -295,6 +326,54 @@ def get_article_by_id(db: Session, article_id: int):
     """Get article by ID for CMS"""
     return db.query(models.Article).filter(models.Article.id == article_id).first()
 
+# Related videos CRUD operations
+MAX_RELATED_VIDEOS = 20
+
+def get_video_flags(db: Session, article_ids: List[int]) -> dict:
+    """Map each existing article id to whether it is a video article, in one query"""
+    if not article_ids:
+        return {}
+    rows = db.query(models.Article.id, models.Article.youtube_url).filter(
+        models.Article.id.in_(set(article_ids))
+    ).all()
+    return {article_id: bool(youtube_url) for article_id, youtube_url in rows}
+
+def get_related_videos_for_articles(db: Session, article_ids: List[int], published_only: bool = True) -> dict:
+    """Curated related videos for several articles in one query: {article_id: [video articles in order]}"""
+    if not article_ids:
+        return {}
+    association = models.article_related_videos
+    query = db.query(association.c.article_id, models.Article).join(
+        models.Article, models.Article.id == association.c.video_id
+    ).filter(association.c.article_id.in_(set(article_ids)))
+    if published_only:
+        query = query.filter(models.Article.is_published == True)
+    rows = query.order_by(association.c.article_id, association.c.position).all()
+    related = {article_id: [] for article_id in article_ids}
+    for article_id, video in rows:
+        related[article_id].append(video)
+    return related
+
+def get_related_video_ids(db: Session, article_id: int) -> List[int]:
+    """Curated related video ids for an article in display order, including unpublished ones"""
+    association = models.article_related_videos
+    rows = db.query(association.c.video_id).filter(
+        association.c.article_id == article_id
+    ).order_by(association.c.position).all()
+    return [video_id for video_id, in rows]
+
+def set_article_related_videos(db: Session, article_id: int, video_ids: List[int]):
+    """Replace an article's curated related videos, keeping the given order"""
+    association = models.article_related_videos
+    db.execute(association.delete().where(association.c.article_id == article_id))
+    if video_ids:
+        db.execute(association.insert(), [
+            {"article_id": article_id, "video_id": video_id, "position": position}
+            for position, video_id in enumerate(video_ids)
+        ])
+    db.commit()
+    return video_ids
+
 # Scheduler CRUD operations
 def get_scheduler_settings(db: Session):
     """Get scheduler settings"""
@@ -350,9 +429,49 @@ def publish_scheduled_article(db: Session, article_id: int):
         db_article.published_at = datetime.utcnow()
         db.commit()
         db.refresh(db_article)
+        notify_content_changed([db_article.category], article_ids=[article_id])
     return db_article
 
 # Related Articles Configuration CRUD operations
+
+# Parsed configs keyed by page slug: {'categories': [...], 'articleCount': n}.
+# Loaded in one query on first use and dropped whenever a config is written.
+_related_config_cache = None
+_related_config_lock = threading.Lock()
+_related_config_generation = 0
+
+def _parse_related_categories(config) -> list:
+    try:
+        return json.loads(config.categories) if config.categories else []
+    except json.JSONDecodeError:
+        return []
+
+def _invalidate_related_articles_configs():
+    global _related_config_cache, _related_config_generation
+    with _related_config_lock:
+        _related_config_generation += 1
+        _related_config_cache = None
+
+def get_parsed_related_articles_configs(db: Session) -> dict:
+    """All related articles configurations with their categories already parsed"""
+    global _related_config_cache
+    configs = _related_config_cache
+    metrics.cache_lookup("related_articles_config", configs is not None)
+    if configs is None:
+        generation = _related_config_generation
+        configs = {
+            config.page_slug: {
+                'categories': _parse_related_categories(config),
+                'articleCount': config.article_count
+            }
+            for config in db.query(models.RelatedArticlesConfig).all()
+        }
+        with _related_config_lock:
+            # Skip caching if a config was written while we were querying
+            if generation == _related_config_generation:
+                _related_config_cache = configs
+    return configs
+
 def get_related_articles_config(db: Session, page_slug: str = None):
     """Get related articles configuration for a specific page or all pages"""
     if page_slug:
@@ -361,19 +480,10 @@ def get_related_articles_config(db: Session, page_slug: str = None):
         ).first()
     else:
         # Return all configurations as a dictionary
-        configs = db.query(models.RelatedArticlesConfig).all()
-        result = {}
-        for config in configs:
-            try:
-                categories = json.loads(config.categories) if config.categories else []
-            except json.JSONDecodeError:
-                categories = []
-            
-            result[config.page_slug] = {
-                'categories': categories,
-                'articleCount': config.article_count
-            }
-        return result
+        return {
+            slug: {'categories': list(config['categories']), 'articleCount': config['articleCount']}
+            for slug, config in get_parsed_related_articles_configs(db).items()
+        }
 
 def create_or_update_related_articles_config(db: Session, config_data: schemas.RelatedArticlesConfigCreate):
     """Create or update related articles configuration"""
@@ -391,6 +501,7 @@ def create_or_update_related_articles_config(db: Session, config_data: schemas.R
         existing_config.updated_at = datetime.utcnow()
         db.commit()
         db.refresh(existing_config)
+        _invalidate_related_articles_configs()
         return existing_config
     else:
         # Create new configuration
@@ -402,6 +513,7 @@ def create_or_update_related_articles_config(db: Session, config_data: schemas.R
         db.add(db_config)
         db.commit()
         db.refresh(db_config)
+        _invalidate_related_articles_configs()
         return db_config
 
 def delete_related_articles_config(db: Session, page_slug: str):
@@ -412,44 +524,129 @@ def delete_related_articles_config(db: Session, page_slug: str):
     if db_config:
         db.delete(db_config)
         db.commit()
+        _invalidate_related_articles_configs()
     return db_config
 
 def get_related_articles_for_page(db: Session, page_slug: str, limit: int = None):
     """Get related articles for a specific page based on its configuration"""
-    # Get the configuration for this page
-    config = get_related_articles_config(db, page_slug)
-    
-    if not config:
-        # Return empty list if no configuration found
-        return []
-    
-    try:
-        categories = json.loads(config.categories) if config.categories else []
-    except json.JSONDecodeError:
-        categories = []
-    
-    if not categories:
+    config = get_parsed_related_articles_configs(db).get(page_slug)
+    if not config or not config['categories']:
         return []
     
     # Use configured article count or provided limit (per category, not total)
-    articles_per_category = limit if limit is not None else config.article_count
-    
-    # Get articles from each configured category (articles_per_category from each)
-    all_articles = []
-    for category in categories:
-        category_articles = db.query(models.Article).filter(
-            and_(
-                models.Article.category == category,
-                models.Article.is_published == True
-            )
-        ).order_by(desc(models.Article.published_at)).limit(articles_per_category).all()
-        
-        all_articles.extend(category_articles)
-    
-    # Sort all articles by published date and return
-    all_articles.sort(key=lambda x: x.published_at or datetime.min, reverse=True)
+    articles_per_category = limit if limit is not None else config['articleCount']
+    if not articles_per_category or articles_per_category <= 0:
+        return []
     
-    return all_articles
+    # Rank published articles within each configured category and keep the
+    # newest articles_per_category of each, all in one query
+    ranked = db.query(
+        models.Article.id.label('id'),
+        func.row_number().over(
+            partition_by=models.Article.category,
+            order_by=(desc(models.Article.published_at), desc(models.Article.id))
+        ).label('position')
+    ).filter(
+        models.Article.category.in_(config['categories']),
+        models.Article.is_published == True
+    ).subquery()
+    
+    return db.query(models.Article).join(ranked, ranked.c.id == models.Article.id).filter(
+        ranked.c.position <= articles_per_category
+    ).order_by(desc(models.Article.published_at), desc(models.Article.id)).all()
+
+# Release windows shared by the theater and OTT homepage blocks. "This week" runs
+# from 3 days ago to 7 days ahead (IST); "coming soon" is anything later, padded
+# with releases from the two weeks before "this week" when there are too few.
+RELEASE_WEEK_PAST_DAYS = 3
+RELEASE_WEEK_AHEAD_DAYS = 7
+RELEASE_PADDING_DAYS = 14
+RELEASE_WINDOW_CACHE_MAX_ENTRIES = 32
+
+RELEASE_CALENDAR_CACHE_MAX_ENTRIES = 64
+
+_release_window_cache = {}  # (table, limit) -> (expires_at, windows)
+_release_calendar_cache = {}  # (kind, start, end, release_type) -> rows or day counts
+_release_cache_lock = threading.Lock()
+_release_cache_generation = 0
+
+def ist_today():
+    """Today's date in IST and the epoch timestamp of the next IST midnight"""
+    ist = timezone('Asia/Kolkata')
+    today = datetime.now(ist).date()
+    next_midnight = ist.localize(datetime.combine(today + timedelta(days=1), dt_time.min))
+    return today, next_midnight.timestamp()
+
+def _invalidate_release_caches(categories):
+    global _release_cache_generation
+    if categories & {THEATER_RELEASES, OTT_RELEASES}:
+        with _release_cache_lock:
+            _release_cache_generation += 1
+            _release_window_cache.clear()
+            _release_calendar_cache.clear()
+
+subscribe(_invalidate_release_caches)
+
+def _store_release_cache(cache: dict, key, value, generation: int, max_entries: int):
+    with _release_cache_lock:
+        # Skip caching if a release changed while we were querying
+        if generation == _release_cache_generation:
+            if len(cache) >= max_entries:
+                cache.clear()
+            cache[key] = value
+
+def get_release_windows(db: Session, model, limit: int = 4):
+    """Return {"this_week": [...], "coming_soon": [...]} for a release table.
+
+    Both windows come from one query that buckets rows with CASE and ranks them
+    per bucket, so "today" is computed once. Results are cached until the next
+    IST midnight or until a release is created, updated or deleted.
+    """
+    key = (model.__tablename__, limit)
+    cached = _release_window_cache.get(key)
+    hit = bool(cached) and cached[0] > time.time()
+    metrics.cache_lookup("release_windows", hit)
+    if hit:
+        return cached[1]
+    generation = _release_cache_generation
+
+    today, expires_at = ist_today()
+    week_start = today - timedelta(days=RELEASE_WEEK_PAST_DAYS)
+    week_end = today + timedelta(days=RELEASE_WEEK_AHEAD_DAYS)
+    padding_start = today - timedelta(days=RELEASE_PADDING_DAYS)
+
+    bucket = case(
+        (model.release_date < week_start, 'older'),
+        (model.release_date <= week_end, 'this_week'),
+        else_='upcoming'
+    )
+    # Padding is taken newest first, the other buckets soonest first
+    order_key = case(
+        (model.release_date < week_start, -func.julianday(model.release_date)),
+        else_=func.julianday(model.release_date)
+    )
+    ranked = db.query(
+        model.id.label('id'),
+        bucket.label('bucket'),
+        func.row_number().over(partition_by=bucket, order_by=(order_key, model.id)).label('position')
+    ).filter(model.release_date >= padding_start).subquery()
+
+    rows = db.query(model, ranked.c.bucket).join(ranked, ranked.c.id == model.id).filter(
+        ranked.c.position <= limit
+    ).order_by(ranked.c.bucket, ranked.c.position).all()
+
+    buckets = {'this_week': [], 'upcoming': [], 'older': []}
+    for release, bucket_name in rows:
+        # Cached rows outlive this session, so detach them before it can expire them
+        db.expunge(release)
+        buckets[bucket_name].append(release)
+    windows = {
+        "this_week": buckets['this_week'],
+        "coming_soon": (buckets['upcoming'] + buckets['older'])[:limit]
+    }
+    _store_release_cache(_release_window_cache, key, (expires_at, windows), generation,
+                         RELEASE_WINDOW_CACHE_MAX_ENTRIES)
+    return windows
 
 # Theater Release CRUD operations
 def get_theater_releases(db: Session, skip: int = 0, limit: int = 100):
@@ -459,48 +656,17 @@ def get_theater_release(db: Session, release_id: int):
     return db.query(models.TheaterRelease).filter(models.TheaterRelease.id == release_id).first()
 
 def get_upcoming_theater_releases(db: Session, limit: int = 4):
-    from datetime import date, timedelta
-    today = date.today()
-    week_start = today - timedelta(days=3)  # Same range as "this week"
-    week_end = today + timedelta(days=7)
-    
-    # First, get releases that are more than 7 days away (true upcoming)
-    upcoming = db.query(models.TheaterRelease).filter(
-        models.TheaterRelease.release_date > week_end
-    ).order_by(models.TheaterRelease.release_date).limit(limit).all()
-    
-    # If we don't have enough upcoming releases, pad with older releases (not in "this week" range)
-    if len(upcoming) < limit:
-        older_start = today - timedelta(days=14)  # Look back 2 weeks
-        older_end = week_start  # Up to the start of "this week" range
-        older = db.query(models.TheaterRelease).filter(
-            and_(
-                models.TheaterRelease.release_date >= older_start,
-                models.TheaterRelease.release_date < older_end
-            )
-        ).order_by(models.TheaterRelease.release_date.desc()).limit(limit - len(upcoming)).all()
-        upcoming.extend(older)
-    
-    return upcoming
+    return list(get_release_windows(db, models.TheaterRelease, limit)["coming_soon"])
 
 def get_this_week_theater_releases(db: Session, limit: int = 4):
-    from datetime import date, timedelta
-    today = date.today()
-    week_start = today - timedelta(days=3)  # Include releases from 3 days ago
-    week_end = today + timedelta(days=7)
-    # Get releases within the range (3 days ago to 7 days ahead)
-    return db.query(models.TheaterRelease).filter(
-        and_(
-            models.TheaterRelease.release_date >= week_start,
-            models.TheaterRelease.release_date <= week_end
-        )
-    ).order_by(models.TheaterRelease.release_date).limit(limit).all()
+    return list(get_release_windows(db, models.TheaterRelease, limit)["this_week"])
 
 def create_theater_release(db: Session, release: schemas.TheaterReleaseCreate):
     db_release = models.TheaterRelease(**release.dict())
     db.add(db_release)
     db.commit()
     db.refresh(db_release)
+    notify_content_changed([THEATER_RELEASES])
     return db_release
 
 def update_theater_release(db: Session, release_id: int, release_update: schemas.TheaterReleaseUpdate):
@@ -511,6 +677,7 @@ def update_theater_release(db: Session, release_id: int, release_update: schemas
             setattr(db_release, key, value)
         db.commit()
         db.refresh(db_release)
+        notify_content_changed([THEATER_RELEASES])
     return db_release
 
 def delete_theater_release(db: Session, release_id: int):
@@ -518,6 +685,7 @@ def delete_theater_release(db: Session, release_id: int):
     if db_release:
         db.delete(db_release)
         db.commit()
+        notify_content_changed([THEATER_RELEASES])
     return db_release
 
 # OTT Release CRUD operations
@@ -528,48 +696,17 @@ def get_ott_release(db: Session, release_id: int):
     return db.query(models.OTTRelease).filter(models.OTTRelease.id == release_id).first()
 
 def get_upcoming_ott_releases(db: Session, limit: int = 4):
-    from datetime import date, timedelta
-    today = date.today()
-    week_start = today - timedelta(days=3)  # Same range as "this week"
-    week_end = today + timedelta(days=7)
-    
-    # First, get releases that are more than 7 days away (true upcoming)
-    upcoming = db.query(models.OTTRelease).filter(
-        models.OTTRelease.release_date > week_end
-    ).order_by(models.OTTRelease.release_date).limit(limit).all()
-    
-    # If we don't have enough upcoming releases, pad with older releases (not in "this week" range)
-    if len(upcoming) < limit:
-        older_start = today - timedelta(days=14)  # Look back 2 weeks
-        older_end = week_start  # Up to the start of "this week" range
-        older = db.query(models.OTTRelease).filter(
-            and_(
-                models.OTTRelease.release_date >= older_start,
-                models.OTTRelease.release_date < older_end
-            )
-        ).order_by(models.OTTRelease.release_date.desc()).limit(limit - len(upcoming)).all()
-        upcoming.extend(older)
-    
-    return upcoming
+    return list(get_release_windows(db, models.OTTRelease, limit)["coming_soon"])
 
 def get_this_week_ott_releases(db: Session, limit: int = 4):
-    from datetime import date, timedelta
-    today = date.today()
-    week_start = today - timedelta(days=3)  # Include releases from 3 days ago
-    week_end = today + timedelta(days=7)
-    # Get releases within the range (3 days ago to 7 days ahead)
-    return db.query(models.OTTRelease).filter(
-        and_(
-            models.OTTRelease.release_date >= week_start,
-            models.OTTRelease.release_date <= week_end
-        )
-    ).order_by(models.OTTRelease.release_date).limit(limit).all()
+    return list(get_release_windows(db, models.OTTRelease, limit)["this_week"])
 
 def create_ott_release(db: Session, release: schemas.OTTReleaseCreate):
     db_release = models.OTTRelease(**release.dict())
     db.add(db_release)
     db.commit()
     db.refresh(db_release)
+    notify_content_changed([OTT_RELEASES])
     return db_release
 
 def update_ott_release(db: Session, release_id: int, release_update: schemas.OTTReleaseUpdate):
@@ -580,6 +717,7 @@ def update_ott_release(db: Session, release_id: int, release_update: schemas.OTT
             setattr(db_release, key, value)
         db.commit()
         db.refresh(db_release)
+        notify_content_changed([OTT_RELEASES])
     return db_release
 
 def delete_ott_release(db: Session, release_id: int):
@@ -587,8 +725,67 @@ def delete_ott_release(db: Session, release_id: int):
     if db_release:
         db.delete(db_release)
         db.commit()
+        notify_content_changed([OTT_RELEASES])
     return db_release
 
+# Release calendar: theater and OTT releases over an arbitrary date range
+RELEASE_TYPES = ("theater", "ott")
+
+def _release_calendar_query(start_date, end_date, release_type: Optional[str] = None):
+    """UNION ALL of both release tables restricted to [start_date, end_date] on the release_date index"""
+    theater = models.TheaterRelease
+    ott = models.OTTRelease
+    selects = []
+    if release_type in (None, "theater"):
+        selects.append(select(
+            literal("theater").label("release_type"), theater.id, theater.movie_name, theater.language,
+            theater.release_date, theater.movie_image, theater.movie_banner,
+            null().label("ott_platform"), theater.created_at
+        ).where(theater.release_date.between(start_date, end_date)))
+    if release_type in (None, "ott"):
+        selects.append(select(
+            literal("ott").label("release_type"), ott.id, ott.movie_name, ott.language,
+            ott.release_date, ott.movie_image, null().label("movie_banner"),
+            ott.ott_platform, ott.created_at
+        ).where(ott.release_date.between(start_date, end_date)))
+    return selects[0].subquery() if len(selects) == 1 else union_all(*selects).subquery()
+
+def get_releases_in_range(db: Session, start_date, end_date, release_type: Optional[str] = None):
+    """Theater and OTT releases between two dates (inclusive) as one stream sorted by release date"""
+    key = ("releases", start_date, end_date, release_type)
+    cached = _release_calendar_cache.get(key)
+    metrics.cache_lookup("release_calendar", cached is not None)
+    if cached is not None:
+        return cached
+    generation = _release_cache_generation
+
+    releases = _release_calendar_query(start_date, end_date, release_type)
+    rows = db.execute(
+        select(releases).order_by(releases.c.release_date, releases.c.release_type, releases.c.id)
+    ).all()
+    _store_release_cache(_release_calendar_cache, key, rows, generation, RELEASE_CALENDAR_CACHE_MAX_ENTRIES)
+    return rows
+
+def get_release_day_counts(db: Session, start_date, end_date, release_type: Optional[str] = None):
+    """Per-day release counts between two dates: {date: {"theater": n, "ott": n}}"""
+    key = ("day_counts", start_date, end_date, release_type)
+    cached = _release_calendar_cache.get(key)
+    metrics.cache_lookup("release_calendar", cached is not None)
+    if cached is not None:
+        return cached
+    generation = _release_cache_generation
+
+    releases = _release_calendar_query(start_date, end_date, release_type)
+    rows = db.execute(
+        select(releases.c.release_date, releases.c.release_type, func.count().label("count"))
+        .group_by(releases.c.release_date, releases.c.release_type)
+    ).all()
+    counts = {}
+    for release_date, kind, count in rows:
+        counts.setdefault(release_date, {"theater": 0, "ott": 0})[kind] = count
+    _store_release_cache(_release_calendar_cache, key, counts, generation, RELEASE_CALENDAR_CACHE_MAX_ENTRIES)
+    return counts
+
 # Get OTT platforms list
 def get_ott_platforms():
     """Get predefined list of OTT platforms"""
@@ -4,10 +4,13 @@ from sqlalchemy.orm import sessionmaker
 import os
 from pathlib import Path
 
+from metrics import TimedQueuePool
+
 ROOT_DIR = Path(__file__).parent
-DATABASE_URL = f"sqlite:///{ROOT_DIR}/blog_cms.db"
+DB_PATH = Path(os.environ.get("BLOG_CMS_DB_PATH", ROOT_DIR / "blog_cms.db"))
+DATABASE_URL = f"sqlite:///{DB_PATH}"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=TimedQueuePool)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -17,4 +20,18 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def missing_tables():
+    """Tables declared on the models that do not exist in the database yet"""
+    import models  # noqa: F401  registers the tables on Base.metadata
+    with engine.connect() as connection:
+        existing = {row[0] for row in connection.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )}
+    return [table for table in Base.metadata.tables if table not in existing]
+
+def init_db():
+    """Bring the database to the current schema by applying any pending migrations"""
+    from migrations import migrate
+    return migrate(DB_PATH)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Streaming database export.
+
+Writes every table of the SQLite database to <table>.ndjson.gz and/or
+<table>.sql.gz, reading rows in fixed-size batches with fetchmany so memory
+use does not grow with the size of the database. Tables are exported in
+parallel worker processes. Each table keeps a checkpoint of the last exported
+rowid and the byte offset of its output files, so an interrupted export can be
+resumed with --resume and picks up after the last completed segment.
+
+Usage:
+    python database_export.py --output-dir ../database_export [--jobs 4] [--resume]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent
+DEFAULT_DB_PATH = ROOT_DIR / "blog_cms.db"
+DEFAULT_OUTPUT_DIR = ROOT_DIR.parent / "database_export"
+DEFAULT_BATCH_SIZE = 1000
+# Rows per checkpointed segment; each segment is a complete gzip member and transaction
+DEFAULT_SEGMENT_ROWS = 50000
+FORMATS = ("ndjson", "sql")
+
+MANIFEST_FILE = "manifest.json"
+SCHEMA_FILE = "schema.sql"
+INDEXES_FILE = "indexes.sql"
+
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def sql_literal(value) -> str:
+    """Render a SQLite value as a SQL literal"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, bytes):
+        return f"X'{value.hex()}'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _json_default(value):
+    if isinstance(value, bytes):
+        return value.hex()
+    return str(value)
+
+
+def list_tables(connection: sqlite3.Connection):
+    return [
+        row[0] for row in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        )
+    ]
+
+
+def _checkpoint_path(output_dir: Path, table: str) -> Path:
+    return output_dir / f"{table}.checkpoint.json"
+
+
+def _load_checkpoint(output_dir: Path, table: str):
+    path = _checkpoint_path(output_dir, table)
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _save_checkpoint(output_dir: Path, table: str, checkpoint: dict):
+    path = _checkpoint_path(output_dir, table)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(checkpoint))
+    os.replace(tmp_path, path)
+
+
+class _SegmentWriter:
+    """Appends gzip members to a file; a member is only kept once its segment is checkpointed"""
+
+    def __init__(self, path: Path, offset: int):
+        self.raw = open(path, "r+b" if path.exists() else "wb")
+        # Drop anything written after the last checkpoint by an interrupted run
+        self.raw.truncate(offset)
+        self.raw.seek(offset)
+        self.member = None
+
+    def write(self, data: str):
+        if self.member is None:
+            self.member = gzip.GzipFile(fileobj=self.raw, mode="wb", compresslevel=6)
+        self.member.write(data.encode("utf-8"))
+
+    def end_segment(self) -> int:
+        """Close the current gzip member and return the durable file offset"""
+        if self.member is not None:
+            self.member.close()
+            self.member = None
+        self.raw.flush()
+        os.fsync(self.raw.fileno())
+        return self.raw.tell()
+
+
+def export_table(db_path: str, output_dir: str, table: str, formats=FORMATS,
+                 batch_size: int = DEFAULT_BATCH_SIZE, segment_rows: int = DEFAULT_SEGMENT_ROWS,
+                 resume: bool = False) -> dict:
+    """Stream one table to its output files. Runs in a worker process."""
+    output_dir = Path(output_dir)
+    started = time.perf_counter()
+    checkpoint = _load_checkpoint(output_dir, table) if resume else None
+    if checkpoint and checkpoint.get("formats") != list(formats):
+        checkpoint = None
+    if not checkpoint:
+        checkpoint = {
+            "table": table, "formats": list(formats), "last_rowid": None, "rows": 0,
+            "offsets": {fmt: 0 for fmt in formats}, "complete": False
+        }
+    resumed = checkpoint["rows"] > 0
+    if checkpoint["complete"]:
+        return _table_result(table, checkpoint, resumed, 0.0)
+
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        columns = [row[1] for row in connection.execute(f"PRAGMA table_info({quote_identifier(table)})")]
+        column_list = ", ".join(quote_identifier(column) for column in columns)
+        insert_prefix = f"INSERT INTO {quote_identifier(table)} ({column_list}) VALUES ("
+        writers = {
+            fmt: _SegmentWriter(output_dir / f"{table}.{fmt}.gz", checkpoint["offsets"][fmt])
+            for fmt in formats
+        }
+        try:
+            # Keyset pagination on rowid keeps each query cheap and makes progress resumable
+            query = f"SELECT rowid, {column_list} FROM {quote_identifier(table)}"
+            params = ()
+            if checkpoint["last_rowid"] is not None:
+                query += " WHERE rowid > ?"
+                params = (checkpoint["last_rowid"],)
+            cursor = connection.execute(query + " ORDER BY rowid", params)
+
+            segment_count = 0
+            last_rowid = checkpoint["last_rowid"]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                if segment_count == 0 and "sql" in writers:
+                    writers["sql"].write("BEGIN TRANSACTION;\n")
+                ndjson_lines = []
+                sql_lines = []
+                for row in rows:
+                    values = row[1:]
+                    if "ndjson" in writers:
+                        ndjson_lines.append(json.dumps(
+                            dict(zip(columns, values)), ensure_ascii=False, default=_json_default
+                        ))
+                    if "sql" in writers:
+                        sql_lines.append(insert_prefix + ", ".join(sql_literal(value) for value in values) + ");")
+                if ndjson_lines:
+                    writers["ndjson"].write("\n".join(ndjson_lines) + "\n")
+                if sql_lines:
+                    writers["sql"].write("\n".join(sql_lines) + "\n")
+                last_rowid = rows[-1][0]
+                segment_count += len(rows)
+
+                if segment_count >= segment_rows:
+                    if "sql" in writers:
+                        writers["sql"].write("COMMIT;\n")
+                    checkpoint["offsets"] = {fmt: writer.end_segment() for fmt, writer in writers.items()}
+                    checkpoint["rows"] += segment_count
+                    checkpoint["last_rowid"] = last_rowid
+                    _save_checkpoint(output_dir, table, checkpoint)
+                    segment_count = 0
+
+            if segment_count and "sql" in writers:
+                writers["sql"].write("COMMIT;\n")
+            checkpoint["offsets"] = {fmt: writer.end_segment() for fmt, writer in writers.items()}
+            checkpoint["rows"] += segment_count
+            checkpoint["last_rowid"] = last_rowid
+            checkpoint["complete"] = True
+            _save_checkpoint(output_dir, table, checkpoint)
+        finally:
+            for writer in writers.values():
+                writer.raw.close()
+    finally:
+        connection.close()
+
+    return _table_result(table, checkpoint, resumed, time.perf_counter() - started)
+
+
+def _table_result(table: str, checkpoint: dict, resumed: bool, seconds: float) -> dict:
+    return {
+        "table": table,
+        "rows": checkpoint["rows"],
+        "resumed": resumed,
+        "seconds": round(seconds, 3),
+        "files": {fmt: f"{table}.{fmt}.gz" for fmt in checkpoint["formats"]},
+        "bytes": checkpoint["offsets"]
+    }
+
+
+def write_schema(connection: sqlite3.Connection, output_dir: Path, tables):
+    """Write CREATE TABLE statements, and CREATE INDEX statements to run after the data is loaded"""
+    header = f"-- Tadka News Platform database schema\n-- Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    with open(output_dir / SCHEMA_FILE, "w", encoding="utf-8") as schema_file:
+        schema_file.write(header)
+        for table in tables:
+            row = connection.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table,)).fetchone()
+            if row and row[0]:
+                schema_file.write(f"-- Table: {table}\n{row[0]};\n\n")
+    with open(output_dir / INDEXES_FILE, "w", encoding="utf-8") as index_file:
+        index_file.write(header)
+        for name, sql in connection.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type='index' AND sql IS NOT NULL ORDER BY tbl_name, name"
+        ):
+            index_file.write(f"{sql};\n")
+
+
+def export_database(db_path=DEFAULT_DB_PATH, output_dir=DEFAULT_OUTPUT_DIR, formats=FORMATS,
+                    jobs: int = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                    segment_rows: int = DEFAULT_SEGMENT_ROWS, resume: bool = False, tables=None) -> dict:
+    """Export the database to output_dir and return the manifest"""
+    db_path = Path(db_path)
+    output_dir = Path(output_dir)
+    if not db_path.exists():
+        raise FileNotFoundError(f"Database file not found: {db_path}")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        all_tables = list_tables(connection)
+        tables = [table for table in all_tables if table in tables] if tables else all_tables
+        write_schema(connection, output_dir, all_tables)
+    finally:
+        connection.close()
+
+    started = time.perf_counter()
+    jobs = jobs or min(4, os.cpu_count() or 1, max(1, len(tables)))
+    results = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(export_table, str(db_path), str(output_dir), table, tuple(formats),
+                            batch_size, segment_rows, resume): table
+            for table in tables
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[result["table"]] = result
+            status = "resumed" if result["resumed"] else "exported"
+            print(f"   {result['table']}: {result['rows']} records {status} in {result['seconds']}s")
+
+    manifest = {
+        "export_timestamp": datetime.now().isoformat(),
+        "database": str(db_path),
+        "formats": list(formats),
+        "schema": SCHEMA_FILE,
+        "indexes": INDEXES_FILE,
+        # Import order: schema, then table data in this order, then indexes
+        "table_order": tables,
+        "total_tables": len(tables),
+        "total_records": sum(result["rows"] for result in results.values()),
+        "seconds": round(time.perf_counter() - started, 3),
+        "tables": {table: results[table] for table in tables}
+    }
+    with open(output_dir / MANIFEST_FILE, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream the CMS database to gzip-compressed NDJSON and SQL files")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="SQLite database to export")
+    parser.add_argument("--output-dir", default=str(DEFAULT_OUTPUT_DIR), help="Directory for the export files")
+    parser.add_argument("--format", action="append", choices=FORMATS, dest="formats",
+                        help="Output format (repeatable, default: both)")
+    parser.add_argument("--jobs", type=int, default=None, help="Tables exported in parallel")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per fetchmany call")
+    parser.add_argument("--segment-rows", type=int, default=DEFAULT_SEGMENT_ROWS, help="Rows between checkpoints")
+    parser.add_argument("--table", action="append", dest="tables", help="Only export this table (repeatable)")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted export from its checkpoints")
+    args = parser.parse_args(argv)
+
+    try:
+        manifest = export_database(
+            db_path=args.db, output_dir=args.output_dir, formats=tuple(args.formats or FORMATS),
+            jobs=args.jobs, batch_size=args.batch_size, segment_rows=args.segment_rows,
+            resume=args.resume, tables=args.tables
+        )
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return 1
+    print(f"✅ Exported {manifest['total_records']} records from {manifest['total_tables']} tables "
+          f"to {args.output_dir} in {manifest['seconds']}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
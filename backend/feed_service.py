@@ -0,0 +1,421 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+import metrics
+import models
+from content_events import OTT_RELEASES, THEATER_RELEASES
+from database import SessionLocal
+from reference_data import reference_data
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).parent
+FEED_DIR = Path(os.environ.get("FEED_DIR", ROOT_DIR / "feeds"))
+# Public site the article links point at, and where the API serving the sitemap files is reachable
+SITE_URL = os.environ.get("SITE_URL", "http://localhost:3000").rstrip("/")
+FEED_BASE_URL = os.environ.get("FEED_BASE_URL", f"{SITE_URL}/api").rstrip("/")
+# Latest articles per RSS/Atom feed
+FEED_ITEMS = int(os.environ.get("FEED_ITEMS", 50))
+# URLs per sitemap file; 50,000 is the protocol's limit
+SITEMAP_MAX_URLS = int(os.environ.get("SITEMAP_MAX_URLS", 50000))
+# Rows fetched per keyset page while generating
+FEED_QUERY_BATCH_SIZE = int(os.environ.get("FEED_QUERY_BATCH_SIZE", 1000))
+# How often categories touched by content writes are regenerated; also debounces bursts of CMS writes
+FEED_REBUILD_INTERVAL_SECONDS = int(os.environ.get("FEED_REBUILD_INTERVAL_SECONDS", 30))
+
+FEED_KINDS = ("rss", "atom")
+MEDIA_TYPES = {"sitemap": "application/xml", "rss": "application/rss+xml", "atom": "application/atom+xml"}
+SITEMAP_INDEX = "sitemap.xml"
+MANIFEST = "manifest.json"
+_CATEGORY_SLUG = re.compile(r"^[a-z0-9][a-z0-9-]*$")
+_FILE_NAME = re.compile(r"^(?:sitemap|sitemap-[a-z0-9-]+-\d+|rss-[a-z0-9-]+|atom-[a-z0-9-]+)\.xml$")
+# Release pseudo-categories have no article pages
+_NON_ARTICLE_CATEGORIES = {THEATER_RELEASES, OTT_RELEASES}
+
+_ARTICLE_COLUMNS = (
+    models.Article.id, models.Article.slug, models.Article.title, models.Article.seo_title,
+    models.Article.summary, models.Article.seo_description, models.Article.author,
+    models.Article.published_at, models.Article.updated_at
+)
+
+
+def sitemap_name(category: str, page: int) -> str:
+    return f"sitemap-{category}-{page}.xml"
+
+
+def feed_name(kind: str, category: str) -> str:
+    return f"{kind}-{category}.xml"
+
+
+def _utc(value: Optional[datetime]) -> datetime:
+    # Timestamps are stored as naive UTC
+    return (value or datetime.utcnow()).replace(tzinfo=timezone.utc)
+
+
+def _w3c(value: Optional[datetime]) -> str:
+    return _utc(value).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def article_url(row) -> str:
+    return f"{SITE_URL}/article/{row.id}/{row.slug}" if row.slug else f"{SITE_URL}/article/{row.id}"
+
+
+def _published(category: str):
+    return and_(models.Article.category == category, models.Article.is_published == True)
+
+
+def iter_sitemap_rows(db: Session, category: str, batch_size: int = FEED_QUERY_BATCH_SIZE) -> Iterator[Any]:
+    """A category's published articles in id order, paging on the last id seen instead of OFFSET"""
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(models.Article.id, models.Article.slug, models.Article.published_at, models.Article.updated_at)
+            .where(_published(category), models.Article.id > last_id)
+            .order_by(models.Article.id).limit(batch_size)
+        ).all()
+        yield from rows
+        if len(rows) < batch_size:
+            return
+        last_id = rows[-1].id
+
+
+def iter_feed_rows(db: Session, category: str, limit: int = FEED_ITEMS,
+                   batch_size: int = FEED_QUERY_BATCH_SIZE) -> Iterator[Any]:
+    """A category's newest published articles, paging on (published_at, id)"""
+    after: Optional[Tuple[datetime, int]] = None
+    remaining = limit
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        query = select(*_ARTICLE_COLUMNS).where(_published(category), models.Article.published_at.isnot(None))
+        if after is not None:
+            query = query.where(or_(
+                models.Article.published_at < after[0],
+                and_(models.Article.published_at == after[0], models.Article.id < after[1])
+            ))
+        rows = db.execute(query.order_by(
+            models.Article.published_at.desc(), models.Article.id.desc()
+        ).limit(size)).all()
+        yield from rows
+        if len(rows) < size:
+            return
+        remaining -= size
+        after = (rows[-1].published_at, rows[-1].id)
+
+
+def render_sitemap(rows: Iterable[Any]) -> Iterator[str]:
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    for row in rows:
+        yield (f"<url><loc>{escape(article_url(row))}</loc>"
+               f"<lastmod>{_w3c(row.updated_at or row.published_at)}</lastmod></url>\n")
+    yield "</urlset>\n"
+
+
+def render_sitemap_index(entries: Iterable[Tuple[str, str]]) -> Iterator[str]:
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    for name, lastmod in entries:
+        yield f"<sitemap><loc>{escape(f'{FEED_BASE_URL}/sitemaps/{name}')}</loc><lastmod>{lastmod}</lastmod></sitemap>\n"
+    yield "</sitemapindex>\n"
+
+
+def render_rss(category: str, title: str, rows: Iterable[Any]) -> Iterator[str]:
+    link = f"{SITE_URL}/{category}"
+    yield ('<?xml version="1.0" encoding="UTF-8"?>\n'
+           '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+           '<channel>\n'
+           f"<title>{escape(title)}</title><link>{escape(link)}</link>"
+           f"<description>{escape(f'Latest {title} articles')}</description>"
+           f"<atom:link href={quoteattr(f'{FEED_BASE_URL}/feeds/{category}/rss.xml')} rel=\"self\" type=\"application/rss+xml\"/>\n")
+    for row in rows:
+        url = escape(article_url(row))
+        description = row.seo_description or row.summary
+        yield (f"<item><title>{escape(row.seo_title or row.title or '')}</title><link>{url}</link>"
+               f"<guid isPermaLink=\"true\">{url}</guid><pubDate>{format_datetime(_utc(row.published_at))}</pubDate>"
+               + (f"<description>{escape(description)}</description>" if description else "")
+               + (f"<dc:creator>{escape(row.author)}</dc:creator>" if row.author else "")
+               + "</item>\n")
+    yield "</channel></rss>\n"
+
+
+def render_atom(category: str, title: str, rows: Iterable[Any]) -> Iterator[str]:
+    rows = iter(rows)
+    first = next(rows, None)
+    yield ('<?xml version="1.0" encoding="UTF-8"?>\n<feed xmlns="http://www.w3.org/2005/Atom">\n'
+           f"<id>{escape(f'{SITE_URL}/{category}')}</id><title>{escape(title)}</title>"
+           f"<updated>{_w3c(first.updated_at or first.published_at if first else None)}</updated>"
+           f"<link href={quoteattr(f'{SITE_URL}/{category}')}/>"
+           f"<link rel=\"self\" href={quoteattr(f'{FEED_BASE_URL}/feeds/{category}/atom.xml')}/>\n")
+    for row in chain([first] if first else [], rows):
+        url = article_url(row)
+        description = row.seo_description or row.summary
+        yield (f"<entry><id>{escape(url)}</id><title>{escape(row.seo_title or row.title or '')}</title>"
+               f"<link href={quoteattr(url)}/><published>{_w3c(row.published_at)}</published>"
+               f"<updated>{_w3c(row.updated_at or row.published_at)}</updated>"
+               + (f"<summary>{escape(description)}</summary>" if description else "")
+               + (f"<author><name>{escape(row.author)}</name></author>" if row.author else "")
+               + "</entry>\n")
+    yield "</feed>\n"
+
+
+class FeedService:
+    """Sitemaps and RSS/Atom feeds per category, written to disk gzipped and plain.
+
+    Only categories touched by content writes (and, after a restart, those
+    whose published articles changed while we were down) are regenerated.
+    Each output is streamed from keyset-paginated queries straight to disk,
+    and a file whose content is unchanged is left alone so its ETag holds.
+    """
+
+    def __init__(self, feed_dir: Path = FEED_DIR):
+        self.feed_dir = Path(feed_dir)
+        self.scheduler = BackgroundScheduler()
+        self.job_id = "rebuild_feeds"
+        # Reentrant: reconcile() holds it across its check and the rebuild
+        self._build_lock = threading.RLock()
+        self._dirty_lock = threading.Lock()
+        self._dirty: Set[str] = set()
+        self._reconciled = False
+        self._manifest: Optional[Dict[str, Any]] = None
+        self.build_count = 0
+        self.last_build_duration = 0.0
+
+    def on_content_changed(self, categories: Set[str]):
+        """content_events subscriber: queue the touched categories for regeneration"""
+        touched = {category for category in categories if category not in _NON_ARTICLE_CATEGORIES}
+        with self._dirty_lock:
+            self._dirty |= touched
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        if self._manifest is None:
+            try:
+                self._manifest = json.loads((self.feed_dir / MANIFEST).read_text())
+            except (OSError, ValueError):
+                self._manifest = {"files": {}, "categories": {}}
+        return self._manifest
+
+    def _save_manifest(self):
+        path = self.feed_dir / MANIFEST
+        tmp_path = path.with_name(MANIFEST + ".tmp")
+        tmp_path.write_text(json.dumps(self.manifest, separators=(",", ":")))
+        os.replace(tmp_path, path)
+
+    def _write(self, name: str, chunks: Iterable[str]) -> bool:
+        """Stream chunks to name and name.gz; returns False (keeping the old files) when nothing changed"""
+        path = self.feed_dir / name
+        gz_path = path.with_name(name + ".gz")
+        tmp_path, gz_tmp_path = path.with_name(name + ".tmp"), path.with_name(name + ".gz.tmp")
+        digest = hashlib.sha1()
+        with open(tmp_path, "wb") as plain, open(gz_tmp_path, "wb") as raw:
+            # mtime=0 keeps the compressed bytes a function of the content alone
+            with gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0) as compressed:
+                for chunk in chunks:
+                    data = chunk.encode("utf-8")
+                    digest.update(data)
+                    plain.write(data)
+                    compressed.write(data)
+        sha1 = digest.hexdigest()
+        if self.manifest["files"].get(name) == sha1 and path.exists() and gz_path.exists():
+            tmp_path.unlink()
+            gz_tmp_path.unlink()
+            return False
+        os.replace(gz_tmp_path, gz_path)
+        os.replace(tmp_path, path)
+        self.manifest["files"][name] = sha1
+        return True
+
+    def _remove(self, name: str):
+        self.manifest["files"].pop(name, None)
+        for path in (self.feed_dir / name, self.feed_dir / (name + ".gz")):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _fingerprints(self, db: Session, category: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Count, newest id and latest change of the published articles per category, in one query"""
+        query = select(
+            models.Article.category, func.count(), func.max(models.Article.id),
+            func.max(models.Article.updated_at), func.max(models.Article.published_at)
+        ).where(models.Article.is_published == True, models.Article.category.isnot(None))
+        if category is not None:
+            query = query.where(models.Article.category == category)
+        return {
+            slug: {
+                "fingerprint": [count, max_id, _w3c(updated_at) if updated_at else None,
+                                _w3c(published_at) if published_at else None],
+                "lastmod": _w3c(updated_at or published_at)
+            }
+            for slug, count, max_id, updated_at, published_at in db.execute(query.group_by(models.Article.category))
+            if _CATEGORY_SLUG.match(slug)
+        }
+
+    def _category_title(self, category: str) -> str:
+        return getattr(reference_data, "category_by_slug", {}).get(category, {}).get("name") or category
+
+    def build_category(self, db: Session, category: str) -> int:
+        """Regenerate a category's sitemap pages and feeds; returns the number of files rewritten"""
+        state = self._fingerprints(db, category).get(category)
+        previous = self.manifest["categories"].get(category, {}).get("files", [])
+        files: List[str] = []
+        changed = 0
+        if state is not None:
+            rows = iter_sitemap_rows(db, category)
+            page = 1
+            first = next(rows, None)
+            while first is not None:
+                name = sitemap_name(category, page)
+                changed += self._write(name, render_sitemap(chain([first], islice(rows, SITEMAP_MAX_URLS - 1))))
+                files.append(name)
+                page += 1
+                first = next(rows, None)
+            title = self._category_title(category)
+            for kind, render in (("rss", render_rss), ("atom", render_atom)):
+                name = feed_name(kind, category)
+                changed += self._write(name, render(category, title, iter_feed_rows(db, category)))
+                files.append(name)
+            self.manifest["categories"][category] = {**state, "files": files}
+        else:
+            self.manifest["categories"].pop(category, None)
+        for name in set(previous) - set(files):
+            self._remove(name)
+            changed += 1
+        return changed
+
+    def build_index(self) -> bool:
+        entries = [
+            (name, entry["lastmod"])
+            for category, entry in sorted(self.manifest["categories"].items())
+            for name in entry["files"] if name.startswith("sitemap-")
+        ]
+        return self._write(SITEMAP_INDEX, render_sitemap_index(entries))
+
+    def rebuild(self, categories: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Regenerate the given categories (every category when None) and the sitemap index"""
+        with self._build_lock:
+            started = time.perf_counter()
+            self.feed_dir.mkdir(parents=True, exist_ok=True)
+            db = SessionLocal()
+            try:
+                if categories is None:
+                    categories = set(self._fingerprints(db)) | set(self.manifest["categories"])
+                rebuilt, changed = [], 0
+                for category in sorted(set(categories)):
+                    if not _CATEGORY_SLUG.match(category or ""):
+                        continue
+                    try:
+                        changed += self.build_category(db, category)
+                        rebuilt.append(category)
+                    except Exception as e:
+                        logger.error(f"Failed to build feeds for {category}: {str(e)}")
+            finally:
+                db.close()
+            changed += self.build_index()
+            self._save_manifest()
+            self.build_count += 1
+            self.last_build_duration = time.perf_counter() - started
+            metrics.SCHEDULER_RUN_DURATION.observe(self.last_build_duration, (self.job_id,))
+            if rebuilt:
+                logger.info(f"Regenerated feeds for {len(rebuilt)} categories ({changed} files changed) "
+                            f"in {self.last_build_duration:.2f}s")
+            return {"categories": rebuilt, "files_changed": changed}
+
+    def reconcile(self) -> Dict[str, Any]:
+        """Regenerate categories whose published articles differ from what the files on disk were built from"""
+        with self._build_lock:
+            db = SessionLocal()
+            try:
+                current = self._fingerprints(db)
+            finally:
+                db.close()
+            known = self.manifest["categories"]
+            stale = {category for category in set(current) | set(known)
+                     if category not in current or category not in known
+                     or known[category]["fingerprint"] != current[category]["fingerprint"]
+                     or not all((self.feed_dir / name).exists() for name in known[category]["files"])}
+            result = {"categories": [], "files_changed": 0}
+            if stale or not (self.feed_dir / SITEMAP_INDEX).exists():
+                result = self.rebuild(stale)
+            self._reconciled = True
+            return result
+
+    def run(self):
+        """Scheduler job: reconcile with the database once, then regenerate touched categories"""
+        try:
+            if not self._reconciled:
+                self.reconcile()
+                return
+            with self._dirty_lock:
+                dirty, self._dirty = self._dirty, set()
+            if dirty:
+                self.rebuild(dirty)
+        except Exception as e:
+            logger.error(f"Feed regeneration failed: {str(e)}")
+
+    def get_path(self, name: str) -> Optional[Path]:
+        """Path of a generated file, building everything first if this process has not yet"""
+        if not _FILE_NAME.match(name):
+            return None
+        path = self.feed_dir / name
+        if not path.exists() and not self._reconciled:
+            with self._build_lock:
+                if not self._reconciled:
+                    self.reconcile()
+        return path if path.exists() else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Pending categories, last build and the files per category"""
+        with self._dirty_lock:
+            dirty = sorted(self._dirty)
+        return {
+            "dirty": dirty,
+            "reconciled": self._reconciled,
+            "build_count": self.build_count,
+            "last_build_duration_seconds": round(self.last_build_duration, 4),
+            "categories": {
+                category: {"articles": entry["fingerprint"][0], "lastmod": entry["lastmod"], "files": entry["files"]}
+                for category, entry in sorted(self.manifest["categories"].items())
+            }
+        }
+
+    def start(self, interval_seconds: int = FEED_REBUILD_INTERVAL_SECONDS):
+        """Reconcile with the database in the background, then keep touched categories fresh"""
+        self.scheduler.add_job(
+            func=self.run,
+            trigger=IntervalTrigger(seconds=interval_seconds),
+            id=self.job_id,
+            name="Regenerate sitemaps and feeds",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            next_run_time=datetime.now()
+        )
+        if not self.scheduler.running:
+            self.scheduler.start()
+            logger.info("Sitemap and feed generator started")
+
+    def stop(self):
+        """Stop the background regeneration job"""
+        if self.scheduler.running:
+            self.scheduler.shutdown()
+            logger.info("Sitemap and feed generator stopped")
+
+
+# Global sitemap and feed instance
+seo_feeds = FeedService()
@@ -0,0 +1,220 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from reference_data import STATE_NAME_BY_CODE
+import metrics
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).parent
+SNAPSHOT_DIR = Path(os.environ.get("HOMEPAGE_SNAPSHOT_DIR", ROOT_DIR / "snapshots"))
+# Cohorts built eagerly; "all" means no state filter, otherwise comma-separated state codes
+SNAPSHOT_COHORTS = os.environ.get("HOMEPAGE_SNAPSHOT_COHORTS", "all ap,ts ap ts").split()
+# How often dirty cohorts are rebuilt; also debounces bursts of CMS writes
+SNAPSHOT_REBUILD_INTERVAL_SECONDS = int(os.environ.get("HOMEPAGE_SNAPSHOT_REBUILD_INTERVAL_SECONDS", 5))
+# Rebuild everything at least this often so date-based blocks roll over
+SNAPSHOT_MAX_AGE_SECONDS = int(os.environ.get("HOMEPAGE_SNAPSHOT_MAX_AGE_SECONDS", 600))
+# Cap on cohorts built on demand for state combinations outside SNAPSHOT_COHORTS
+SNAPSHOT_MAX_COHORTS = 64
+
+
+def cohort_key(states: Optional[str]) -> str:
+    """Normalize a comma-separated list of state codes into a cohort key.
+
+    Unknown codes are dropped so arbitrary query strings cannot create cohorts.
+    """
+    codes = sorted({code.strip().lower() for code in (states or "").split(',')} & STATE_NAME_BY_CODE.keys())
+    if not codes:
+        return "all"
+    return ",".join(codes)
+
+
+class HomepageSnapshot:
+    """A rendered homepage for one state cohort"""
+
+    def __init__(self, cohort: str, body: bytes, built_at: float, build_duration: float):
+        self.cohort = cohort
+        self.body = body
+        self.etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        self.built_at = built_at
+        self.build_duration = build_duration
+
+
+class HomepageSnapshotService:
+    """Materializes the homepage JSON per state cohort and rebuilds it when relevant content changes"""
+
+    def __init__(self, snapshot_dir: Path = SNAPSHOT_DIR):
+        self.snapshot_dir = Path(snapshot_dir)
+        self.scheduler = BackgroundScheduler()
+        self.job_id = "rebuild_homepage_snapshots"
+        self.builder: Optional[Callable[[Session, List[str]], Dict[str, Any]]] = None
+        self.categories: Set[str] = set()
+        self.cohorts: List[str] = [cohort_key(cohort) for cohort in SNAPSHOT_COHORTS]
+        self.snapshots: Dict[str, HomepageSnapshot] = {}
+        self._build_lock = threading.Lock()
+        self._dirty_since: Optional[float] = None
+        self.build_count = 0
+
+    def configure(self, builder: Callable[[Session, List[str]], Dict[str, Any]], categories: Set[str]):
+        """Set the function that renders a cohort and the category slugs it reads"""
+        self.builder = builder
+        self.categories = set(categories)
+
+    def on_content_changed(self, categories: Set[str]):
+        """content_events subscriber: mark snapshots dirty when a homepage category changes"""
+        if categories & self.categories and self._dirty_since is None:
+            self._dirty_since = time.time()
+
+    def _snapshot_path(self, cohort: str) -> Path:
+        return self.snapshot_dir / f"homepage_{cohort.replace(',', '_')}.json"
+
+    def _render(self, cohort: str, db: Optional[Session] = None) -> HomepageSnapshot:
+        own_session = db is None
+        db = db or SessionLocal()
+        try:
+            started = time.perf_counter()
+            state_codes = [] if cohort == "all" else cohort.split(',')
+            payload = self.builder(db, state_codes)
+            payload["cohort"] = cohort
+            payload["generated_at"] = time.time()
+            body = json.dumps(jsonable_encoder(payload), separators=(",", ":")).encode("utf-8")
+            return HomepageSnapshot(cohort, body, payload["generated_at"], time.perf_counter() - started)
+        finally:
+            if own_session:
+                db.close()
+
+    def build(self, cohort: str, db: Optional[Session] = None) -> HomepageSnapshot:
+        """Render one cohort, keep it in memory and write it to disk for warm restarts"""
+        snapshot = self._render(cohort, db)
+        self.snapshots[cohort] = snapshot
+        if cohort not in self.cohorts:
+            self.cohorts.append(cohort)
+        try:
+            self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+            path = self._snapshot_path(cohort)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(snapshot.body)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"Failed to write homepage snapshot for {cohort}: {str(e)}")
+        self.build_count += 1
+        return snapshot
+
+    def rebuild_all(self) -> int:
+        """Rebuild every known cohort in one pass"""
+        with self._build_lock:
+            self._dirty_since = None
+            db = SessionLocal()
+            try:
+                for cohort in list(self.cohorts):
+                    try:
+                        self.build(cohort, db)
+                    except Exception as e:
+                        logger.error(f"Failed to build homepage snapshot for {cohort}: {str(e)}")
+            finally:
+                db.close()
+            return len(self.cohorts)
+
+    def rebuild_if_needed(self):
+        """Scheduler job: rebuild when content changed or the oldest snapshot is too old"""
+        oldest = min((snapshot.built_at for snapshot in self.snapshots.values()), default=0)
+        if self._dirty_since is not None or time.time() - oldest > SNAPSHOT_MAX_AGE_SECONDS:
+            self.rebuild_all()
+
+    def cached(self, cohort: str) -> Optional[HomepageSnapshot]:
+        """Return the cohort's snapshot if it is already built, without touching the database"""
+        snapshot = self.snapshots.get(cohort)
+        metrics.cache_lookup("homepage_snapshot", snapshot is not None)
+        return snapshot
+
+    def get(self, cohort: str) -> HomepageSnapshot:
+        """Return the cohort's snapshot, building it on first request"""
+        snapshot = self.cached(cohort)
+        if snapshot is not None:
+            return snapshot
+        with self._build_lock:
+            snapshot = self.snapshots.get(cohort)
+            if snapshot is None:
+                if len(self.cohorts) >= SNAPSHOT_MAX_COHORTS and cohort not in self.cohorts:
+                    # Too many ad-hoc cohorts: render without caching
+                    return self._render(cohort)
+                snapshot = self.build(cohort)
+        return snapshot
+
+    def load_from_disk(self) -> int:
+        """Load snapshots written by a previous process so the first requests are served warm"""
+        loaded = 0
+        for path in self.snapshot_dir.glob("homepage_*.json"):
+            try:
+                body = path.read_bytes()
+                cohort = json.loads(body).get("cohort")
+            except (OSError, ValueError) as e:
+                logger.error(f"Ignoring unreadable homepage snapshot {path}: {str(e)}")
+                continue
+            if not cohort:
+                continue
+            self.snapshots[cohort] = HomepageSnapshot(cohort, body, path.stat().st_mtime, 0.0)
+            if cohort not in self.cohorts:
+                self.cohorts.append(cohort)
+            loaded += 1
+        return loaded
+
+    def stats(self) -> Dict[str, Any]:
+        """Staleness and build timings per cohort"""
+        now = time.time()
+        return {
+            "dirty": self._dirty_since is not None,
+            "dirty_for_seconds": round(now - self._dirty_since, 3) if self._dirty_since else 0,
+            "build_count": self.build_count,
+            "cohorts": {
+                cohort: {
+                    "age_seconds": round(now - snapshot.built_at, 3),
+                    "build_duration_seconds": round(snapshot.build_duration, 4),
+                    "bytes": len(snapshot.body),
+                    "etag": snapshot.etag
+                }
+                for cohort, snapshot in self.snapshots.items()
+            }
+        }
+
+    def start(self, interval_seconds: int = SNAPSHOT_REBUILD_INTERVAL_SECONDS):
+        """Warm from disk, then keep snapshots fresh in the background"""
+        loaded = self.load_from_disk()
+        if loaded:
+            logger.info(f"Loaded {loaded} homepage snapshots from disk")
+            # Disk copies may predate content changes made while we were down
+            self._dirty_since = time.time()
+        self.scheduler.add_job(
+            func=self.rebuild_if_needed,
+            trigger=IntervalTrigger(seconds=interval_seconds),
+            id=self.job_id,
+            name="Rebuild homepage snapshots",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
+        if not self.scheduler.running:
+            self.scheduler.start()
+            logger.info("Homepage snapshot builder started")
+
+    def stop(self):
+        """Stop the background rebuild job"""
+        if self.scheduler.running:
+            self.scheduler.shutdown()
+            logger.info("Homepage snapshot builder stopped")
+
+
+# Global homepage snapshot instance
+homepage_snapshots = HomepageSnapshotService()
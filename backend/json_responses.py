@@ -0,0 +1,96 @@
+import logging
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Type
+
+import orjson
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import inspect
+from sqlalchemy.orm import Query, Session
+
+from database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Re-validate trusted responses against their schema (for development and tests; costs what the fast path saves)
+VALIDATE_TRUSTED_RESPONSES = os.environ.get("VALIDATE_TRUSTED_RESPONSES", "false").lower() == "true"
+# Largest page a paginated list endpoint returns; bigger result sets are paged or streamed as NDJSON
+MAX_PAGE_SIZE = int(os.environ.get("MAX_PAGE_SIZE", 100))
+# Rows fetched from the cursor, and written to the client, at a time when streaming
+STREAM_BATCH_SIZE = int(os.environ.get("STREAM_BATCH_SIZE", 200))
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+_MISSING = object()
+_projections: Dict[Type[BaseModel], Tuple[Tuple[str, Any], ...]] = {}
+_adapters: Dict[Type[BaseModel], TypeAdapter] = {}
+
+
+def _projection(schema: Type[BaseModel]) -> Tuple[Tuple[str, Any], ...]:
+    projection = _projections.get(schema)
+    if projection is None:
+        projection = _projections[schema] = tuple(
+            (name, _MISSING if field.is_required() else field.get_default(call_default_factory=True))
+            for name, field in schema.model_fields.items()
+        )
+    return projection
+
+
+def project(item: dict, schema: Type[BaseModel]) -> dict:
+    """Keep only the schema's fields, filling defaults for missing ones, as response_model filtering would"""
+    projected = {}
+    for name, default in _projection(schema):
+        value = item.get(name, default)
+        if value is _MISSING:
+            raise KeyError(f"{schema.__name__} response item is missing required field '{name}'")
+        projected[name] = value
+    return projected
+
+
+def trusted_list_response(items: Iterable[dict], schema: Type[BaseModel], **kwargs) -> ORJSONResponse:
+    """Serialize dicts built by our own handlers straight to JSON, skipping Pydantic re-validation.
+
+    The endpoint keeps its response_model for the OpenAPI schema; FastAPI does not
+    validate responses that are returned as Response objects.
+    """
+    content: List[dict] = [project(item, schema) for item in items]
+    if VALIDATE_TRUSTED_RESPONSES:
+        adapter = _adapters.get(schema)
+        if adapter is None:
+            adapter = _adapters[schema] = TypeAdapter(List[schema])
+        try:
+            adapter.validate_python(content)
+        except ValidationError as e:
+            logger.warning(f"Trusted {schema.__name__} response failed validation: {str(e)}")
+    return ORJSONResponse(content, **kwargs)
+
+
+def row_dict(row) -> Dict[str, Any]:
+    """Column values of an ORM row"""
+    return {attr.key: getattr(row, attr.key) for attr in inspect(row).mapper.column_attrs}
+
+
+def ndjson_response(query: Callable[[Session], Query], serialize: Callable[[Any], dict] = row_dict) -> StreamingResponse:
+    """Stream the rows of query(db) as newline-delimited JSON, one batch in memory at a time.
+
+    The query gets a session of its own, because the request's session is
+    closed before the response body is sent.
+    """
+    def lines() -> Iterator[bytes]:
+        db = SessionLocal()
+        try:
+            batch = []
+            for row in query(db).yield_per(STREAM_BATCH_SIZE):
+                batch.append(orjson.dumps(serialize(row), option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS))
+                if len(batch) >= STREAM_BATCH_SIZE:
+                    yield b"".join(batch)
+                    batch = []
+            if batch:
+                yield b"".join(batch)
+        except Exception as e:
+            # Headers are already sent; the client sees a truncated stream
+            logger.error(f"NDJSON stream failed: {str(e)}")
+            raise
+        finally:
+            db.close()
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
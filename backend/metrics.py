@@ -0,0 +1,300 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.pool import QueuePool
+
+# Latency buckets in seconds, tuned for API requests served mostly from caches and SQLite
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Base for metrics whose samples live in per-thread shards.
+
+    Recording only touches the calling thread's own dict, so the hot path takes
+    no locks and threads never contend. Rendering sums the shards; a shard is
+    registered under a lock once, the first time a thread records.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _snapshot_shards(self) -> List[dict]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        # Copy each shard so a thread recording mid-render cannot change a dict we are iterating
+        return [dict(shard) for shard in shards]
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    kind = "counter"
+
+    def inc(self, labels: Tuple = (), amount: float = 1):
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def values(self) -> Dict[Tuple, float]:
+        totals: Dict[Tuple, float] = {}
+        for shard in self._snapshot_shards():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def _render_samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self.values().items())
+        ]
+
+
+class Gauge(Counter):
+    """Value that goes up and down; inc/dec are summed across threads, or read from a callback"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 callback: Optional[Callable[[], Dict[Tuple, float]]] = None):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+        self._set_values: Dict[Tuple, float] = {}
+
+    def dec(self, labels: Tuple = (), amount: float = 1):
+        self.inc(labels, -amount)
+
+    def set(self, value: float, labels: Tuple = ()):
+        # A single dict assignment; the last writer wins
+        self._set_values[labels] = value
+
+    def values(self) -> Dict[Tuple, float]:
+        if self.callback is not None:
+            return self.callback()
+        totals = super().values()
+        for labels, value in dict(self._set_values).items():
+            totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+
+class Histogram(_Metric):
+    """Bucketed observations with sum and count"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, labels: Tuple = ()):
+        shard = self._shard()
+        state = shard.get(labels)
+        if state is None:
+            # One slot per bucket plus +Inf, then sum and count
+            state = shard[labels] = [0] * (len(self.buckets) + 3)
+        state[bisect_left(self.buckets, value)] += 1
+        state[-2] += value
+        state[-1] += 1
+
+    def time(self, labels: Tuple = ()):
+        return _Timer(self, labels)
+
+    def _render_samples(self) -> List[str]:
+        totals: Dict[Tuple, List[float]] = {}
+        for shard in self._snapshot_shards():
+            for labels, state in shard.items():
+                total = totals.setdefault(labels, [0] * len(state))
+                for i, value in enumerate(list(state)):
+                    total[i] += value
+        lines = []
+        bounds = self.buckets + (float("inf"),)
+        bound_labels = [f'le="{_format_value(bound)}"' for bound in bounds]
+        for labels, total in sorted(totals.items()):
+            cumulative = 0
+            for bound_label, count in zip(bound_labels, total):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labels, bound_label)} {_format_value(cumulative)}"
+                )
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {_format_value(total[-1])}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Tuple):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, self.labels)
+
+
+class MetricsRegistry:
+    """Holds every metric and renders them in the Prometheus text format"""
+
+    def __init__(self):
+        self.metrics: List[_Metric] = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (), callback=None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, callback))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Global metrics registry instance
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests by route template and status", ("method", "route", "status"))
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route"))
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled", ("method",))
+DB_STATEMENTS_PER_REQUEST = registry.histogram(
+    "db_statements_per_request", "SQL statements issued per HTTP request", ("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89))
+DB_STATEMENT_DURATION = registry.histogram(
+    "db_statement_duration_seconds", "SQL statement execution time")
+DB_POOL_CHECKOUT_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled database connection",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0))
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total", "In-process cache lookups by cache and result (hit or miss)", ("cache", "result"))
+SCHEDULER_RUN_DURATION = registry.histogram(
+    "scheduler_run_duration_seconds", "Scheduled job run time", ("job",))
+SCHEDULER_LAST_RUN = registry.gauge(
+    "scheduler_last_run_timestamp_seconds", "Unix time the scheduled job last finished", ("job",))
+SCHEDULER_ARTICLES_PUBLISHED = registry.counter(
+    "scheduler_articles_published_total", "Scheduled articles published by the article scheduler")
+UPLOAD_BYTES = registry.counter(
+    "upload_bytes_total", "Bytes received in file uploads", ("kind",))
+UPLOAD_DURATION = registry.histogram(
+    "upload_duration_seconds", "Time to receive and store an uploaded file", ("kind",))
+TRANSLATION_JOBS = registry.counter(
+    "translation_jobs_total", "Translation job attempts by result (done, retry or failed)", ("result",))
+TRANSLATION_DURATION = registry.histogram(
+    "translation_job_duration_seconds", "Time to translate and store one article in one language",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0))
+RATE_LIMITED_REQUESTS = registry.counter(
+    "rate_limited_requests_total", "Requests rejected with 429 by route class", ("route_class",))
+COALESCED_REQUESTS = registry.counter(
+    "coalesced_requests_total", "Single-flight calls by role (leader runs the query, follower shares it)",
+    ("coalescer", "role"))
+
+
+def cache_lookup(cache: str, hit: bool):
+    CACHE_REQUESTS.inc((cache, "hit" if hit else "miss"))
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request counts, latency and in-flight requests per route template"""
+
+    def __init__(self, app, statements_per_request: Optional[Callable[[], Optional[int]]] = None):
+        self.app = app
+        self.statements_per_request = statements_per_request
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started = time.perf_counter()
+        in_flight = (method,)
+        HTTP_REQUESTS_IN_FLIGHT.inc(in_flight)
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec(in_flight)
+            # The router stores the matched route in the scope; raw paths would explode label cardinality
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            HTTP_REQUESTS.inc((method, route, str(status_code)))
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, (method, route))
+            if self.statements_per_request is not None:
+                statements = self.statements_per_request()
+                if statements is not None:
+                    DB_STATEMENTS_PER_REQUEST.observe(statements, (route,))
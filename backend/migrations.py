@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Versioned schema migrations for the blog CMS database.
+
+Applied versions are recorded in the schema_version table. Every migration
+must be idempotent, because migration 1 gives a fresh database the current
+model schema, so later steps find their columns and indexes already there.
+Schema steps run in a single transaction together with their version row.
+Data migrations on large tables go through batched_update(), which commits
+each id range separately, records its progress, and resumes after an
+interruption.
+
+Usage:
+    python migrations.py status
+    python migrations.py migrate [--target VERSION] [--batch-size N]
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.dialects import sqlite as sqlite_dialect
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from database import Base, DB_PATH
+
+logger = logging.getLogger(__name__)
+
+# Rows per id range in batched data migrations; each range is its own short write transaction
+MIGRATION_BATCH_SIZE = int(os.environ.get("MIGRATION_BATCH_SIZE", 2000))
+# Pause between batches so the site's own writes can take the lock in between
+MIGRATION_BATCH_PAUSE_MS = float(os.environ.get("MIGRATION_BATCH_PAUSE_MS", 20))
+MIGRATION_BUSY_TIMEOUT_SECONDS = 30
+PROGRESS_LOG_INTERVAL_SECONDS = 5
+
+
+class Migration:
+    def __init__(self, version: int, name: str, apply: Callable[[sqlite3.Connection], None], batched: bool):
+        self.version = version
+        self.name = name
+        self.apply = apply
+        self.batched = batched
+
+
+MIGRATIONS: List[Migration] = []
+
+
+def migration(version: int, name: str, batched: bool = False):
+    """Register a migration; batched ones manage their own transactions through batched_update()"""
+    def register(apply):
+        if any(existing.version == version for existing in MIGRATIONS):
+            raise ValueError(f"Duplicate migration version {version}")
+        MIGRATIONS.append(Migration(version, name, apply, batched))
+        MIGRATIONS.sort(key=lambda m: m.version)
+        return apply
+    return register
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def table_exists(connection: sqlite3.Connection, table: str) -> bool:
+    return connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+def column_names(connection: sqlite3.Connection, table: str) -> List[str]:
+    return [row[1] for row in connection.execute(f'PRAGMA table_info("{table}")')]
+
+
+def add_column(connection: sqlite3.Connection, table: str, column: str, definition: str) -> bool:
+    """ALTER TABLE ... ADD COLUMN unless the table is missing or already has the column"""
+    if not table_exists(connection, table) or column in column_names(connection, table):
+        return False
+    connection.execute(f'ALTER TABLE "{table}" ADD COLUMN "{column}" {definition}')
+    logger.info(f"Added {table}.{column}")
+    return True
+
+
+def batched_update(connection: sqlite3.Connection, key: str, table: str, assignments: str, condition: str,
+                   params: Optional[Dict] = None, batch_size: Optional[int] = None) -> int:
+    """UPDATE table SET assignments WHERE condition, one primary-key range per transaction.
+
+    `key` must start with the migration's zero-padded version ("0005_...").
+    Progress is committed with each batch under `key`, so an interrupted run
+    picks up after the last finished range. Returns the rows updated by this run.
+    """
+    batch_size = batch_size or MIGRATION_BATCH_SIZE
+    if not table_exists(connection, table):
+        return 0
+    row = connection.execute("SELECT last_id FROM migration_progress WHERE key = ?", (key,)).fetchone()
+    last_id = row[0] if row else 0
+    max_id = connection.execute(f'SELECT COALESCE(MAX(id), 0) FROM "{table}"').fetchone()[0]
+    if last_id:
+        logger.info(f"{key}: resuming after id {last_id} of {max_id}")
+
+    statement = f'UPDATE "{table}" SET {assignments} WHERE id > :lower AND id <= :upper AND ({condition})'
+    updated = 0
+    last_logged = time.monotonic()
+    while last_id < max_id:
+        upper = min(last_id + batch_size, max_id)
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = connection.execute(statement, {**(params or {}), "lower": last_id, "upper": upper})
+            updated += max(cursor.rowcount, 0)
+            connection.execute(
+                "INSERT OR REPLACE INTO migration_progress (key, last_id, updated_at) VALUES (?, ?, ?)",
+                (key, upper, datetime.utcnow().isoformat())
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        last_id = upper
+        if time.monotonic() - last_logged >= PROGRESS_LOG_INTERVAL_SECONDS:
+            logger.info(f"{key}: {last_id}/{max_id} ids ({last_id / max_id:.0%}), {updated} rows updated")
+            last_logged = time.monotonic()
+        if MIGRATION_BATCH_PAUSE_MS > 0:
+            time.sleep(MIGRATION_BATCH_PAUSE_MS / 1000)
+
+    logger.info(f"{key}: done, {updated} rows updated")
+    return updated
+
+
+def create_model_table(connection: sqlite3.Connection, table_name: str) -> bool:
+    """CREATE TABLE (and its indexes) as declared on the models, unless the table exists"""
+    import models  # noqa: F401  registers the tables on Base.metadata
+    if table_exists(connection, table_name):
+        return False
+    table = Base.metadata.tables[table_name]
+    dialect = sqlite_dialect.dialect()
+    connection.execute(str(CreateTable(table).compile(dialect=dialect)))
+    for index in table.indexes:
+        connection.execute(str(CreateIndex(index).compile(dialect=dialect)))
+    logger.info(f"Created table {table_name}")
+    return True
+
+
+def create_model_index(connection: sqlite3.Connection, table_name: str, index_name: str):
+    """CREATE INDEX IF NOT EXISTS for one index declared on the models"""
+    import models  # noqa: F401  registers the tables on Base.metadata
+    index = next(index for index in Base.metadata.tables[table_name].indexes if index.name == index_name)
+    connection.execute(str(CreateIndex(index, if_not_exists=True).compile(dialect=sqlite_dialect.dialect())))
+
+
+def _rename_category(connection: sqlite3.Connection, old_slug: str, new_slug: str, name: str, description: str):
+    connection.execute(
+        """
+        UPDATE categories SET name = ?, slug = ?, description = ?
+        WHERE slug = ? AND NOT EXISTS (SELECT 1 FROM categories WHERE slug = ?)
+        """,
+        (name, new_slug, description, old_slug, new_slug)
+    )
+
+
+def _move_articles(connection: sqlite3.Connection, key: str, old_slug: str, new_slug: str):
+    # Articles only follow a rename that actually happened
+    if connection.execute("SELECT 1 FROM categories WHERE slug = ?", (new_slug,)).fetchone() is None:
+        return
+    batched_update(connection, key, "articles", "category = :new", "category = :old",
+                   {"old": old_slug, "new": new_slug})
+
+
+# ---------------------------------------------------------------------------
+# Migrations
+# ---------------------------------------------------------------------------
+
+@migration(1, "create missing tables from the models")
+def _create_missing_tables(connection):
+    import models  # noqa: F401  registers the tables on Base.metadata
+    for table in Base.metadata.sorted_tables:
+        create_model_table(connection, table.name)
+
+
+@migration(2, "default topic categories")
+def _default_topic_categories(connection):
+    connection.execute(
+        """
+        INSERT OR IGNORE INTO topic_categories (name, slug, created_at) VALUES
+        ('Movies', 'movies', CURRENT_TIMESTAMP),
+        ('Politics', 'politics', CURRENT_TIMESTAMP),
+        ('Sports', 'sports', CURRENT_TIMESTAMP),
+        ('TV', 'tv', CURRENT_TIMESTAMP),
+        ('Travel', 'travel', CURRENT_TIMESTAMP)
+        """
+    )
+
+
+@migration(3, "articles.artists")
+def _articles_artists(connection):
+    add_column(connection, "articles", "artists", "TEXT")
+
+
+@migration(4, "articles.content_type")
+def _articles_content_type(connection):
+    add_column(connection, "articles", "content_type", "VARCHAR DEFAULT 'post'")
+
+
+@migration(5, "backfill articles.content_type", batched=True)
+def _backfill_content_type(connection):
+    batched_update(connection, "0005_content_type", "articles", "content_type = 'post'", "content_type IS NULL")
+
+
+@migration(6, "articles.gallery_id")
+def _articles_gallery_id(connection):
+    add_column(connection, "articles", "gallery_id", "INTEGER")
+
+
+@migration(7, "articles.image_gallery")
+def _articles_image_gallery(connection):
+    add_column(connection, "articles", "image_gallery", "TEXT")
+
+
+@migration(8, "articles.movie_rating")
+def _articles_movie_rating(connection):
+    add_column(connection, "articles", "movie_rating", "TEXT DEFAULT NULL")
+
+
+@migration(9, "theater and OTT release language")
+def _release_language(connection):
+    for table in ("theater_releases", "ott_releases"):
+        add_column(connection, table, "language", "TEXT DEFAULT 'Hindi'")
+
+
+@migration(10, "indexes declared on the models")
+def _model_indexes(connection):
+    import models  # noqa: F401  registers the tables on Base.metadata
+    dialect = sqlite_dialect.dialect()
+    for table in Base.metadata.sorted_tables:
+        if not table_exists(connection, table.name):
+            continue
+        columns = set(column_names(connection, table.name))
+        for index in table.indexes:
+            if all(column.name in columns for column in index.columns):
+                connection.execute(str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect)))
+    for table in ("theater_releases", "ott_releases"):
+        if table_exists(connection, table):
+            connection.execute(f"ANALYZE {table}")
+
+
+@migration(11, "rename sports category to other sports")
+def _rename_sports_category(connection):
+    _rename_category(connection, "sports", "other-sports", "Other Sports",
+                     "Other sports news and updates beyond cricket")
+
+
+@migration(12, "move sports articles to other-sports", batched=True)
+def _move_sports_articles(connection):
+    _move_articles(connection, "0012_sports", "sports", "other-sports")
+
+
+@migration(13, "rename movie categories to movie news")
+def _rename_movie_categories(connection):
+    _rename_category(connection, "movies", "movie-news", "Movie News",
+                     "Movie news, updates and entertainment")
+    _rename_category(connection, "bollywood-movies", "movie-news-bollywood", "Movie News Bollywood",
+                     "Bollywood movie news and entertainment")
+
+
+@migration(14, "move movie articles to movie news categories", batched=True)
+def _move_movie_articles(connection):
+    _move_articles(connection, "0014_movies", "movies", "movie-news")
+    _move_articles(connection, "0014_bollywood_movies", "bollywood-movies", "movie-news-bollywood")
+
+
+@migration(15, "translation jobs table")
+def _translation_jobs(connection):
+    create_model_table(connection, "translation_jobs")
+
+
+@migration(16, "index articles by original article and language")
+def _article_language_variants(connection):
+    create_model_index(connection, "articles", "ix_articles_original_article_language")
+
+
+@migration(17, "related content state table")
+def _related_content_state(connection):
+    create_model_table(connection, "related_content_state")
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def connect(db_path=DB_PATH) -> sqlite3.Connection:
+    """Autocommit connection (transactions are explicit) with the bookkeeping tables in place"""
+    connection = sqlite3.connect(str(db_path), isolation_level=None, timeout=MIGRATION_BUSY_TIMEOUT_SECONDS)
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TEXT NOT NULL,
+            duration_ms REAL
+        )
+        """
+    )
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS migration_progress (
+            key TEXT PRIMARY KEY,
+            last_id INTEGER NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """
+    )
+    return connection
+
+
+def applied_versions(connection: sqlite3.Connection) -> Dict[int, str]:
+    return {version: applied_at for version, applied_at in connection.execute(
+        "SELECT version, applied_at FROM schema_version"
+    )}
+
+
+def pending(db_path=DB_PATH) -> List[Migration]:
+    """Migrations not yet applied to the database"""
+    connection = connect(db_path)
+    try:
+        applied = applied_versions(connection)
+    finally:
+        connection.close()
+    return [m for m in MIGRATIONS if m.version not in applied]
+
+
+def _record(connection: sqlite3.Connection, m: Migration, started: float):
+    connection.execute(
+        "INSERT INTO schema_version (version, name, applied_at, duration_ms) VALUES (?, ?, ?, ?)",
+        (m.version, m.name, datetime.utcnow().isoformat(), round((time.perf_counter() - started) * 1000, 1))
+    )
+
+
+def _apply(connection: sqlite3.Connection, m: Migration):
+    started = time.perf_counter()
+    if m.batched:
+        m.apply(connection)
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if connection.execute("SELECT 1 FROM schema_version WHERE version = ?", (m.version,)).fetchone() is None:
+                _record(connection, m, started)
+            prefix = f"{m.version:04d}_"
+            connection.execute("DELETE FROM migration_progress WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        return
+
+    # The write lock is taken up front so a concurrent runner waits here and then sees the version row
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        if connection.execute("SELECT 1 FROM schema_version WHERE version = ?", (m.version,)).fetchone() is None:
+            m.apply(connection)
+            _record(connection, m, started)
+        connection.execute("COMMIT")
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+
+
+def migrate(db_path=DB_PATH, target: Optional[int] = None) -> List[int]:
+    """Apply pending migrations up to `target` (default: all) in version order; returns the versions applied"""
+    connection = connect(db_path)
+    applied_now = []
+    try:
+        applied = applied_versions(connection)
+        for m in MIGRATIONS:
+            if m.version in applied or (target is not None and m.version > target):
+                continue
+            logger.info(f"Applying migration {m.version}: {m.name}")
+            started = time.perf_counter()
+            try:
+                _apply(connection, m)
+            except Exception as e:
+                logger.error(f"Migration {m.version} ({m.name}) failed: {str(e)}")
+                raise
+            applied_now.append(m.version)
+            logger.info(f"Migration {m.version} applied in {(time.perf_counter() - started) * 1000:.0f}ms")
+    finally:
+        connection.close()
+    return applied_now
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Blog CMS schema migrations")
+    parser.add_argument("command", choices=["status", "migrate"])
+    parser.add_argument("--db", default=str(DB_PATH), help="Database file (default: the app database)")
+    parser.add_argument("--target", type=int, default=None, help="Stop after this version")
+    parser.add_argument("--batch-size", type=int, default=None, help="Rows per batch in data migrations")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    global MIGRATION_BATCH_SIZE
+    if args.batch_size:
+        MIGRATION_BATCH_SIZE = args.batch_size
+    db_path = Path(args.db)
+
+    if args.command == "status":
+        connection = connect(db_path)
+        try:
+            applied = applied_versions(connection)
+            in_progress = dict(connection.execute("SELECT key, last_id FROM migration_progress").fetchall())
+        finally:
+            connection.close()
+        for m in MIGRATIONS:
+            state = f"applied {applied[m.version]}" if m.version in applied else "pending"
+            print(f"{m.version:4d}  {m.name:50s} {state}")
+        for key, last_id in in_progress.items():
+            print(f"      in progress: {key} after id {last_id}")
+        return 0
+
+    applied_now = migrate(db_path, target=args.target)
+    print(f"✅ Applied {len(applied_now)} migration(s)" + (f": {applied_now}" if applied_now else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
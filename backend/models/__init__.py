@@ -1,5 +1,5 @@
 # Import all database models
-from .database_models import Category, Article, MovieReview, FeaturedImage, SchedulerSettings, RelatedArticlesConfig, TheaterRelease, OTTRelease, Gallery, Topic
+from .database_models import Category, Article, MovieReview, FeaturedImage, SchedulerSettings, RelatedArticlesConfig, TheaterRelease, OTTRelease, Gallery, Topic, ArticleNeighbor, RelatedContentState, TranslationJob, article_related_videos
 
 # Import all auth models
 from .auth_models import RegisterRequest, LoginRequest, Token, UserResponse, UserInDB
@@ -16,6 +16,10 @@ __all__ = [
     'OTTRelease',
     'Gallery',
     'Topic',
+    'ArticleNeighbor',
+    'RelatedContentState',
+    'TranslationJob',
+    'article_related_videos',
     'RegisterRequest',
     'LoginRequest', 
     'Token',
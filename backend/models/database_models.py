@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Float, Date, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Float, Date, ForeignKey, Table, UniqueConstraint, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -20,6 +20,15 @@ gallery_topic_association = Table(
     Column('topic_id', Integer, ForeignKey('topics.id'), primary_key=True)
 )
 
+# Ordered association between articles and the video articles curated as related to them
+article_related_videos = Table(
+    'article_related_videos',
+    Base.metadata,
+    Column('article_id', Integer, ForeignKey('articles.id'), primary_key=True),
+    Column('video_id', Integer, ForeignKey('articles.id'), primary_key=True, index=True),
+    Column('position', Integer, nullable=False, default=0)
+)
+
 class Category(Base):
     __tablename__ = "categories"
 
@@ -69,6 +78,9 @@ class Article(Base):
     # Relationship with Gallery
     gallery = relationship("Gallery", foreign_keys=[gallery_id])
 
+    # Looks up the translations of a set of articles into one language
+    __table_args__ = (Index('ix_articles_original_article_language', 'original_article_id', 'language'),)
+
 class SchedulerSettings(Base):
     __tablename__ = "scheduler_settings"
 
@@ -126,7 +138,7 @@ class TheaterRelease(Base):
     movie_banner = Column(String)  # Text field, not file path
     movie_image = Column(String)   # Path to uploaded movie image
     language = Column(String, default="Hindi")  # Movie language
-    release_date = Column(Date, nullable=False)
+    release_date = Column(Date, nullable=False, index=True)
     created_by = Column(String)    # User who created this entry
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -139,7 +151,7 @@ class OTTRelease(Base):
     ott_platform = Column(String, nullable=False)  # Netflix, Prime Video, etc.
     movie_image = Column(String)   # Path to uploaded movie image
     language = Column(String, default="Hindi")  # Movie language
-    release_date = Column(Date, nullable=False)
+    release_date = Column(Date, nullable=False, index=True)
     created_by = Column(String)    # User who created this entry
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -184,4 +196,40 @@ class Gallery(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Many-to-many relationship with topics
-    topics = relationship("Topic", secondary=gallery_topic_association, back_populates="galleries")
\ No newline at end of file
+    topics = relationship("Topic", secondary=gallery_topic_association, back_populates="galleries")
+
+class ArticleNeighbor(Base):
+    __tablename__ = "article_neighbors"
+
+    # Precomputed content-similarity neighbours, rebuilt by the related content engine
+    article_id = Column(Integer, primary_key=True)
+    kind = Column(String, primary_key=True)  # 'article' or 'video'
+    rank = Column(Integer, primary_key=True)
+    neighbor_id = Column(Integer, nullable=False, index=True)
+    score = Column(Float, nullable=False)
+
+class RelatedContentState(Base):
+    __tablename__ = "related_content_state"
+
+    # Fingerprint of the published corpus the persisted neighbour lists were built from
+    name = Column(String, primary_key=True)
+    fingerprint = Column(String, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class TranslationJob(Base):
+    __tablename__ = "translation_jobs"
+    __table_args__ = (UniqueConstraint('original_article_id', 'language', name='uq_translation_jobs_article_language'),)
+
+    # One job per (article, target language); processed by the translation queue
+    id = Column(Integer, primary_key=True, index=True)
+    original_article_id = Column(Integer, ForeignKey('articles.id'), nullable=False)
+    language = Column(String, nullable=False)
+    status = Column(String, nullable=False, default="queued", index=True)  # queued, running, done, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    claim_token = Column(String)  # Set by the worker that claimed the job
+    available_at = Column(DateTime)  # Retry backoff: not claimed before this time
+    translated_article_id = Column(Integer)
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
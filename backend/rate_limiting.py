@@ -0,0 +1,191 @@
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+from fastapi import HTTPException, Request
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).parent
+
+RATE_LIMIT_ENABLED = os.environ.get("RATE_LIMIT_ENABLED", "true").lower() == "true"
+# "memory" keeps buckets per worker process; "sqlite" shares them between the workers on one host
+RATE_LIMIT_BACKEND = os.environ.get("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_DB_PATH = Path(os.environ.get("RATE_LIMIT_DB_PATH", ROOT_DIR / "rate_limits.db"))
+# Most idle clients the memory backend remembers; the least recently seen are dropped first
+RATE_LIMIT_MAX_CLIENTS = int(os.environ.get("RATE_LIMIT_MAX_CLIENTS", 100000))
+# The sqlite backend drops idle buckets after this many checks per connection
+RATE_LIMIT_PRUNE_EVERY = int(os.environ.get("RATE_LIMIT_PRUNE_EVERY", 1000))
+# Take the client address from X-Forwarded-For; only safe behind a proxy that sets it
+RATE_LIMIT_TRUST_FORWARDED_FOR = os.environ.get("RATE_LIMIT_TRUST_FORWARDED_FOR", "false").lower() == "true"
+
+
+class RateLimit:
+    """Token bucket refilled at per_minute tokens a minute, holding at most burst tokens"""
+
+    def __init__(self, per_minute: float, burst: int):
+        self.rate = per_minute / 60.0
+        self.burst = burst
+
+    @classmethod
+    def from_env(cls, route_class: str, per_minute: float, burst: int) -> "RateLimit":
+        prefix = f"RATE_LIMIT_{route_class.upper()}"
+        return cls(float(os.environ.get(f"{prefix}_PER_MINUTE", per_minute)),
+                   int(os.environ.get(f"{prefix}_BURST", burst)))
+
+
+# Limits per route class; endpoints opt in with Depends(rate_limiter.limit("<class>"))
+ROUTE_CLASSES: Dict[str, RateLimit] = {
+    # Full-table LIKE scans over article text
+    "search": RateLimit.from_env("search", per_minute=30, burst=10),
+}
+
+
+def _refill(tokens: float, updated: float, now: float, limit: RateLimit) -> float:
+    return min(limit.burst, tokens + max(0.0, now - updated) * limit.rate)
+
+
+def _take(tokens: float, limit: RateLimit) -> Tuple[float, float]:
+    """Tokens left after taking one, and seconds to wait when there was none to take"""
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / limit.rate if limit.rate > 0 else math.inf
+
+
+class MemoryBackend:
+    """Buckets in this process, bounded to the most recently seen clients"""
+
+    def __init__(self, max_clients: int = RATE_LIMIT_MAX_CLIENTS):
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, limit: RateLimit, now: float) -> float:
+        with self._lock:
+            state = self._buckets.pop(key, None)
+            tokens = limit.burst if state is None else _refill(state[0], state[1], now, limit)
+            tokens, retry_after = _take(tokens, limit)
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        return retry_after
+
+
+class SQLiteBackend:
+    """Buckets in a SQLite file shared by all worker processes on the host"""
+
+    def __init__(self, db_path: Path = RATE_LIMIT_DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(str(self.db_path), isolation_level=None, timeout=1.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            self._local.connection = connection
+        return connection
+
+    def take(self, key: str, limit: RateLimit, now: float) -> float:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens = limit.burst if row is None else _refill(row[0], row[1], now, limit)
+            tokens, retry_after = _take(tokens, limit)
+            connection.execute(
+                "INSERT INTO rate_limit_buckets (key, tokens, updated) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                (key, tokens, now)
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        self._local.takes = getattr(self._local, "takes", 0) + 1
+        if self._local.takes % RATE_LIMIT_PRUNE_EVERY == 0:
+            self.prune()
+        return retry_after
+
+    def prune(self, idle_seconds: float = 3600) -> int:
+        """Drop buckets untouched for idle_seconds; they would have refilled anyway"""
+        connection = self._connection()
+        cursor = connection.execute("DELETE FROM rate_limit_buckets WHERE updated < ?", (time.time() - idle_seconds,))
+        return cursor.rowcount
+
+
+def client_address(request: Request) -> str:
+    if RATE_LIMIT_TRUST_FORWARDED_FOR:
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            return forwarded_for.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+class RateLimiter:
+    """Token-bucket limits per client address and route class"""
+
+    def __init__(self, backend=None, route_classes: Dict[str, RateLimit] = ROUTE_CLASSES,
+                 enabled: bool = RATE_LIMIT_ENABLED):
+        self._backend = backend
+        self.route_classes = route_classes
+        self.enabled = enabled
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            self._backend = SQLiteBackend() if RATE_LIMIT_BACKEND == "sqlite" else MemoryBackend()
+            logger.info(f"Rate limiting with the {RATE_LIMIT_BACKEND} backend")
+        return self._backend
+
+    def set_backend(self, backend):
+        self._backend = backend
+
+    def check(self, route_class: str, client: str) -> float:
+        """Take a token for the client; returns 0 when allowed, else seconds until a token is available"""
+        limit = self.route_classes[route_class]
+        try:
+            # Wall-clock time, so buckets in a shared backend mean the same thing in every process
+            return self.backend.take(f"{route_class}:{client}", limit, time.time())
+        except Exception as e:
+            # A broken shared backend must not take the endpoints down with it
+            logger.warning(f"Rate limit check failed, allowing request: {str(e)}")
+            return 0.0
+
+    def limit(self, route_class: str) -> Callable[[Request], None]:
+        """Dependency rejecting requests over the route class limit with 429 and Retry-After"""
+        if route_class not in self.route_classes:
+            raise KeyError(f"Unknown rate limit route class '{route_class}'")
+
+        def dependency(request: Request):
+            if not self.enabled:
+                return
+            retry_after = self.check(route_class, client_address(request))
+            if retry_after > 0:
+                metrics.RATE_LIMITED_REQUESTS.inc((route_class,))
+                raise HTTPException(
+                    status_code=429,
+                    detail="Too many requests, please slow down",
+                    headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+                )
+
+        return dependency
+
+
+# Global rate limiter instance
+rate_limiter = RateLimiter()
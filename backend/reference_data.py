@@ -0,0 +1,132 @@
+import hashlib
+import json
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+import models
+
+logger = logging.getLogger(__name__)
+
+LANGUAGES = [
+    {"code": "en", "name": "English", "native_name": "English"},
+    {"code": "te", "name": "Telugu", "native_name": "తెలుగు"},
+    {"code": "hi", "name": "Hindi", "native_name": "हिन्दी"},
+    {"code": "ta", "name": "Tamil", "native_name": "தமிழ்"},
+    {"code": "kn", "name": "Kannada", "native_name": "ಕನ್ನಡ"},
+    {"code": "mr", "name": "Marathi", "native_name": "मराठी"},
+    {"code": "gu", "name": "Gujarati", "native_name": "ગુજરાતી"},
+    {"code": "bn", "name": "Bengali", "native_name": "বাংলা"},
+    {"code": "ml", "name": "Malayalam", "native_name": "മലയാളം"},
+    {"code": "pa", "name": "Punjabi", "native_name": "ਪੰਜਾਬੀ"},
+    {"code": "as", "name": "Assamese", "native_name": "অসমীয়া"},
+    {"code": "or", "name": "Odia", "native_name": "ଓଡ଼ିଆ"},
+    {"code": "kok", "name": "Konkani", "native_name": "कोंकणी"},
+    {"code": "mni", "name": "Manipuri", "native_name": "ꯃꯤꯇꯩꯂꯣꯟ"},
+    {"code": "ne", "name": "Nepali", "native_name": "नेपाली"},
+    {"code": "ur", "name": "Urdu", "native_name": "اردو"}
+]
+
+# 31 states/UTs - AP & Telangana split; "all" is the CMS "no filter" option
+STATES = [
+    {"code": "all", "name": "All States"},
+    {"code": "ap", "name": "Andhra Pradesh"},
+    {"code": "ar", "name": "Arunachal Pradesh"},
+    {"code": "as", "name": "Assam"},
+    {"code": "br", "name": "Bihar"},
+    {"code": "cg", "name": "Chhattisgarh"},
+    {"code": "dl", "name": "Delhi"},
+    {"code": "ga", "name": "Goa"},
+    {"code": "gj", "name": "Gujarat"},
+    {"code": "hr", "name": "Haryana"},
+    {"code": "hp", "name": "Himachal Pradesh"},
+    {"code": "jk", "name": "Jammu and Kashmir"},
+    {"code": "jh", "name": "Jharkhand"},
+    {"code": "ka", "name": "Karnataka"},
+    {"code": "kl", "name": "Kerala"},
+    {"code": "ld", "name": "Ladakh"},
+    {"code": "mp", "name": "Madhya Pradesh"},
+    {"code": "mh", "name": "Maharashtra"},
+    {"code": "mn", "name": "Manipur"},
+    {"code": "ml", "name": "Meghalaya"},
+    {"code": "mz", "name": "Mizoram"},
+    {"code": "nl", "name": "Nagaland"},
+    {"code": "or", "name": "Odisha"},
+    {"code": "pb", "name": "Punjab"},
+    {"code": "rj", "name": "Rajasthan"},
+    {"code": "sk", "name": "Sikkim"},
+    {"code": "tn", "name": "Tamil Nadu"},
+    {"code": "ts", "name": "Telangana"},
+    {"code": "tr", "name": "Tripura"},
+    {"code": "up", "name": "Uttar Pradesh"},
+    {"code": "uk", "name": "Uttarakhand"},
+    {"code": "wb", "name": "West Bengal"}
+]
+
+# Legacy state values still stored on older articles
+LEGACY_STATE_CODES = {
+    "AP & Telangana": "ap_ts"
+}
+
+LANGUAGE_BY_CODE: Dict[str, dict] = {language["code"]: language for language in LANGUAGES}
+STATE_CODE_BY_NAME: Dict[str, str] = {state["name"]: state["code"] for state in STATES if state["code"] != "all"}
+STATE_NAME_BY_CODE: Dict[str, str] = {state["code"]: state["name"] for state in STATES if state["code"] != "all"}
+
+
+def state_codes_from_names(names: str) -> List[str]:
+    """Convert a comma-separated list of state names to codes, skipping unknown names"""
+    codes = []
+    for name in names.split(','):
+        code = STATE_CODE_BY_NAME.get(name.strip())
+        if code:
+            codes.append(code)
+    return codes
+
+
+def state_code_for(name: str) -> str:
+    """Map a CMS state name (including legacy values) to its code, falling back to the lowercased name"""
+    return STATE_CODE_BY_NAME.get(name) or LEGACY_STATE_CODES.get(name) or name.lower()
+
+
+class ReferenceDataRegistry:
+    """Holds category reference data and the pre-serialized CMS config response"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.categories: List[dict] = []
+        self.category_by_slug: Dict[str, dict] = {}
+        self.cms_config_body: Optional[bytes] = None
+        self.cms_config_etag: Optional[str] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.cms_config_body is not None
+
+    def refresh_categories(self, db: Session):
+        """Reload categories and rebuild the CMS config payload"""
+        categories = [
+            {"id": cat.id, "name": cat.name, "slug": cat.slug, "description": cat.description}
+            for cat in db.query(models.Category).order_by(models.Category.id).all()
+        ]
+        body = json.dumps(
+            {"languages": LANGUAGES, "states": STATES, "categories": categories},
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        with self._lock:
+            self.categories = categories
+            self.category_by_slug = {cat["slug"]: cat for cat in categories}
+            self.cms_config_body = body
+            self.cms_config_etag = etag
+        logger.info(f"Reference data loaded ({len(categories)} categories)")
+
+    def ensure_loaded(self, db: Session):
+        if not self.loaded:
+            self.refresh_categories(db)
+
+
+# Global reference data registry
+reference_data = ReferenceDataRegistry()
@@ -0,0 +1,421 @@
+import heapq
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict, namedtuple
+from operator import itemgetter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy import delete, func, insert
+
+import models
+from database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+RELATED_TOP_K = int(os.environ.get("RELATED_TOP_K", 12))
+RELATED_REFRESH_INTERVAL_SECONDS = int(os.environ.get("RELATED_REFRESH_INTERVAL_SECONDS", 30))
+# Incremental updates keep the IDF weights of the last full rebuild, so rebuild periodically
+RELATED_REBUILD_INTERVAL_HOURS = int(os.environ.get("RELATED_REBUILD_INTERVAL_HOURS", 24))
+RELATED_MIN_SCORE = 0.05
+RELATED_STATE_NAME = "corpus"
+# Terms present in more than this share of articles carry no signal and are dropped
+RELATED_MAX_DF_RATIO = 0.3
+
+# Field weights applied to raw term counts before TF-IDF
+TITLE_WEIGHT = 2.0
+SUMMARY_WEIGHT = 1.0
+TAG_WEIGHT = 2.0
+ARTIST_WEIGHT = 3.0
+CATEGORY_WEIGHT = 1.0
+
+# Latin words plus the Indic blocks, whose vowel signs are not matched by \w
+TOKEN_PATTERN = re.compile(r"[\w\u0900-\u0DFF]+")
+STOPWORDS = frozenset("""
+    a about after all also an and are as at be been but by for from has have he her his in into is it its
+    new not of on or over says she that the their they this to up was were what when who will with you your
+""".split())
+
+_Doc = namedtuple("_Doc", "terms language is_video")
+
+
+def _parse_artists(artists: Optional[str]) -> List[str]:
+    if not artists:
+        return []
+    try:
+        parsed = json.loads(artists)
+    except (TypeError, ValueError):
+        return []
+    return [str(artist) for artist in parsed if artist] if isinstance(parsed, list) else []
+
+
+def article_terms(title: Optional[str], summary: Optional[str], tags: Optional[str],
+                  artists: Optional[str], category: Optional[str]) -> Dict[str, float]:
+    """Weighted bag of words over the fields that describe what an article is about"""
+    terms = Counter()
+    for text, weight in ((title, TITLE_WEIGHT), (summary, SUMMARY_WEIGHT)):
+        for token in TOKEN_PATTERN.findall((text or "").lower()):
+            if len(token) > 1 and token not in STOPWORDS and not token.isdigit():
+                terms[token] += weight
+    for tag in (tags or "").split(','):
+        tag = tag.strip().lower()
+        if tag:
+            terms[f"tag:{tag}"] += TAG_WEIGHT
+    for artist in _parse_artists(artists):
+        terms[f"artist:{artist.strip().lower()}"] += ARTIST_WEIGHT
+    if category:
+        terms[f"category:{category}"] += CATEGORY_WEIGHT
+    return dict(terms)
+
+
+class RelatedContentEngine:
+    """Precomputes the top-K most similar articles per article from sparse TF-IDF vectors"""
+
+    def __init__(self, top_k: int = RELATED_TOP_K):
+        self.top_k = top_k
+        self.scheduler = BackgroundScheduler()
+        self.job_id = "refresh_related_content"
+        self.rebuild_job_id = "rebuild_related_content"
+        self._build_lock = threading.Lock()
+        self._dirty_lock = threading.Lock()
+        self._dirty: Set[int] = set()
+        # Served lists: article id -> [(neighbor id, score)], best first
+        self.neighbors: Dict[int, List[Tuple[int, float]]] = {}
+        self.video_neighbors: Dict[int, List[Tuple[int, float]]] = {}
+        # Model state, only touched while holding _build_lock
+        self._docs: Dict[int, _Doc] = {}
+        self._df: Counter = Counter()
+        self._vectors: Dict[int, Dict[str, float]] = {}
+        # Inverted index partitioned by language: (language, term) -> {article id: weight}
+        self._postings: Dict[Tuple[str, str], Dict[int, float]] = defaultdict(dict)
+        self._model_ready = False
+        # Corpus fingerprint stored with the neighbour lists restored by load()
+        self._loaded_fingerprint = None
+        self.last_rebuild_at = None
+        self.last_rebuild_duration = None
+        self.last_refresh_at = None
+
+    # Serving
+
+    def related(self, article_id: int, limit: int = 6) -> List[Tuple[int, float]]:
+        """Most similar published articles as (article id, score), best first"""
+        return self.neighbors.get(article_id, [])[:limit]
+
+    def related_videos(self, article_id: int, limit: int = 6) -> List[Tuple[int, float]]:
+        """Most similar published video articles as (article id, score), best first"""
+        return self.video_neighbors.get(article_id, [])[:limit]
+
+    def on_articles_changed(self, article_ids: Set[int]):
+        """content_events subscriber: queue articles for the next incremental refresh"""
+        with self._dirty_lock:
+            self._dirty.update(article_ids)
+
+    # Model building
+
+    def _load_docs(self, db, article_ids: Optional[Iterable[int]] = None) -> Dict[int, _Doc]:
+        article = models.Article
+        query = db.query(
+            article.id, article.title, article.summary, article.tags, article.artists,
+            article.category, article.language, article.youtube_url
+        ).filter(article.is_published == True)
+        if article_ids is not None:
+            query = query.filter(article.id.in_(list(article_ids)))
+        return {
+            row.id: _Doc(
+                article_terms(row.title, row.summary, row.tags, row.artists, row.category),
+                row.language or "en",
+                bool(row.youtube_url)
+            )
+            for row in query.yield_per(1000)
+        }
+
+    def _fingerprint(self, db) -> str:
+        """Cheap summary of the published corpus; changes whenever an article is added, edited or removed"""
+        article = models.Article
+        count, max_id, last_update = db.query(
+            func.count(article.id), func.max(article.id), func.max(article.updated_at)
+        ).filter(article.is_published == True).one()
+        return f"{count}:{max_id}:{last_update}"
+
+    def _vectorize(self, terms: Dict[str, float]) -> Dict[str, float]:
+        total = len(self._docs)
+        max_df = max(2, RELATED_MAX_DF_RATIO * total)
+        vector = {}
+        for term, weight in terms.items():
+            df = self._df.get(term, 0)
+            if df > max_df:
+                continue
+            vector[term] = (1 + math.log(weight)) * (math.log((1 + total) / (1 + df)) + 1)
+        norm = math.sqrt(sum(value * value for value in vector.values()))
+        return {term: value / norm for term, value in vector.items()} if norm else {}
+
+    def _index(self, article_id: int):
+        doc = self._docs[article_id]
+        vector = self._vectorize(doc.terms)
+        self._vectors[article_id] = vector
+        for term, weight in vector.items():
+            self._postings[(doc.language, term)][article_id] = weight
+
+    def _unindex(self, article_id: int, language: str):
+        for term in self._vectors.pop(article_id, {}):
+            postings = self._postings.get((language, term))
+            if postings is not None:
+                postings.pop(article_id, None)
+                if not postings:
+                    del self._postings[(language, term)]
+
+    def _similarities(self, article_id: int) -> Dict[int, float]:
+        """Cosine similarity to every same-language article sharing a term, via the inverted index"""
+        language = self._docs[article_id].language
+        postings = self._postings
+        scores = {}
+        get = scores.get
+        for term, weight in self._vectors.get(article_id, {}).items():
+            for other_id, other_weight in postings[(language, term)].items():
+                scores[other_id] = get(other_id, 0.0) + weight * other_weight
+        scores.pop(article_id, None)
+        return scores
+
+    def _top(self, scores: Dict[int, float], videos_only: bool) -> List[Tuple[int, float]]:
+        candidates = scores.items()
+        if videos_only:
+            docs = self._docs
+            candidates = ((other_id, score) for other_id, score in candidates if docs[other_id].is_video)
+        ranked = heapq.nlargest(self.top_k, candidates, key=itemgetter(1))
+        return [(other_id, round(score, 4)) for other_id, score in ranked if score >= RELATED_MIN_SCORE]
+
+    def _compute(self, article_id: int, neighbors: dict, video_neighbors: dict) -> Dict[int, float]:
+        scores = self._similarities(article_id)
+        neighbors[article_id] = self._top(scores, videos_only=False)
+        video_neighbors[article_id] = self._top(scores, videos_only=True)
+        return scores
+
+    def _offer(self, lists: dict, article_id: int, candidate_id: int, score: float) -> bool:
+        """Insert candidate into article_id's list if it ranks in the top K"""
+        current = lists.get(article_id, [])
+        if len(current) >= self.top_k and score <= current[-1][1]:
+            return False
+        current = [entry for entry in current if entry[0] != candidate_id]
+        current.append((candidate_id, round(score, 4)))
+        current.sort(key=lambda entry: -entry[1])
+        lists[article_id] = current[:self.top_k]
+        return True
+
+    def rebuild(self) -> int:
+        """Recompute IDF, vectors and every neighbour list from the published articles"""
+        with self._build_lock:
+            started = time.perf_counter()
+            with self._dirty_lock:
+                self._dirty.clear()
+            db = SessionLocal()
+            try:
+                self._docs = self._load_docs(db)
+                fingerprint = self._fingerprint(db)
+            finally:
+                db.close()
+            self._df = Counter(term for doc in self._docs.values() for term in doc.terms)
+            self._vectors = {}
+            self._postings = defaultdict(dict)
+            for article_id in self._docs:
+                self._index(article_id)
+
+            neighbors, video_neighbors = {}, {}
+            for article_id in self._docs:
+                self._compute(article_id, neighbors, video_neighbors)
+            self.neighbors, self.video_neighbors = neighbors, video_neighbors
+            self._model_ready = True
+            self._persist(None, fingerprint)
+            self.last_rebuild_at = time.time()
+            self.last_rebuild_duration = time.perf_counter() - started
+            logger.info(f"Related content rebuilt for {len(self._docs)} articles in {self.last_rebuild_duration:.2f}s")
+            return len(self._docs)
+
+    def refresh(self) -> int:
+        """Apply queued article changes without touching unaffected neighbour lists"""
+        if not self._dirty:
+            return 0
+        if not self._model_ready:
+            # Lists restored at boot have no model behind them; build it on the first change
+            return self.rebuild()
+        with self._build_lock:
+            with self._dirty_lock:
+                dirty, self._dirty = self._dirty, set()
+            db = SessionLocal()
+            try:
+                docs = self._load_docs(db, dirty)
+                fingerprint = self._fingerprint(db)
+            finally:
+                db.close()
+
+            for article_id in dirty:
+                old = self._docs.pop(article_id, None)
+                if old is not None:
+                    self._df.subtract(old.terms.keys())
+                    self._unindex(article_id, old.language)
+            for article_id, doc in docs.items():
+                self._docs[article_id] = doc
+                self._df.update(doc.terms.keys())
+            for article_id in docs:
+                self._index(article_id)
+
+            neighbors = dict(self.neighbors)
+            video_neighbors = dict(self.video_neighbors)
+            for article_id in dirty - docs.keys():
+                neighbors.pop(article_id, None)
+                video_neighbors.pop(article_id, None)
+            # Lists that pointed at a changed article may hold a stale score or a removed id
+            affected = {
+                article_id for article_id, entries in neighbors.items()
+                if article_id not in dirty and any(entry[0] in dirty for entry in entries)
+            }
+            affected.update(
+                article_id for article_id, entries in video_neighbors.items()
+                if article_id not in dirty and any(entry[0] in dirty for entry in entries)
+            )
+            changed = set(dirty) | affected
+            for article_id in affected:
+                self._compute(article_id, neighbors, video_neighbors)
+            for article_id, doc in docs.items():
+                scores = self._compute(article_id, neighbors, video_neighbors)
+                # The changed article may now belong in other articles' lists
+                for other_id, score in scores.items():
+                    if score < RELATED_MIN_SCORE or other_id in changed:
+                        continue
+                    if self._offer(neighbors, other_id, article_id, score):
+                        changed.add(other_id)
+                    if doc.is_video and self._offer(video_neighbors, other_id, article_id, score):
+                        changed.add(other_id)
+
+            self.neighbors, self.video_neighbors = neighbors, video_neighbors
+            self._persist(changed, fingerprint)
+            self.last_refresh_at = time.time()
+            logger.info(f"Related content refreshed {len(dirty)} articles, {len(changed)} lists updated")
+            return len(changed)
+
+    # Persistence
+
+    def _persist(self, article_ids: Optional[Set[int]], fingerprint: str):
+        """Write neighbour lists for the given articles (all when None) and the corpus fingerprint"""
+        table = models.ArticleNeighbor.__table__
+        ids = self.neighbors.keys() | self.video_neighbors.keys() if article_ids is None else article_ids
+        rows = []
+        for article_id in ids:
+            for kind, lists in (("article", self.neighbors), ("video", self.video_neighbors)):
+                for rank, (neighbor_id, score) in enumerate(lists.get(article_id, [])):
+                    rows.append({
+                        "article_id": article_id, "kind": kind, "rank": rank,
+                        "neighbor_id": neighbor_id, "score": score
+                    })
+        db = SessionLocal()
+        try:
+            if article_ids is None:
+                db.execute(delete(table))
+            else:
+                id_list = list(article_ids)
+                for start in range(0, len(id_list), 500):
+                    db.execute(delete(table).where(table.c.article_id.in_(id_list[start:start + 500])))
+            if rows:
+                db.execute(insert(table), rows)
+            db.merge(models.RelatedContentState(name=RELATED_STATE_NAME, fingerprint=fingerprint))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to persist related content: {str(e)}")
+        finally:
+            db.close()
+
+    def load(self) -> int:
+        """Serve neighbour lists persisted by a previous run until the model is rebuilt"""
+        table = models.ArticleNeighbor.__table__
+        neighbors, video_neighbors = defaultdict(list), defaultdict(list)
+        db = SessionLocal()
+        try:
+            rows = db.execute(
+                table.select().order_by(table.c.article_id, table.c.kind, table.c.rank)
+            ).all()
+            state = db.get(models.RelatedContentState, RELATED_STATE_NAME)
+            self._loaded_fingerprint = state.fingerprint if state else None
+        except Exception as e:
+            logger.error(f"Failed to load related content: {str(e)}")
+            return 0
+        finally:
+            db.close()
+        for row in rows:
+            lists = neighbors if row.kind == "article" else video_neighbors
+            lists[row.article_id].append((row.neighbor_id, row.score))
+        self.neighbors, self.video_neighbors = dict(neighbors), dict(video_neighbors)
+        return len(self.neighbors)
+
+    def stats(self) -> dict:
+        return {
+            "articles": len(self.neighbors),
+            "terms": len(self._postings),
+            "model_ready": self._model_ready,
+            "pending": len(self._dirty),
+            "last_rebuild_at": self.last_rebuild_at,
+            "last_rebuild_duration_seconds": self.last_rebuild_duration,
+            "last_refresh_at": self.last_refresh_at
+        }
+
+    def is_current(self) -> bool:
+        """Whether the lists restored by load() were built from the corpus as it is now"""
+        if self._loaded_fingerprint is None:
+            return False
+        db = SessionLocal()
+        try:
+            return self._fingerprint(db) == self._loaded_fingerprint
+        except Exception as e:
+            logger.error(f"Failed to fingerprint related content corpus: {str(e)}")
+            return False
+        finally:
+            db.close()
+
+    def start(self, interval_seconds: int = RELATED_REFRESH_INTERVAL_SECONDS):
+        """Serve persisted lists right away; rebuild in the background only when they are stale"""
+        loaded = self.load()
+        first_rebuild = {"next_run_time": datetime.now()}
+        if loaded:
+            logger.info(f"Loaded related content for {loaded} articles")
+            if self.is_current():
+                # The model is built on the first article change instead
+                logger.info("Persisted related content is current, skipping the boot rebuild")
+                first_rebuild = {}
+        self.scheduler.add_job(
+            func=self.rebuild,
+            trigger=IntervalTrigger(hours=RELATED_REBUILD_INTERVAL_HOURS),
+            id=self.rebuild_job_id,
+            name="Rebuild related content",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            **first_rebuild
+        )
+        self.scheduler.add_job(
+            func=self.refresh,
+            trigger=IntervalTrigger(seconds=interval_seconds),
+            id=self.job_id,
+            name="Refresh related content",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
+        if not self.scheduler.running:
+            self.scheduler.start()
+            logger.info("Related content engine started")
+
+    def stop(self):
+        """Stop the refresh and rebuild jobs"""
+        if self.scheduler.running:
+            self.scheduler.shutdown()
+            logger.info("Related content engine stopped")
+
+
+# Global related content engine instance
+related_content = RelatedContentEngine()
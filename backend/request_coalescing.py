@@ -0,0 +1,55 @@
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def request_key(request: Request) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Path plus sorted query parameters; identical requests in any parameter order share a key"""
+    return request.url.path, tuple(sorted(request.query_params.multi_items()))
+
+
+class SingleFlight:
+    """Concurrent calls with the same key share one run of a blocking function.
+
+    The first caller starts the function on the thread pool; callers arriving
+    while it runs wait for the same result (or exception) instead of starting
+    their own. Nothing is cached once the run finishes. Results are shared
+    between requests, so they must not be mutated by the caller.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, func: Callable[..., Any], *args) -> Any:
+        task = self._in_flight.get(key)
+        if task is None:
+            # A task of its own, so a leader whose client disconnects does not cancel the followers
+            task = asyncio.ensure_future(run_in_threadpool(func, *args))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+            metrics.COALESCED_REQUESTS.inc((self.name, "leader"))
+        else:
+            metrics.COALESCED_REQUESTS.inc((self.name, "follower"))
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Future):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled() and task.exception() is not None:
+            # Retrieved here so a run whose callers all went away is not reported as never retrieved
+            logger.debug(f"{self.name} run for {key} failed: {task.exception()!r}")
+
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+
+# Global coalescer for expensive public read endpoints
+request_coalescer = SingleFlight("public_reads")
@@ -6,7 +6,7 @@ from auth import (
     authenticate_user,
     create_access_token,
     get_password_hash,
-    users_collection,
+    get_users_collection,
     get_current_active_user,
     require_admin,
     ACCESS_TOKEN_EXPIRE_MINUTES
@@ -25,7 +25,7 @@ async def register_user(user_data: RegisterRequest):
         )
     
     # Check if username already exists
-    existing_user = await users_collection.find_one({"username": user_data.username})
+    existing_user = await get_users_collection().find_one({"username": user_data.username})
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -43,7 +43,7 @@ async def register_user(user_data: RegisterRequest):
         "is_active": True
     }
     
-    result = await users_collection.insert_one(user_doc)
+    result = await get_users_collection().insert_one(user_doc)
     if result.inserted_id:
         return {
             "message": "User registered successfully",
@@ -93,7 +93,7 @@ async def get_current_user_info(current_user: UserResponse = Depends(get_current
 async def get_all_users(current_user: UserResponse = Depends(require_admin)):
     """Get all users (Admin only)"""
     users = []
-    async for user in users_collection.find({}, {"hashed_password": 0, "password": 0}):
+    async for user in get_users_collection().find({}, {"hashed_password": 0, "password": 0}):
         user["_id"] = str(user["_id"])
         users.append(user)
     return users
@@ -112,7 +112,7 @@ async def update_user_role(
             detail="Invalid role specified"
         )
     
-    result = await users_collection.update_one(
+    result = await get_users_collection().update_one(
         {"username": username},
         {"$set": {"roles": new_roles}}
     )
@@ -137,7 +137,7 @@ async def delete_user(
             detail="Cannot delete admin user"
         )
     
-    result = await users_collection.delete_one({"username": username})
+    result = await get_users_collection().delete_one({"username": username})
     if result.deleted_count == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, desc, asc
 from typing import List, Optional
@@ -8,8 +8,11 @@ import uuid
 from datetime import datetime
 from pydantic import BaseModel
 import re
+import json
 
 from database import get_db
+import metrics
+from json_responses import ndjson_response, MAX_PAGE_SIZE
 from models.database_models import Topic, TopicCategory, Article, article_topic_association, Gallery, gallery_topic_association
 
 router = APIRouter()
@@ -333,8 +336,9 @@ async def upload_topic_image(
     
     # Save file
     try:
-        with open(file_path, "wb") as buffer:
+        with metrics.UPLOAD_DURATION.time(("topics",)), open(file_path, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
+            metrics.UPLOAD_BYTES.inc(("topics",), buffer.tell())
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Could not save file: {e}")
     
@@ -658,41 +662,45 @@ async def get_gallery_topics(gallery_id: int, db: Session = Depends(get_db)):
     return result
 
 @router.get("/topics/{topic_id}/galleries")
-async def get_topic_galleries(topic_id: int, db: Session = Depends(get_db)):
-    """Get all galleries associated with a topic"""
+async def get_topic_galleries(
+    topic_id: int,
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    output: str = Query("json", alias="format", pattern="^(json|ndjson)$"),
+    db: Session = Depends(get_db)
+):
+    """Get galleries associated with a topic, a page at a time or streamed with format=ndjson"""
     
     # Verify topic exists
     topic = db.query(Topic).filter(Topic.id == topic_id).first()
     if not topic:
         raise HTTPException(status_code=404, detail="Topic not found")
     
-    # Get galleries through association table with JSON parsing
-    galleries = db.query(Gallery).join(
+    if output == "ndjson":
+        return ndjson_response(lambda stream_db: _topic_galleries_query(stream_db, topic_id, skip, limit),
+                               _topic_gallery_item)
+    galleries = _topic_galleries_query(db, topic_id, skip, limit or MAX_PAGE_SIZE).all()
+    return [_topic_gallery_item(gallery) for gallery in galleries]
+
+def _topic_galleries_query(db: Session, topic_id: int, skip: int = 0, limit: Optional[int] = None):
+    # Get galleries through association table
+    query = db.query(Gallery).join(
         gallery_topic_association,
         Gallery.id == gallery_topic_association.c.gallery_id
     ).filter(
         gallery_topic_association.c.topic_id == topic_id
-    ).order_by(Gallery.created_at.desc()).all()
-    
-    # Format response to match frontend expectations
-    result = []
-    for gallery in galleries:
-        import json
-        
-        # Parse JSON fields
-        artists = json.loads(gallery.artists) if gallery.artists else []
-        images = json.loads(gallery.images) if gallery.images else []
-        
-        gallery_dict = {
-            "id": gallery.id,
-            "gallery_id": gallery.gallery_id,
-            "title": gallery.title,
-            "artists": artists,
-            "images": images,
-            "gallery_type": gallery.gallery_type,
-            "created_at": gallery.created_at,
-            "updated_at": gallery.updated_at
-        }
-        result.append(gallery_dict)
-    
-    return result
\ No newline at end of file
+    ).order_by(Gallery.created_at.desc(), Gallery.id.desc()).offset(skip)
+    return query.limit(limit) if limit else query
+
+def _topic_gallery_item(gallery):
+    """Gallery with its JSON fields parsed, shaped as the frontend expects"""
+    return {
+        "id": gallery.id,
+        "gallery_id": gallery.gallery_id,
+        "title": gallery.title,
+        "artists": json.loads(gallery.artists) if gallery.artists else [],
+        "images": json.loads(gallery.images) if gallery.images else [],
+        "gallery_type": gallery.gallery_type,
+        "created_at": gallery.created_at,
+        "updated_at": gallery.updated_at
+    }
\ No newline at end of file
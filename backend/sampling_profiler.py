@@ -0,0 +1,130 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MAX_SECONDS = float(os.environ.get("PROFILE_MAX_SECONDS", 60))
+PROFILE_DEFAULT_INTERVAL_MS = float(os.environ.get("PROFILE_DEFAULT_INTERVAL_MS", 10))
+PROFILE_MIN_INTERVAL_MS = 1.0
+# Hard cap on the share of wall time the sampler may spend walking stacks;
+# the interval is stretched whenever sampling gets more expensive than this
+PROFILE_MAX_OVERHEAD = float(os.environ.get("PROFILE_MAX_OVERHEAD", 0.02))
+PROFILE_MAX_STACK_DEPTH = 128
+# Leaf frames of threads that are parked rather than doing work
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+}
+
+
+class ProfilerBusyError(Exception):
+    """Raised when a profile is requested while another one is running"""
+
+
+def _frame_label(code) -> str:
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """Statistical profiler that periodically samples the stacks of every thread in this worker"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.route_codes: Dict[Any, str] = {}
+        self.last_profile: Optional[Dict[str, Any]] = None
+
+    def configure_routes(self, routes: Iterable):
+        """Map endpoint code objects to route templates so samples can be attributed to routes"""
+        route_codes = {}
+        for route in routes:
+            endpoint = getattr(route, "endpoint", None)
+            code = getattr(endpoint, "__code__", None)
+            if code is not None and hasattr(route, "path"):
+                route_codes[code] = f"{','.join(sorted(getattr(route, 'methods', None) or []))} {route.path}".strip()
+        self.route_codes = route_codes
+
+    def _sample(self, own_thread_id: int, stacks: Counter, routes: Counter, include_idle: bool) -> int:
+        sampled = 0
+        route_codes = self.route_codes
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread_id:
+                continue
+            leaf = frame.f_code
+            if not include_idle and (os.path.basename(leaf.co_filename), leaf.co_name) in IDLE_FRAMES:
+                continue
+            labels = []
+            route = None
+            depth = 0
+            while frame is not None and depth < PROFILE_MAX_STACK_DEPTH:
+                code = frame.f_code
+                labels.append(_frame_label(code))
+                if route is None:
+                    route = route_codes.get(code)
+                frame = frame.f_back
+                depth += 1
+            labels.reverse()
+            stacks[";".join(labels)] += 1
+            routes[route or "(no route)"] += 1
+            sampled += 1
+        return sampled
+
+    def profile(self, seconds: float, interval_ms: float = PROFILE_DEFAULT_INTERVAL_MS,
+                include_idle: bool = False) -> Dict[str, Any]:
+        """Sample all threads for `seconds` and return collapsed stacks with per-route totals"""
+        seconds = max(0.1, min(seconds, PROFILE_MAX_SECONDS))
+        interval = max(PROFILE_MIN_INTERVAL_MS, interval_ms) / 1000
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running on this worker")
+        try:
+            own_thread_id = threading.get_ident()
+            stacks, routes = Counter(), Counter()
+            samples = ticks = 0
+            sampling_time = 0.0
+            started = time.perf_counter()
+            deadline = started + seconds
+            while True:
+                now = time.perf_counter()
+                if now >= deadline:
+                    break
+                samples += self._sample(own_thread_id, stacks, routes, include_idle)
+                ticks += 1
+                cost = time.perf_counter() - now
+                sampling_time += cost
+                # Sleep long enough that sampling stays under the overhead cap
+                time.sleep(max(interval, cost / PROFILE_MAX_OVERHEAD - cost))
+            elapsed = time.perf_counter() - started
+        finally:
+            self._lock.release()
+
+        self_time = Counter()
+        for stack, count in stacks.items():
+            self_time[stack.rsplit(";", 1)[-1]] += count
+        result = {
+            "duration_seconds": round(elapsed, 3),
+            "interval_ms": interval * 1000,
+            "ticks": ticks,
+            "samples": samples,
+            "overhead": round(sampling_time / elapsed, 4) if elapsed else 0.0,
+            "routes": dict(routes.most_common()),
+            "top_functions": [
+                {"function": function, "samples": count, "share": round(count / samples, 4)}
+                for function, count in self_time.most_common(25)
+            ] if samples else [],
+            "collapsed": "\n".join(f"{stack} {count}" for stack, count in stacks.most_common())
+        }
+        self.last_profile = {key: value for key, value in result.items() if key != "collapsed"}
+        logger.info(
+            f"Profiled {elapsed:.1f}s: {samples} samples in {ticks} ticks, overhead {result['overhead']:.2%}"
+        )
+        return result
+
+
+# Global sampling profiler instance
+sampling_profiler = SamplingProfiler()
@@ -1,4 +1,5 @@
 import logging
+import time
 from datetime import datetime
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -6,6 +7,7 @@ from pytz import timezone
 from sqlalchemy.orm import Session
 from database import SessionLocal
 import crud
+import metrics
 import schemas
 from models.database_models import SchedulerSettings
 
@@ -21,6 +23,12 @@ class ArticleSchedulerService:
         
     def check_and_publish_scheduled_articles(self):
         """Check for scheduled articles that need to be published"""
+        labels = (self.job_id,)
+        with metrics.SCHEDULER_RUN_DURATION.time(labels):
+            self._publish_scheduled_articles()
+        metrics.SCHEDULER_LAST_RUN.set(time.time(), labels)
+    
+    def _publish_scheduled_articles(self):
         db: Session = SessionLocal()
         try:
             # Get scheduler settings
@@ -48,6 +56,7 @@ class ArticleSchedulerService:
                 except Exception as e:
                     logger.error(f"Failed to publish scheduled article {article.id}: {str(e)}")
             
+            metrics.SCHEDULER_ARTICLES_PUBLISHED.inc(amount=published_count)
             logger.info(f"Published {published_count} scheduled articles")
             
         except Exception as e:
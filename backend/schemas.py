@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, date
 
 # Category Schemas
@@ -81,6 +81,7 @@ class ArticleResponse(ArticleBase):
     updated_at: datetime
     published_at: Optional[datetime] = None
     gallery: Optional[dict] = None  # Add gallery field for formatted response
+    related_videos: Optional[List[dict]] = None  # Related video cards on the article detail page
 
     class Config:
         from_attributes = True
@@ -228,6 +229,30 @@ class TranslationRequest(BaseModel):
     article_id: int
     target_language: str
 
+class TranslationBatchRequest(BaseModel):
+    languages: Optional[List[str]] = None  # None queues every supported language
+
+class TranslationJobResponse(BaseModel):
+    language: str
+    status: str  # queued, running, done, failed
+    attempts: int
+    translated_article_id: Optional[int] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class TranslationProgressResponse(BaseModel):
+    article_id: int
+    total: int
+    counts: Dict[str, int]
+    complete: bool
+    jobs: List[TranslationJobResponse]
+    queued: Optional[List[str]] = None
+    deduplicated: Optional[List[str]] = None
+
+class RelatedVideosUpdate(BaseModel):
+    related_videos: List[int] = []
+
 # Language and State models for CMS
 class LanguageOption(BaseModel):
     code: str
@@ -3,69 +3,70 @@ import models
 from datetime import datetime, timedelta
 import random
 
+# Seed Categories - Updated to match frontend structure
+CATEGORIES = [
+    # Core sections
+    {"name": "Latest News", "slug": "latest-news", "description": "Breaking news and current affairs"},
+    {"name": "Politics", "slug": "politics", "description": "Political news and government updates"},
+    {"name": "National Top Stories", "slug": "national-top-stories", "description": "National news and top stories"},
+    {"name": "Movies", "slug": "movies", "description": "Movie news, updates and entertainment"},
+    {"name": "AI", "slug": "ai", "description": "Artificial Intelligence and technology news"},
+    {"name": "Stock Market", "slug": "stock-market", "description": "Stock market and financial news"},
+    {"name": "Sports", "slug": "sports", "description": "Sports news and updates"},
+    {"name": "Trending Videos", "slug": "trending-videos", "description": "Trending video content"},
+
+    {"name": "Travel Pics", "slug": "travel-pics", "description": "Travel photography and destinations"},
+    {"name": "Fashion", "slug": "fashion", "description": "Fashion trends and style updates"},
+
+    # Movie Reviews Section (with unique categories)
+    {"name": "Movie Reviews", "slug": "movie-reviews", "description": "General movie reviews and critiques"},
+    {"name": "Movie Reviews Bollywood", "slug": "movie-reviews-bollywood", "description": "Bollywood movie reviews and critiques"},
+
+    # Row4 - Trailers & Teasers, Box Office, Theater Releases
+    {"name": "Trailers Teasers", "slug": "trailers-teasers", "description": "Movie trailers and teasers"},
+    {"name": "Trailers Teasers Bollywood", "slug": "trailers-teasers-bollywood", "description": "Bollywood trailers and teasers"},
+    {"name": "Box Office", "slug": "box-office", "description": "Box office collections and reports"},
+    {"name": "Box Office Bollywood", "slug": "box-office-bollywood", "description": "Bollywood box office collections"},
+    {"name": "Theater Releases", "slug": "theater-releases", "description": "Theater movie releases"},
+    {"name": "Theater Releases Bollywood", "slug": "theater-releases-bollywood", "description": "Bollywood theater releases"},
+
+    # OTT Reviews Section  
+    {"name": "OTT Reviews", "slug": "ott-reviews", "description": "OTT platform content reviews"},
+    {"name": "OTT Reviews Bollywood", "slug": "ott-reviews-bollywood", "description": "Bollywood OTT platform content reviews"},
+
+    # Row5 - New Video Songs, TV Shows, OTT Releases
+    {"name": "New Video Songs", "slug": "new-video-songs", "description": "New video songs and music videos"},
+    {"name": "New Video Songs Bollywood", "slug": "new-video-songs-bollywood", "description": "New Bollywood video songs and music videos"},
+    {"name": "TV Shows", "slug": "tv-shows", "description": "Television shows and TV content"},
+    {"name": "TV Shows Bollywood", "slug": "tv-shows-bollywood", "description": "Bollywood television content"},
+    {"name": "OTT Releases", "slug": "ott-releases", "description": "OTT platform releases"},
+    {"name": "OTT Releases Bollywood", "slug": "ott-releases-bollywood", "description": "Bollywood OTT platform releases"},
+
+    # Events & Interviews Section
+    {"name": "Events Interviews", "slug": "events-interviews", "description": "Celebrity events and interviews"},
+    {"name": "Events Interviews Bollywood", "slug": "events-interviews-bollywood", "description": "Bollywood celebrity events and interviews"},
+
+    # Sports sections (Row3)
+    {"name": "Sports Schedules", "slug": "sports-schedules", "description": "Sports schedules and fixtures"},
+
+    # NRI and World News sections
+    {"name": "NRI News", "slug": "nri-news", "description": "News and updates relevant to Non-Resident Indians"},
+    {"name": "World News", "slug": "world-news", "description": "International news and global affairs"}
+]
+
+def _add_missing(db: Session, model, key: str, rows: list):
+    """Add the rows whose key value is not in the table yet, checking them all with one query"""
+    column = getattr(model, key)
+    existing = {value for (value,) in db.query(column).filter(column.in_([row[key] for row in rows]))}
+    db.add_all([model(**row) for row in rows if row[key] not in existing])
+
 def seed_database(db: Session):
     """Seed the database with sample data"""
     
     # Clear existing data (optional - remove in production)
     # This is commented out to preserve existing data
     
-    # Seed Categories - Updated to match frontend structure
-    categories_data = [
-        # Core sections
-        {"name": "Latest News", "slug": "latest-news", "description": "Breaking news and current affairs"},
-        {"name": "Politics", "slug": "politics", "description": "Political news and government updates"},
-        {"name": "National Top Stories", "slug": "national-top-stories", "description": "National news and top stories"},
-        {"name": "Movies", "slug": "movies", "description": "Movie news, updates and entertainment"},
-        {"name": "AI", "slug": "ai", "description": "Artificial Intelligence and technology news"},
-        {"name": "Stock Market", "slug": "stock-market", "description": "Stock market and financial news"},
-        {"name": "Sports", "slug": "sports", "description": "Sports news and updates"},
-        {"name": "Trending Videos", "slug": "trending-videos", "description": "Trending video content"},
-
-        {"name": "Travel Pics", "slug": "travel-pics", "description": "Travel photography and destinations"},
-        {"name": "Fashion", "slug": "fashion", "description": "Fashion trends and style updates"},
-        
-        # Movie Reviews Section (with unique categories)
-        {"name": "Movie Reviews", "slug": "movie-reviews", "description": "General movie reviews and critiques"},
-        {"name": "Movie Reviews Bollywood", "slug": "movie-reviews-bollywood", "description": "Bollywood movie reviews and critiques"},
-        
-        # Row4 - Trailers & Teasers, Box Office, Theater Releases
-        {"name": "Trailers Teasers", "slug": "trailers-teasers", "description": "Movie trailers and teasers"},
-        {"name": "Trailers Teasers Bollywood", "slug": "trailers-teasers-bollywood", "description": "Bollywood trailers and teasers"},
-        {"name": "Box Office", "slug": "box-office", "description": "Box office collections and reports"},
-        {"name": "Box Office Bollywood", "slug": "box-office-bollywood", "description": "Bollywood box office collections"},
-        {"name": "Theater Releases", "slug": "theater-releases", "description": "Theater movie releases"},
-        {"name": "Theater Releases Bollywood", "slug": "theater-releases-bollywood", "description": "Bollywood theater releases"},
-        
-        # OTT Reviews Section  
-        {"name": "OTT Reviews", "slug": "ott-reviews", "description": "OTT platform content reviews"},
-        {"name": "OTT Reviews Bollywood", "slug": "ott-reviews-bollywood", "description": "Bollywood OTT platform content reviews"},
-        
-        # Row5 - New Video Songs, TV Shows, OTT Releases
-        {"name": "New Video Songs", "slug": "new-video-songs", "description": "New video songs and music videos"},
-        {"name": "New Video Songs Bollywood", "slug": "new-video-songs-bollywood", "description": "New Bollywood video songs and music videos"},
-        {"name": "TV Shows", "slug": "tv-shows", "description": "Television shows and TV content"},
-        {"name": "TV Shows Bollywood", "slug": "tv-shows-bollywood", "description": "Bollywood television content"},
-        {"name": "OTT Releases", "slug": "ott-releases", "description": "OTT platform releases"},
-        {"name": "OTT Releases Bollywood", "slug": "ott-releases-bollywood", "description": "Bollywood OTT platform releases"},
-        
-        # Events & Interviews Section
-        {"name": "Events Interviews", "slug": "events-interviews", "description": "Celebrity events and interviews"},
-        {"name": "Events Interviews Bollywood", "slug": "events-interviews-bollywood", "description": "Bollywood celebrity events and interviews"},
-        
-        # Sports sections (Row3)
-        {"name": "Sports Schedules", "slug": "sports-schedules", "description": "Sports schedules and fixtures"},
-        
-        # NRI and World News sections
-        {"name": "NRI News", "slug": "nri-news", "description": "News and updates relevant to Non-Resident Indians"},
-        {"name": "World News", "slug": "world-news", "description": "International news and global affairs"}
-    ]
-    
-    for cat_data in categories_data:
-        # Check if category already exists
-        existing_category = db.query(models.Category).filter(models.Category.slug == cat_data["slug"]).first()
-        if not existing_category:
-            category = models.Category(**cat_data)
-            db.add(category)
+    _add_missing(db, models.Category, "slug", CATEGORIES)
     
     db.commit()
     
@@ -903,12 +904,7 @@ def seed_database(db: Session):
         }
     ])
     
-    for article_data in articles_data:
-        # Check if article already exists
-        existing_article = db.query(models.Article).filter(models.Article.slug == article_data["slug"]).first()
-        if not existing_article:
-            article = models.Article(**article_data)
-            db.add(article)
+    _add_missing(db, models.Article, "slug", articles_data)
     
     db.commit()
     
@@ -952,12 +948,7 @@ def seed_database(db: Session):
         }
     ]
     
-    for review_data in movie_reviews_data:
-        # Check if review already exists
-        existing_review = db.query(models.MovieReview).filter(models.MovieReview.movie_name == review_data["movie_name"]).first()
-        if not existing_review:
-            review = models.MovieReview(**review_data)
-            db.add(review)
+    _add_missing(db, models.MovieReview, "movie_name", movie_reviews_data)
     
     db.commit()
     
@@ -1005,17 +996,12 @@ def seed_database(db: Session):
         }
     ]
     
-    for image_data in featured_images_data:
-        # Check if image already exists
-        existing_image = db.query(models.FeaturedImage).filter(models.FeaturedImage.title == image_data["title"]).first()
-        if not existing_image:
-            image = models.FeaturedImage(**image_data)
-            db.add(image)
+    _add_missing(db, models.FeaturedImage, "title", featured_images_data)
     
     db.commit()
     
     print(f"Database seeded successfully!")
-    print(f"Categories: {len(categories_data)}")
+    print(f"Categories: {len(CATEGORIES)}")
     print(f"Articles: {len(articles_data)}")
     print(f"Movie Reviews: {len(movie_reviews_data)}")
     print(f"Featured Images: {len(featured_images_data)}")
\ No newline at end of file
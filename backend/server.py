@@ -1,36 +1,63 @@
-from fastapi import FastAPI, APIRouter, Depends, HTTPException, UploadFile, File, Form, Request
+from fastapi import FastAPI, APIRouter, Body, Depends, HTTPException, UploadFile, File, Form, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, PlainTextResponse, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, desc
-from typing import List, Optional
+from typing import List, Optional, Union
+import asyncio
+import calendar
+from email.utils import formatdate, parsedate_to_datetime
 import logging
 from pathlib import Path
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 import os
+import time
 import uuid
 import aiofiles
-# Rate limiting completely disabled for better user experience
-# All rate limiting functionality removed
 
-from database import SessionLocal, engine, get_db, Base
-import models, schemas, crud, seed_data
+from database import SessionLocal, engine, get_db, init_db, missing_tables
+import models, schemas, crud
 from models import Gallery  # Import Gallery specifically
 from routes.auth_routes import router as auth_router
 from routes.topics_routes import router as topics_router
 from routes.gallery_routes import router as gallery_router
-from auth import create_default_admin
+from auth import create_default_admin, require_admin
 from scheduler_service import article_scheduler
-
-# Create database tables
-Base.metadata.create_all(bind=engine)
+from analytics_service import analytics_service, ANALYTICS_MAX_EVENTS_PER_REQUEST
+from analytics_rollup_service import analytics_rollups
+from trending_service import trending_engine
+from reference_data import reference_data, state_codes_from_names, LANGUAGE_BY_CODE
+from homepage_snapshot_service import homepage_snapshots, cohort_key
+from related_content_service import related_content, RELATED_TOP_K
+from backup_service import backup_service
+from translation_service import translation_queue
+from feed_service import seo_feeds, feed_name, FEED_KINDS, SITEMAP_INDEX, MEDIA_TYPES as FEED_MEDIA_TYPES
+import content_events
+from sql_instrumentation import SQLInstrumentationMiddleware, current_statement_count, instrument_engine
+import metrics
+import migrations
+from json_responses import trusted_list_response, ndjson_response, MAX_PAGE_SIZE
+from rate_limiting import rate_limiter
+from request_coalescing import request_coalescer, request_key
+from sampling_profiler import sampling_profiler, ProfilerBusyError, PROFILE_DEFAULT_INTERVAL_MS
+
+# Migrate a fresh (empty) database on startup; set to false where the schema is managed by migrations only
+SCHEMA_AUTO_CREATE = os.environ.get("SCHEMA_AUTO_CREATE", "true").lower() == "true"
+# Ensure the default admin exists in Mongo on startup; runs in the background so Mongo never blocks boot
+CREATE_DEFAULT_ADMIN = os.environ.get("CREATE_DEFAULT_ADMIN", "true").lower() == "true"
+DEFAULT_ADMIN_TIMEOUT_SECONDS = float(os.environ.get("DEFAULT_ADMIN_TIMEOUT_SECONDS", 30))
+# Page size of /articles/movie/{movie_name} when the client does not ask for one
+MOVIE_ARTICLES_PAGE_SIZE = int(os.environ.get("MOVIE_ARTICLES_PAGE_SIZE", 50))
 
 ROOT_DIR = Path(__file__).parent
 UPLOAD_DIR = ROOT_DIR / "uploads"
 UPLOAD_DIR.mkdir(exist_ok=True)
 
-# Create the main app without any rate limiting
-app = FastAPI(title="Blog CMS API", version="1.0.0")
+# Create the main app; expensive endpoints opt into rate limits per route class (rate_limiting.py)
+app = FastAPI(title="Blog CMS API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Serve uploaded files statically
 app.mount("/uploads", StaticFiles(directory=str(UPLOAD_DIR)), name="uploads")
@@ -47,7 +74,9 @@ async def root(request: Request):
 @api_router.post("/seed-database")
 async def seed_database_endpoint(db: Session = Depends(get_db)):
     try:
+        import seed_data  # large module only needed here
         seed_data.seed_database(db)
+        reference_data.refresh_categories(db)
         return {"message": "Database seeded successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -76,63 +105,103 @@ async def get_articles(
     db: Session = Depends(get_db)
 ):
     articles = crud.get_articles(db, skip=skip, limit=limit, is_featured=is_featured)
-    result = []
-    for article in articles:
-        result.append({
-            "id": article.id,
-            "title": article.title,
-            "short_title": article.short_title,
-            "summary": article.summary,
-            "image_url": article.image,
-            "author": article.author,
-            "language": article.language,
-            "category": article.category,
-            "content_type": article.content_type,  # Add content_type field
-            "artists": article.artists,  # Add artists field
-            "is_published": article.is_published,
-            "is_scheduled": article.is_scheduled if article.is_scheduled is not None else False,
-            "scheduled_publish_at": article.scheduled_publish_at,
-            "published_at": article.published_at,
-            "view_count": article.view_count if article.view_count is not None else 0
-        })
-    return result
+    return trusted_list_response(
+        [_article_list_item(article) for article in articles], schemas.ArticleListResponse
+    )
 
 @api_router.get("/articles/category/{category_slug}", response_model=List[schemas.ArticleListResponse])
-async def get_articles_by_category(category_slug: str, skip: int = 0, limit: int = 15, db: Session = Depends(get_db)):
-    articles = crud.get_articles_by_category_slug(db, category_slug=category_slug, skip=skip, limit=limit)
-    result = []
-    for article in articles:
-        result.append({
-            "id": article.id,
-            "title": article.title,
-            "short_title": article.short_title,
-            "summary": article.summary,
-            "image_url": article.image,
-            "author": article.author,
-            "language": article.language,
-            "category": article.category,
-            "content_type": article.content_type,  # Add content_type field
-            "artists": article.artists,  # Add artists field
-            "is_published": article.is_published,
-            "is_scheduled": article.is_scheduled,
-            "scheduled_publish_at": article.scheduled_publish_at,
-            "published_at": article.published_at,
-            "view_count": article.view_count
-        })
-    return result
+async def get_articles_by_category(
+    category_slug: str,
+    skip: int = 0,
+    limit: int = 15,
+    sort: str = "latest",  # "latest" or "trending"
+    db: Session = Depends(get_db)
+):
+    if sort == "trending" and skip == 0:
+        articles = _get_trending_articles(db, limit=limit, category=category_slug)
+    else:
+        articles = crud.get_articles_by_category_slug(db, category_slug=category_slug, skip=skip, limit=limit)
+    return trusted_list_response(
+        [_article_list_item(article) for article in articles], schemas.ArticleListResponse
+    )
+
+# Search endpoints scan article text; they are rate limited per client and identical
+# concurrent requests share one query. Declared before /articles/{article_id}, which would match them.
+@api_router.get("/articles/movie/{movie_name}", dependencies=[Depends(rate_limiter.limit("search"))])
+async def get_articles_by_movie_name(
+    request: Request,
+    movie_name: str,
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    output: str = Query("json", alias="format", pattern="^(json|ndjson)$")
+):
+    """Get articles tagged with a specific movie name, a page at a time or streamed with format=ndjson"""
+    if output == "ndjson":
+        return ndjson_response(lambda db: _movie_articles_query(db, movie_name, skip, limit))
+    return await request_coalescer.run(
+        request_key(request), _articles_by_movie_name, movie_name, skip, limit or MOVIE_ARTICLES_PAGE_SIZE
+    )
+
+def _movie_articles_query(db: Session, movie_name: str, skip: int = 0, limit: Optional[int] = None):
+    # Search for articles by movie name in title or tags
+    query = db.query(models.Article).filter(
+        or_(
+            models.Article.title.ilike(f"%{movie_name}%"),
+            models.Article.tags.ilike(f"%{movie_name}%")
+        )
+    ).filter(models.Article.is_published == True).order_by(
+        desc(models.Article.published_at), desc(models.Article.id)
+    ).offset(skip)
+    return query.limit(limit) if limit else query
+
+def _articles_by_movie_name(movie_name: str, skip: int, limit: int):
+    db = SessionLocal()
+    try:
+        return jsonable_encoder(_movie_articles_query(db, movie_name, skip, limit).all())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        db.close()
+
+@api_router.get("/articles/search", dependencies=[Depends(rate_limiter.limit("search"))])
+async def search_articles(request: Request, q: str):
+    """Search articles by query in title, content, or tags"""
+    return await request_coalescer.run(request_key(request), _search_articles, q)
+
+def _search_articles(q: str):
+    db = SessionLocal()
+    try:
+        articles = db.query(models.Article).filter(
+            or_(
+                models.Article.title.ilike(f"%{q}%"),
+                models.Article.content.ilike(f"%{q}%"),
+                models.Article.tags.ilike(f"%{q}%")
+            )
+        ).filter(models.Article.is_published == True).order_by(desc(models.Article.published_at)).limit(50).all()
+        
+        return jsonable_encoder(articles)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        db.close()
 
 # New section-specific endpoints for frontend sections
 @api_router.get("/articles/sections/latest-news", response_model=List[schemas.ArticleListResponse])
-async def get_latest_news_articles(request: Request, limit: int = 4, db: Session = Depends(get_db)):
-    """Get articles for Latest News/Top Stories section"""
-    articles = crud.get_articles_by_category_slug(db, category_slug="latest-news", limit=limit)
-    return _format_article_response(articles, db)
+async def get_latest_news_articles(request: Request, limit: int = 4, sort: str = "latest", lang: Optional[str] = None, db: Session = Depends(get_db)):
+    """Get articles for Latest News/Top Stories section, optionally ranked by trending score"""
+    if sort == "trending":
+        articles = _get_trending_articles(db, limit=limit, category="latest-news")
+    else:
+        articles = crud.get_articles_by_category_slug(db, category_slug="latest-news", limit=limit)
+    [articles] = _localize(db, lang, articles)
+    return trusted_list_response(_format_article_response(articles, db), schemas.ArticleListResponse)
 
 @api_router.get("/articles/sections/politics", response_model=dict)
 async def get_politics_articles(
     request: Request,
     limit: int = 4, 
     states: str = None,  # Comma-separated list of state codes: "ap,ts"
+    lang: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """Get articles for Politics section with State and National tabs
@@ -140,6 +209,7 @@ async def get_politics_articles(
     Args:
         limit: Number of articles to return per section
         states: Comma-separated state codes (e.g., "ap,ts") to filter state politics articles
+        lang: Language code to show translations in, falling back to the original article
     """
     # Parse state codes if provided
     state_codes = []
@@ -156,24 +226,26 @@ async def get_politics_articles(
     # National politics articles don't need state filtering
     national_articles = crud.get_articles_by_category_slug(db, category_slug="national-politics", limit=limit)
     
+    state_articles, national_articles = _localize(db, lang, state_articles, national_articles)
     return {
         "state_politics": _format_article_response(state_articles, db),
         "national_politics": _format_article_response(national_articles, db)
     }
 
 @api_router.get("/articles/sections/movies", response_model=dict)
-async def get_movies_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_movies_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Movies section with Movie News and Movie News Bollywood tabs"""
     movie_news_articles = crud.get_articles_by_category_slug(db, category_slug="movie-news", limit=limit)
     bollywood_articles = crud.get_articles_by_category_slug(db, category_slug="movie-news-bollywood", limit=limit)
     
+    movie_news_articles, bollywood_articles = _localize(db, lang, movie_news_articles, bollywood_articles)
     return {
         "movies": _format_article_response(movie_news_articles, db),
         "bollywood": _format_article_response(bollywood_articles, db)
     }
 
 @api_router.get("/articles/sections/hot-topics", response_model=dict)
-async def get_hot_topics_articles(limit: int = 4, states: str = None, db: Session = Depends(get_db)):
+async def get_hot_topics_articles(limit: int = 4, states: str = None, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Hot Topics section with Hot Topics (state-specific) and Hot Topics Bollywood tabs"""
     # For hot topics tab - apply state filtering if provided (similar to politics filtering)
     if states:
@@ -186,6 +258,7 @@ async def get_hot_topics_articles(limit: int = 4, states: str = None, db: Sessio
     # Bollywood hot topics - no state filtering needed (show to all users)
     bollywood_articles = crud.get_articles_by_category_slug(db, category_slug="hot-topics-bollywood", limit=limit)
     
+    hot_topics_articles, bollywood_articles = _localize(db, lang, hot_topics_articles, bollywood_articles)
     return {
         "hot_topics": _format_article_response(hot_topics_articles, db),
         "bollywood": _format_article_response(bollywood_articles, db)
@@ -194,82 +267,78 @@ async def get_hot_topics_articles(limit: int = 4, states: str = None, db: Sessio
 
 
 @api_router.get("/articles/sections/ai-stock", response_model=dict)
-async def get_ai_stock_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_ai_stock_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for AI & Stock Market section"""
     ai_articles = crud.get_articles_by_category_slug(db, category_slug="ai", limit=limit)
     stock_articles = crud.get_articles_by_category_slug(db, category_slug="stock-market", limit=limit)
     
+    ai_articles, stock_articles = _localize(db, lang, ai_articles, stock_articles)
     return {
         "ai": _format_article_response(ai_articles, db),
         "stock_market": _format_article_response(stock_articles, db)
     }
 
 @api_router.get("/articles/sections/fashion-beauty", response_model=dict)
-async def get_fashion_beauty_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_fashion_beauty_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Fashion & Beauty section (now Fashion & Travel)"""
     fashion_articles = crud.get_articles_by_category_slug(db, category_slug="fashion", limit=limit)
     travel_articles = crud.get_articles_by_category_slug(db, category_slug="travel", limit=limit)
     
+    fashion_articles, travel_articles = _localize(db, lang, fashion_articles, travel_articles)
     return {
         "fashion": _format_article_response(fashion_articles, db),
         "travel": _format_article_response(travel_articles, db)
     }
 
 @api_router.get("/articles/sections/sports", response_model=dict)
-async def get_sports_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_sports_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Sports section with Cricket and Other Sports tabs"""
     cricket_articles = crud.get_articles_by_category_slug(db, category_slug="cricket", limit=limit)
     other_sports_articles = crud.get_articles_by_category_slug(db, category_slug="other-sports", limit=limit)
     
+    cricket_articles, other_sports_articles = _localize(db, lang, cricket_articles, other_sports_articles)
     return {
         "cricket": _format_article_response(cricket_articles, db),
         "other_sports": _format_article_response(other_sports_articles, db)
     }
 
 @api_router.get("/articles/sections/hot-topics-gossip", response_model=dict)
-async def get_hot_topics_gossip_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_hot_topics_gossip_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Hot Topics & Gossip section"""
     hot_topics_articles = crud.get_articles_by_category_slug(db, category_slug="hot-topics", limit=limit)
     gossip_articles = crud.get_articles_by_category_slug(db, category_slug="gossip", limit=limit)
     
+    hot_topics_articles, gossip_articles = _localize(db, lang, hot_topics_articles, gossip_articles)
     return {
         "hot_topics": _format_article_response(hot_topics_articles, db),
         "gossip": _format_article_response(gossip_articles, db)
     }
 
 @api_router.get("/articles/sections/box-office", response_model=dict)
-async def get_box_office_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_box_office_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Box Office section with Box Office and Bollywood-Box Office tabs"""
     box_office_articles = crud.get_articles_by_category_slug(db, category_slug="box-office", limit=limit)
     bollywood_articles = crud.get_articles_by_category_slug(db, category_slug="bollywood-box-office", limit=limit)
     
+    box_office_articles, bollywood_articles = _localize(db, lang, box_office_articles, bollywood_articles)
     return {
         "box_office": _format_article_response(box_office_articles, db),
         "bollywood": _format_article_response(bollywood_articles, db)
     }
 
 @api_router.get("/articles/sections/trending-videos", response_model=dict)
-async def get_trending_videos_articles(limit: int = 20, states: str = None, db: Session = Depends(get_db)):
+async def get_trending_videos_articles(limit: int = 20, states: str = None, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Trending Videos section with Trending Videos and Bollywood-Trending Videos tabs
     
     Args:
         limit: Number of articles to fetch (default 20)
         states: Comma-separated list of states for trending videos filtering (Bollywood tab ignores state filtering)
+        lang: Language code to show translations in, falling back to the original article
     """
     # For trending videos tab - apply state filtering if provided
     if states:
-        # Convert state names to state codes (map full names to codes)
-        state_name_to_code = {
-            'Andhra Pradesh': 'ap',
-            'Telangana': 'ts',
-            # Add more mappings as needed
-        }
-        
-        state_list = [state.strip() for state in states.split(',') if state.strip()]
-        state_codes = []
-        for state_name in state_list:
-            if state_name in state_name_to_code:
-                state_codes.append(state_name_to_code[state_name])
+        # Convert state names to state codes
+        state_codes = state_codes_from_names(states)
         
         if state_codes:
             trending_articles = crud.get_articles_by_states(db, category_slug="trending-videos", state_codes=state_codes, limit=limit)
@@ -281,6 +350,7 @@ async def get_trending_videos_articles(limit: int = 20, states: str = None, db:
     # For Bollywood tab - no state filtering, show all Bollywood trending videos
     bollywood_articles = crud.get_articles_by_category_slug(db, category_slug="bollywood-trending-videos", limit=limit)
     
+    trending_articles, bollywood_articles = _localize(db, lang, trending_articles, bollywood_articles)
     return {
         "trending_videos": _format_article_response(trending_articles, db),
         "bollywood": _format_article_response(bollywood_articles, db)
@@ -288,66 +358,30 @@ async def get_trending_videos_articles(limit: int = 20, states: str = None, db:
 
 # USA and ROW video sections endpoint
 @api_router.get("/articles/sections/usa-row-videos", response_model=dict)
-async def get_usa_row_videos_sections(limit: int = 20, db: Session = Depends(get_db)):
+async def get_usa_row_videos_sections(limit: int = 20, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Viral Videos section with USA and ROW tabs"""
     usa_articles = crud.get_articles_by_category_slug(db, category_slug="usa", limit=limit)
     row_articles = crud.get_articles_by_category_slug(db, category_slug="row", limit=limit)
     
+    usa_articles, row_articles = _localize(db, lang, usa_articles, row_articles)
     return {
         "usa": _format_article_response(usa_articles, db),
         "row": _format_article_response(row_articles, db)
     }
 
 @api_router.get("/articles/sections/viral-shorts", response_model=dict)
-async def get_viral_shorts_articles(limit: int = 20, states: str = None, db: Session = Depends(get_db)):
+async def get_viral_shorts_articles(limit: int = 20, states: str = None, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Viral Shorts section with Viral Shorts and Bollywood tabs
     
     Args:
         limit: Number of articles to fetch (default 20)
         states: Comma-separated list of states for viral shorts filtering (Bollywood tab ignores state filtering)
+        lang: Language code to show translations in, falling back to the original article
     """
     # For viral shorts tab - apply state filtering if provided
     if states:
-        # Convert state names to state codes (map full names to codes)
-        state_name_to_code = {
-            'Andhra Pradesh': 'ap',
-            'Telangana': 'ts',
-            'Karnataka': 'ka',
-            'Tamil Nadu': 'tn',
-            'Kerala': 'kl',
-            'Maharashtra': 'mh',
-            'Gujarat': 'gj',
-            'Rajasthan': 'rj',
-            'Uttar Pradesh': 'up',
-            'West Bengal': 'wb',
-            'Bihar': 'br',
-            'Madhya Pradesh': 'mp',
-            'Odisha': 'or',
-            'Punjab': 'pb',
-            'Haryana': 'hr',
-            'Assam': 'as',
-            'Jharkhand': 'jh',
-            'Chhattisgarh': 'cg',
-            'Himachal Pradesh': 'hp',
-            'Uttarakhand': 'uk',
-            'Jammu and Kashmir': 'jk',
-            'Delhi': 'dl',
-            'Goa': 'ga',
-            'Manipur': 'mn',
-            'Meghalaya': 'ml',
-            'Mizoram': 'mz',
-            'Nagaland': 'nl',
-            'Sikkim': 'sk',
-            'Tripura': 'tr',
-            'Arunachal Pradesh': 'ar',
-            'Ladakh': 'ld'
-        }
-        
-        state_list = [state.strip() for state in states.split(',') if state.strip()]
-        state_codes = []
-        for state_name in state_list:
-            if state_name in state_name_to_code:
-                state_codes.append(state_name_to_code[state_name])
+        # Convert state names to state codes
+        state_codes = state_codes_from_names(states)
         
         if state_codes:
             viral_shorts_articles = crud.get_articles_by_states(db, category_slug="viral-shorts", state_codes=state_codes, limit=limit)
@@ -359,94 +393,103 @@ async def get_viral_shorts_articles(limit: int = 20, states: str = None, db: Ses
     # For Bollywood tab - no state filtering, show all Viral Shorts Bollywood videos
     bollywood_articles = crud.get_articles_by_category_slug(db, category_slug="viral-shorts-bollywood", limit=limit)
     
+    viral_shorts_articles, bollywood_articles = _localize(db, lang, viral_shorts_articles, bollywood_articles)
     return {
         "viral_shorts": _format_article_response(viral_shorts_articles, db),
         "bollywood": _format_article_response(bollywood_articles, db)
     }
 
 @api_router.get("/articles/sections/ott-movie-reviews", response_model=dict)
-async def get_ott_movie_reviews_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_ott_movie_reviews_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for OTT Reviews section with OTT Reviews and Bollywood tabs"""
     ott_reviews_articles = crud.get_articles_by_category_slug(db, category_slug="ott-reviews", limit=limit)
     bollywood_articles = crud.get_articles_by_category_slug(db, category_slug="ott-reviews-bollywood", limit=limit)
     
+    ott_reviews_articles, bollywood_articles = _localize(db, lang, ott_reviews_articles, bollywood_articles)
     return {
         "ott_movie_reviews": _format_article_response(ott_reviews_articles, db),
         "web_series": _format_article_response(bollywood_articles, db)
     }
 
 @api_router.get("/articles/sections/events-interviews", response_model=dict)
-async def get_events_interviews_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_events_interviews_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Events & Interviews section with Events & Interviews and Events Interviews Bollywood tabs"""
     events_articles = crud.get_articles_by_category_slug(db, category_slug="events-interviews", limit=limit)
     bollywood_articles = crud.get_articles_by_category_slug(db, category_slug="events-interviews-bollywood", limit=limit)
     
+    events_articles, bollywood_articles = _localize(db, lang, events_articles, bollywood_articles)
     return {
         "events_interviews": _format_article_response(events_articles, db),
         "bollywood": _format_article_response(bollywood_articles, db)
     }
 
 @api_router.get("/articles/sections/new-video-songs", response_model=dict)
-async def get_new_video_songs_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_new_video_songs_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for New Video Songs section with Video Songs and Bollywood tabs"""
     video_songs_articles = crud.get_articles_by_category_slug(db, category_slug="new-video-songs", limit=limit)
     bollywood_articles = crud.get_articles_by_category_slug(db, category_slug="new-video-songs-bollywood", limit=limit)
     
+    video_songs_articles, bollywood_articles = _localize(db, lang, video_songs_articles, bollywood_articles)
     return {
         "video_songs": _format_article_response(video_songs_articles, db),
         "bollywood": _format_article_response(bollywood_articles, db)
     }
 
 @api_router.get("/articles/sections/movie-reviews", response_model=dict)
-async def get_movie_reviews_articles(limit: int = 20, db: Session = Depends(get_db)):
+async def get_movie_reviews_articles(limit: int = 20, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Movie Reviews section with Movie Reviews and Bollywood tabs - latest 20 from each category"""
     movie_reviews_articles = crud.get_articles_by_category_slug(db, category_slug="movie-reviews", limit=limit)
     bollywood_articles = crud.get_articles_by_category_slug(db, category_slug="movie-reviews-bollywood", limit=limit)
     
+    movie_reviews_articles, bollywood_articles = _localize(db, lang, movie_reviews_articles, bollywood_articles)
     return {
         "movie_reviews": _format_article_response(movie_reviews_articles, db),
         "bollywood": _format_article_response(bollywood_articles, db)
     }
 
 @api_router.get("/articles/sections/trailers-teasers", response_model=dict)
-async def get_trailers_teasers_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_trailers_teasers_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Trailers & Teasers section with Trailers and Bollywood tabs"""
     trailers_articles = crud.get_articles_by_category_slug(db, category_slug="trailers-teasers", limit=limit)
     bollywood_articles = crud.get_articles_by_category_slug(db, category_slug="trailers-teasers-bollywood", limit=limit)
     
+    trailers_articles, bollywood_articles = _localize(db, lang, trailers_articles, bollywood_articles)
     return {
         "trailers": _format_article_response(trailers_articles, db),
         "bollywood": _format_article_response(bollywood_articles, db)
     }
 
 @api_router.get("/articles/sections/box-office", response_model=dict)
-async def get_box_office_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_box_office_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Box Office section with Box Office and Bollywood tabs"""
     box_office_articles = crud.get_articles_by_category_slug(db, category_slug="box-office", limit=limit)
     bollywood_articles = crud.get_articles_by_category_slug(db, category_slug="box-office-bollywood", limit=limit)
     
+    box_office_articles, bollywood_articles = _localize(db, lang, box_office_articles, bollywood_articles)
     return {
         "box_office": _format_article_response(box_office_articles, db),
         "bollywood": _format_article_response(bollywood_articles, db)
     }
 
 @api_router.get("/articles/sections/events-interviews", response_model=dict)
-async def get_events_interviews_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_events_interviews_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Events & Interviews section with Events and Bollywood tabs"""
     events_articles = crud.get_articles_by_category_slug(db, category_slug="events-interviews", limit=limit)
     bollywood_articles = crud.get_articles_by_category_slug(db, category_slug="events-interviews-bollywood", limit=limit)
     
+    events_articles, bollywood_articles = _localize(db, lang, events_articles, bollywood_articles)
     return {
         "events": _format_article_response(events_articles, db),
         "bollywood": _format_article_response(bollywood_articles, db)
     }
 
 @api_router.get("/articles/sections/tv-shows", response_model=dict)
-async def get_tv_shows_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_tv_shows_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for TV Shows section with TV Shows and Bollywood tabs"""
     tv_articles = crud.get_articles_by_category_slug(db, category_slug="tv-shows", limit=limit)
     bollywood_articles = crud.get_articles_by_category_slug(db, category_slug="tv-shows-bollywood", limit=limit)
     
+    tv_articles, bollywood_articles = _localize(db, lang, tv_articles, bollywood_articles)
     return {
         "tv": _format_article_response(tv_articles),
         "bollywood": _format_article_response(bollywood_articles)
@@ -456,6 +499,9 @@ async def get_tv_shows_articles(limit: int = 4, db: Session = Depends(get_db)):
 @api_router.get("/releases/ott-bollywood")
 async def get_ott_bollywood_releases(db: Session = Depends(get_db)):
     """Get OTT and Bollywood OTT releases for homepage display"""
+    return _get_ott_bollywood_releases(db)
+
+def _get_ott_bollywood_releases(db: Session):
     this_week_ott = crud.get_this_week_ott_releases(db, limit=4)
     upcoming_ott = crud.get_upcoming_ott_releases(db, limit=4)
     
@@ -509,24 +555,26 @@ async def get_ott_bollywood_releases(db: Session = Depends(get_db)):
     }
 
 @api_router.get("/articles/sections/trailers", response_model=List[schemas.ArticleListResponse])
-async def get_trailers_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_trailers_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Trailers & Teasers section"""
     articles = crud.get_articles_by_category_slug(db, category_slug="trailers", limit=limit)
-    return _format_article_response(articles)
+    [articles] = _localize(db, lang, articles)
+    return trusted_list_response(_format_article_response(articles), schemas.ArticleListResponse)
 
 @api_router.get("/articles/sections/top-stories", response_model=dict)
-async def get_top_stories_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_top_stories_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Top Stories section with regular and national tabs"""
     top_stories_articles = crud.get_articles_by_category_slug(db, category_slug="top-stories", limit=limit)
     national_articles = crud.get_articles_by_category_slug(db, category_slug="national-top-stories", limit=limit)
     
+    top_stories_articles, national_articles = _localize(db, lang, top_stories_articles, national_articles)
     return {
         "top_stories": _format_article_response(top_stories_articles),
         "national": _format_article_response(national_articles)
     }
 
 @api_router.get("/articles/sections/nri-news", response_model=List[schemas.ArticleListResponse])
-async def get_nri_news_articles(limit: int = 4, states: str = None, db: Session = Depends(get_db)):
+async def get_nri_news_articles(limit: int = 4, states: str = None, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for NRI News section with state filtering"""
     # Parse state codes from query parameter
     state_codes = []
@@ -540,27 +588,67 @@ async def get_nri_news_articles(limit: int = 4, states: str = None, db: Session
         # If no states specified, get all NRI news articles
         articles = crud.get_articles_by_category_slug(db, category_slug="nri-news", limit=limit)
     
-    return _format_article_response(articles)
+    [articles] = _localize(db, lang, articles)
+    return trusted_list_response(_format_article_response(articles), schemas.ArticleListResponse)
 
 @api_router.get("/articles/sections/world-news", response_model=List[schemas.ArticleListResponse])
-async def get_world_news_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_world_news_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for World News section"""
     articles = crud.get_articles_by_category_slug(db, category_slug="world-news", limit=limit)
-    return _format_article_response(articles)
+    [articles] = _localize(db, lang, articles)
+    return trusted_list_response(_format_article_response(articles), schemas.ArticleListResponse)
 
 @api_router.get("/articles/sections/photoshoots", response_model=List[schemas.ArticleListResponse])
-async def get_photoshoots_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_photoshoots_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Photoshoots section"""
     articles = crud.get_articles_by_category_slug(db, category_slug="photoshoots", limit=limit)
-    return _format_article_response(articles, db)
+    [articles] = _localize(db, lang, articles)
+    return trusted_list_response(_format_article_response(articles, db), schemas.ArticleListResponse)
 
 @api_router.get("/articles/sections/travel-pics", response_model=List[schemas.ArticleListResponse])
-async def get_travel_pics_articles(limit: int = 4, db: Session = Depends(get_db)):
+async def get_travel_pics_articles(limit: int = 4, lang: Optional[str] = None, db: Session = Depends(get_db)):
     """Get articles for Travel Pics section"""
     articles = crud.get_articles_by_category_slug(db, category_slug="travel-pics", limit=limit)
-    return _format_article_response(articles, db)
+    [articles] = _localize(db, lang, articles)
+    return trusted_list_response(_format_article_response(articles, db), schemas.ArticleListResponse)
+
+def _localize(db: Session, lang: Optional[str], *article_lists):
+    """Resolve section article lists to their `lang` translations (English originals where missing) in one query"""
+    if lang is not None and lang not in LANGUAGE_BY_CODE:
+        raise HTTPException(status_code=400, detail=f"Unsupported language: {lang}")
+    return crud.resolve_language_variants(db, lang, *article_lists)
+
+def _get_trending_articles(db: Session, limit: int, category: Optional[str] = None):
+    """Get articles ranked by trending score, padded with the latest articles when too few are trending"""
+    ranked = trending_engine.top(limit, category=category)
+    articles = crud.get_articles_by_ids(db, [row["article_id"] for row in ranked])
+    if len(articles) < limit and category:
+        seen = {article.id for article in articles}
+        latest = crud.get_articles_by_category_slug(db, category_slug=category, limit=limit + len(seen))
+        articles.extend([article for article in latest if article.id not in seen][:limit - len(articles)])
+    return articles
 
 # Helper function to format article response
+def _article_list_item(article):
+    """Compact list card for an article, shaped like schemas.ArticleListResponse"""
+    return {
+        "id": article.id,
+        "title": article.title,
+        "short_title": article.short_title,
+        "summary": article.summary,
+        "image_url": article.image,
+        "author": article.author,
+        "language": article.language,
+        "category": article.category,
+        "content_type": article.content_type,
+        "artists": article.artists,
+        "is_published": article.is_published,
+        "is_scheduled": article.is_scheduled if article.is_scheduled is not None else False,
+        "scheduled_publish_at": article.scheduled_publish_at,
+        "published_at": article.published_at,
+        "view_count": article.view_count if article.view_count is not None else 0
+    }
+
 def _format_article_response(articles, db: Session = None):
     """Helper function to format article list response"""
     result = []
@@ -617,69 +705,14 @@ def _format_article_response(articles, db: Session = None):
 
 # CMS API Endpoints
 @api_router.get("/cms/config", response_model=schemas.CMSResponse)
-async def get_cms_config(db: Session = Depends(get_db)):
+async def get_cms_config(request: Request, db: Session = Depends(get_db)):
     """Get CMS configuration including languages, states, and categories"""
-    categories = crud.get_all_categories(db)
-    
-    languages = [
-        {"code": "en", "name": "English", "native_name": "English"},
-        {"code": "te", "name": "Telugu", "native_name": "తెలుగు"},
-        {"code": "hi", "name": "Hindi", "native_name": "हिन्दी"},
-        {"code": "ta", "name": "Tamil", "native_name": "தமிழ்"},
-        {"code": "kn", "name": "Kannada", "native_name": "ಕನ್ನಡ"},
-        {"code": "mr", "name": "Marathi", "native_name": "मराठी"},
-        {"code": "gu", "name": "Gujarati", "native_name": "ગુજરાતી"},
-        {"code": "bn", "name": "Bengali", "native_name": "বাংলা"},
-        {"code": "ml", "name": "Malayalam", "native_name": "മലയാളം"},
-        {"code": "pa", "name": "Punjabi", "native_name": "ਪੰਜਾਬੀ"},
-        {"code": "as", "name": "Assamese", "native_name": "অসমীয়া"},
-        {"code": "or", "name": "Odia", "native_name": "ଓଡ଼ିଆ"},
-        {"code": "kok", "name": "Konkani", "native_name": "कोंकणी"},
-        {"code": "mni", "name": "Manipuri", "native_name": "ꯃꯤꯇꯩꯂꯣꯟ"},
-        {"code": "ne", "name": "Nepali", "native_name": "नेपाली"},
-        {"code": "ur", "name": "Urdu", "native_name": "اردو"}
-    ]
-    
-    states = [
-        {"code": "all", "name": "All States"},
-        {"code": "ap", "name": "Andhra Pradesh"},
-        {"code": "ar", "name": "Arunachal Pradesh"},
-        {"code": "as", "name": "Assam"},
-        {"code": "br", "name": "Bihar"},
-        {"code": "cg", "name": "Chhattisgarh"},
-        {"code": "dl", "name": "Delhi"},
-        {"code": "ga", "name": "Goa"},
-        {"code": "gj", "name": "Gujarat"},
-        {"code": "hr", "name": "Haryana"},
-        {"code": "hp", "name": "Himachal Pradesh"},
-        {"code": "jk", "name": "Jammu and Kashmir"},
-        {"code": "jh", "name": "Jharkhand"},
-        {"code": "ka", "name": "Karnataka"},
-        {"code": "kl", "name": "Kerala"},
-        {"code": "ld", "name": "Ladakh"},
-        {"code": "mp", "name": "Madhya Pradesh"},
-        {"code": "mh", "name": "Maharashtra"},
-        {"code": "mn", "name": "Manipur"},
-        {"code": "ml", "name": "Meghalaya"},
-        {"code": "mz", "name": "Mizoram"},
-        {"code": "nl", "name": "Nagaland"},
-        {"code": "or", "name": "Odisha"},
-        {"code": "pb", "name": "Punjab"},
-        {"code": "rj", "name": "Rajasthan"},
-        {"code": "sk", "name": "Sikkim"},
-        {"code": "tn", "name": "Tamil Nadu"},
-        {"code": "ts", "name": "Telangana"},
-        {"code": "tr", "name": "Tripura"},
-        {"code": "up", "name": "Uttar Pradesh"},
-        {"code": "uk", "name": "Uttarakhand"},
-        {"code": "wb", "name": "West Bengal"}
-    ]
-    
-    return {
-        "languages": languages,
-        "states": states, 
-        "categories": [{"id": cat.id, "name": cat.name, "slug": cat.slug, "description": cat.description} for cat in categories]
-    }
+    # Served from the payload pre-serialized at startup / on category changes
+    reference_data.ensure_loaded(db)
+    headers = {"ETag": reference_data.cms_config_etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == reference_data.cms_config_etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=reference_data.cms_config_body, media_type="application/json", headers=headers)
 
 @api_router.get("/cms/articles", response_model=List[schemas.ArticleListResponse])
 async def get_cms_articles(
@@ -692,26 +725,9 @@ async def get_cms_articles(
 ):
     """Get articles for CMS dashboard with filtering"""
     articles = crud.get_articles_for_cms(db, language=language, skip=skip, limit=limit, category=category, state=state)
-    result = []
-    for article in articles:
-        result.append({
-            "id": article.id,
-            "title": article.title,
-            "short_title": article.short_title,
-            "summary": article.summary,
-            "image_url": article.image,
-            "author": article.author,
-            "language": article.language,
-            "category": article.category,
-            "content_type": article.content_type,  # Add content_type field
-            "artists": article.artists,  # Add artists field
-            "is_published": article.is_published,
-            "is_scheduled": article.is_scheduled if article.is_scheduled is not None else False,
-            "scheduled_publish_at": article.scheduled_publish_at,
-            "published_at": article.published_at,
-            "view_count": article.view_count if article.view_count is not None else 0
-        })
-    return result
+    return trusted_list_response(
+        [_article_list_item(article) for article in articles], schemas.ArticleListResponse
+    )
 
 @api_router.post("/cms/articles", response_model=schemas.ArticleResponse)
 async def create_cms_article(article: schemas.ArticleCreate, db: Session = Depends(get_db)):
@@ -761,21 +777,88 @@ async def delete_cms_article(article_id: int, db: Session = Depends(get_db)):
     crud.delete_article(db, article_id)
     return {"message": "Article deleted successfully"}
 
+def _format_similar_articles(db: Session, ranked):
+    """Load (article id, score) pairs from the related content engine in one query"""
+    scores = dict(ranked)
+    articles = crud.get_articles_by_ids(db, [article_id for article_id, _ in ranked])
+    return [
+        {
+            "id": article.id,
+            "title": article.title,
+            "short_title": article.short_title,
+            "summary": article.summary,
+            "image": article.image,
+            "youtube_url": article.youtube_url,
+            "author": article.author,
+            "language": article.language,
+            "category": article.category,
+            "published_at": article.published_at,
+            "view_count": article.view_count,
+            "similarity": scores[article.id]
+        }
+        for article in articles
+    ]
+
+@api_router.get("/articles/{article_id}/related")
+async def get_similar_articles(article_id: int, limit: int = 6, db: Session = Depends(get_db)):
+    """Get the articles most similar in content to this one, from the precomputed neighbours"""
+    limit = max(1, min(limit, RELATED_TOP_K))
+    return _format_similar_articles(db, related_content.related(article_id, limit))
+
+def _related_video_card(video, source: str, similarity: float = None):
+    card = {
+        "id": video.id,
+        "title": video.title,
+        "summary": video.summary,
+        "image": video.image,
+        "youtube_url": video.youtube_url,
+        "category": video.category,
+        "content_type": video.content_type,
+        "published_at": video.published_at,
+        "source": source
+    }
+    if similarity is not None:
+        card["similarity"] = similarity
+    return card
+
+def _get_related_video_cards(db: Session, article_id: int, limit: int = 6):
+    """Curated related videos, or content-similar videos when none are curated"""
+    curated = crud.get_related_videos_for_articles(db, [article_id]).get(article_id, [])
+    if curated:
+        return [_related_video_card(video, "curated") for video in curated[:limit]]
+    ranked = related_content.related_videos(article_id, limit)
+    scores = dict(ranked)
+    videos = crud.get_articles_by_ids(db, [video_id for video_id, _ in ranked])
+    return [_related_video_card(video, "similar", scores[video.id]) for video in videos]
+
 @api_router.get("/articles/{article_id}/related-videos")
-async def get_article_related_videos(article_id: int, db: Session = Depends(get_db)):
-    """Get related videos for an article"""
+async def get_article_related_videos(article_id: int, limit: int = 6, db: Session = Depends(get_db)):
+    """Get curated related videos for an article, plus content-similar suggestions"""
     article = crud.get_article_by_id(db, article_id)
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     
-    # For now, return empty list since we need to implement related videos storage
-    # This will be populated when we add the database schema for related videos
-    return {"related_videos": []}
+    limit = max(1, min(limit, RELATED_TOP_K))
+    # The CMS saves this list back, so unpublished curated videos are kept and flagged
+    curated = crud.get_related_videos_for_articles(db, [article_id], published_only=False).get(article_id, [])
+    curated_ids = {video.id for video in curated}
+    ranked = [
+        (video_id, score) for video_id, score in related_content.related_videos(article_id, RELATED_TOP_K)
+        if video_id not in curated_ids
+    ][:limit]
+    scores = dict(ranked)
+    similar = crud.get_articles_by_ids(db, [video_id for video_id, _ in ranked])
+    return {
+        "related_videos": [
+            {**_related_video_card(video, "curated"), "is_published": video.is_published} for video in curated
+        ],
+        "similar_videos": [_related_video_card(video, "similar", scores[video.id]) for video in similar]
+    }
 
 @api_router.put("/articles/{article_id}/related-videos")
 async def update_article_related_videos(
     article_id: int, 
-    request: dict,
+    request: schemas.RelatedVideosUpdate,
     db: Session = Depends(get_db)
 ):
     """Update related videos for an article"""
@@ -783,29 +866,23 @@ async def update_article_related_videos(
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     
-    related_video_ids = request.get("related_videos", [])
+    # Drop duplicates but keep the order chosen in the CMS
+    related_video_ids = list(dict.fromkeys(request.related_videos))
+    if len(related_video_ids) > crud.MAX_RELATED_VIDEOS:
+        raise HTTPException(status_code=400, detail=f"An article can have at most {crud.MAX_RELATED_VIDEOS} related videos")
+    if article_id in related_video_ids:
+        raise HTTPException(status_code=400, detail="An article cannot be related to itself")
     
     # Validate that all related video IDs exist and are video articles
+    video_flags = crud.get_video_flags(db, related_video_ids)
     for video_id in related_video_ids:
-        video_article = crud.get_article_by_id(db, video_id)
-        if not video_article:
+        if video_id not in video_flags:
             raise HTTPException(status_code=400, detail=f"Related video with ID {video_id} not found")
-        if not video_article.youtube_url:
+        if not video_flags[video_id]:
             raise HTTPException(status_code=400, detail=f"Article with ID {video_id} is not a video article")
     
-    # For now, we'll store the related videos in a simple way
-    # In a production system, you'd want a proper many-to-many relationship table
-    # For this implementation, we'll use a simple approach
-    
-    # Store related videos as a JSON string in a custom field (to be added to schema)
-    # This is a simplified implementation - in production you'd want proper relationships
     try:
-        import json
-        related_videos_json = json.dumps(related_video_ids)
-        
-        # Update article with related videos (this assumes we add a related_videos column)
-        # For now, we'll simulate success since we need to update the database schema first
-        
+        crud.set_article_related_videos(db, article_id, related_video_ids)
         return {"message": "Related videos updated successfully", "related_videos": related_video_ids}
     except Exception as e:
         raise HTTPException(status_code=500, detail="Failed to update related videos")
@@ -826,29 +903,46 @@ async def translate_article(
     translated_article = crud.create_translated_article(db, original_article, translation_request.target_language)
     return translated_article
 
+@api_router.post("/cms/articles/{article_id}/translations", response_model=schemas.TranslationProgressResponse,
+                 status_code=202)
+async def queue_article_translations(
+    article_id: int,
+    request: schemas.TranslationBatchRequest = Body(default=schemas.TranslationBatchRequest()),
+    db: Session = Depends(get_db)
+):
+    """Queue background translations of an article into several languages"""
+    original_article = crud.get_article_by_id(db, article_id)
+    if not original_article:
+        raise HTTPException(status_code=404, detail="Original article not found")
+    languages = request.languages if request.languages is not None else list(LANGUAGE_BY_CODE)
+    unknown = [language for language in languages if language not in LANGUAGE_BY_CODE]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unsupported languages: {', '.join(unknown)}")
+    return translation_queue.enqueue(db, original_article, languages)
+
+@api_router.get("/cms/articles/{article_id}/translations", response_model=schemas.TranslationProgressResponse)
+async def get_article_translations(article_id: int, db: Session = Depends(get_db)):
+    """Progress of the queued translations of an article"""
+    return translation_queue.progress(db, article_id)
+
 @api_router.get("/articles/most-read", response_model=List[schemas.ArticleListResponse])
-async def get_most_read_articles(limit: int = 15, db: Session = Depends(get_db)):
-    articles = crud.get_most_read_articles(db, limit=limit)
-    result = []
-    for article in articles:
-        result.append({
-            "id": article.id,
-            "title": article.title,
-            "short_title": article.short_title,
-            "summary": article.summary,
-            "image_url": article.image,
-            "author": article.author,
-            "language": article.language,
-            "category": article.category,
-            "content_type": article.content_type,  # Add content_type field
-            "artists": article.artists,  # Add artists field
-            "is_published": article.is_published,
-            "is_scheduled": article.is_scheduled,
-            "scheduled_publish_at": article.scheduled_publish_at,
-            "published_at": article.published_at,
-            "view_count": article.view_count
-        })
-    return result
+async def get_most_read_articles(limit: int = 15, window_hours: Optional[int] = None, db: Session = Depends(get_db)):
+    """Get most read articles, all-time by default or over the last window_hours from analytics rollups"""
+    articles = []
+    if window_hours:
+        ranked = analytics_rollups.most_read(window_hours * 3600, limit=limit)
+        articles = crud.get_articles_by_ids(db, [row["article_id"] for row in ranked])
+    if not articles:
+        articles = crud.get_most_read_articles(db, limit=limit)
+    return trusted_list_response(
+        [_article_list_item(article) for article in articles], schemas.ArticleListResponse
+    )
+
+@api_router.get("/articles/trending", response_model=List[schemas.ArticleListResponse])
+async def get_trending_articles(limit: int = 15, category: Optional[str] = None, db: Session = Depends(get_db)):
+    """Get articles ranked by time-decayed engagement score"""
+    articles = _get_trending_articles(db, limit=limit, category=category)
+    return trusted_list_response(_format_article_response(articles, db), schemas.ArticleListResponse)
 
 @api_router.get("/articles/featured", response_model=schemas.ArticleResponse)
 async def get_featured_article(db: Session = Depends(get_db)):
@@ -863,12 +957,18 @@ async def get_article(request: Request, article_id: int, db: Session = Depends(g
     if article is None:
         raise HTTPException(status_code=404, detail="Article not found")
     
-    print(f"Debug: Article {article_id} has gallery_id: {getattr(article, 'gallery_id', 'MISSING')}")
+    # Feed analytics rollups and trending scores with a server-side view
+    analytics_service.ingest([{
+        "action": "article_view",
+        "articleId": article.id,
+        "category": article.category,
+        "language": article.language
+    }])
     
     # Use the same formatting function to include gallery information
     formatted_articles = _format_article_response([article], db)
-    
-    print(f"Debug: Formatted response gallery: {formatted_articles[0].get('gallery') if formatted_articles else 'NO FORMATTED'}")
+    if formatted_articles:
+        formatted_articles[0]["related_videos"] = _get_related_video_cards(db, article.id)
     
     return formatted_articles[0] if formatted_articles else article
 
@@ -956,49 +1056,111 @@ async def run_scheduler_now():
         raise HTTPException(status_code=500, detail=f"Scheduler run failed: {str(e)}")
 
 @api_router.get("/cms/scheduled-articles")
-async def get_scheduled_articles(db: Session = Depends(get_db)):
-    """Get all scheduled articles"""
-    scheduled_articles = db.query(models.Article).filter(
+async def get_scheduled_articles(
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    output: str = Query("json", alias="format", pattern="^(json|ndjson)$"),
+    db: Session = Depends(get_db)
+):
+    """Get scheduled articles in publishing order, a page at a time or streamed with format=ndjson"""
+    if output == "ndjson":
+        return ndjson_response(lambda stream_db: _scheduled_articles_query(stream_db, skip, limit),
+                               _scheduled_article_item)
+    articles = _scheduled_articles_query(db, skip, limit or MAX_PAGE_SIZE).all()
+    return [_scheduled_article_item(article) for article in articles]
+
+def _scheduled_articles_query(db: Session, skip: int = 0, limit: Optional[int] = None):
+    query = db.query(models.Article).filter(
         models.Article.is_scheduled == True,
         models.Article.is_published == False
-    ).order_by(models.Article.scheduled_publish_at).all()
-    
-    result = []
-    for article in scheduled_articles:
-        result.append({
-            "id": article.id,
-            "title": article.title,
-            "short_title": article.short_title,
-            "author": article.author,
-            "language": article.language,
-            "category": article.category,
-            "scheduled_publish_at": article.scheduled_publish_at,
-            "created_at": article.created_at
-        })
-    
-    return result
+    ).order_by(models.Article.scheduled_publish_at, models.Article.id).offset(skip)
+    return query.limit(limit) if limit else query
+
+def _scheduled_article_item(article):
+    return {
+        "id": article.id,
+        "title": article.title,
+        "short_title": article.short_title,
+        "author": article.author,
+        "language": article.language,
+        "category": article.category,
+        "scheduled_publish_at": article.scheduled_publish_at,
+        "created_at": article.created_at
+    }
 
 # Analytics tracking endpoint
 @api_router.post("/analytics/track")
-async def track_analytics(tracking_data: dict):
+async def track_analytics(tracking_data: Union[List[dict], dict] = Body(...)):
     """
-    Track user interactions for analytics and SEO purposes
+    Track user interactions for analytics and SEO purposes.
+    Accepts a single event, a list of events, or {"events": [...]} and only
+    buffers them in memory; a background job persists them in batches.
     """
+    if isinstance(tracking_data, dict) and isinstance(tracking_data.get("events"), list):
+        events = tracking_data["events"]
+    elif isinstance(tracking_data, list):
+        events = tracking_data
+    else:
+        events = [tracking_data]
+    
+    if len(events) > ANALYTICS_MAX_EVENTS_PER_REQUEST:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {ANALYTICS_MAX_EVENTS_PER_REQUEST} events can be tracked per request"
+        )
+    
+    accepted, rejected = analytics_service.ingest(events)
+    
+    return {
+        "status": "success", 
+        "message": "Analytics data tracked successfully",
+        "timestamp": tracking_data.get("timestamp") if isinstance(tracking_data, dict) else None,
+        "accepted": accepted,
+        "rejected": rejected
+    }
+
+@api_router.get("/cms/analytics/timeseries")
+async def get_analytics_timeseries(
+    granularity: str = "hour",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    article_id: Optional[int] = None,
+    category: Optional[str] = None,
+    state: Optional[str] = None,
+    language: Optional[str] = None,
+    group_by: Optional[str] = None  # Comma-separated: "article_id,category,state,language"
+):
+    """Get event and view counts per time bucket from the analytics rollups"""
+    # Naive datetimes are treated as UTC
+    end_ts = (end if end.tzinfo else end.replace(tzinfo=timezone.utc)).timestamp() if end else time.time()
+    start_ts = (start if start.tzinfo else start.replace(tzinfo=timezone.utc)).timestamp() if start else end_ts - 86400
+    dimensions = [d.strip() for d in group_by.split(',') if d.strip()] if group_by else None
     try:
-        # Log the tracking data (in production, you'd save to database)
-        import logging
-        logging.info(f"Analytics Tracking: {tracking_data}")
-        
-        # Here you can save to database, send to analytics service, etc.
-        # For now, we'll just return success
-        
-        return {
-            "status": "success", 
-            "message": "Analytics data tracked successfully",
-            "timestamp": tracking_data.get("timestamp")
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Analytics tracking failed: {str(e)}")
+        return analytics_rollups.query(
+            granularity, start_ts, end_ts,
+            article_id=article_id, category=category, state=state, language=language,
+            group_by=dimensions
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@api_router.get("/cms/analytics/top-articles")
+async def get_analytics_top_articles(
+    window_hours: int = 24,
+    limit: int = 15,
+    category: Optional[str] = None,
+    state: Optional[str] = None,
+    language: Optional[str] = None
+):
+    """Get article ids ranked by views over a sliding window"""
+    return analytics_rollups.most_read(
+        window_hours * 3600, limit=limit, category=category, state=state, language=language
+    )
+
+@api_router.get("/admin/analytics/status")
+async def get_analytics_status():
+    """Get analytics ingestion buffer and flush counters (Admin only)"""
+    return analytics_service.stats()
 
 # Related Articles Configuration endpoints
 @api_router.get("/cms/related-articles-config")
@@ -1079,9 +1241,11 @@ async def save_uploaded_file(upload_file: UploadFile, subfolder: str) -> str:
     
     # Save file
     file_path = subfolder_path / unique_filename
-    async with aiofiles.open(file_path, 'wb') as f:
-        content = await upload_file.read()
-        await f.write(content)
+    with metrics.UPLOAD_DURATION.time((subfolder,)):
+        async with aiofiles.open(file_path, 'wb') as f:
+            content = await upload_file.read()
+            await f.write(content)
+    metrics.UPLOAD_BYTES.inc((subfolder,), len(content))
     
     # Return relative path for storage in database
     return f"uploads/{subfolder}/{unique_filename}"
@@ -1282,6 +1446,9 @@ async def delete_ott_release(release_id: int, db: Session = Depends(get_db)):
 @api_router.get("/releases/theater-bollywood")
 async def get_homepage_theater_bollywood_releases(db: Session = Depends(get_db)):
     """Get theater and Bollywood theater releases for homepage display"""
+    return _get_theater_bollywood_releases(db)
+
+def _get_theater_bollywood_releases(db: Session):
     this_week_theater = crud.get_this_week_theater_releases(db, limit=4)
     upcoming_theater = crud.get_upcoming_theater_releases(db, limit=4)
     
@@ -1374,6 +1541,98 @@ async def get_homepage_releases(db: Session = Depends(get_db)):
         }
     }
 
+RELEASE_CALENDAR_MAX_DAYS = 366
+
+def _month_bounds(year: int, month: int):
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+def _get_this_month_releases(db: Session, release_type: str):
+    today, _ = crud.ist_today()
+    first_day, last_day = _month_bounds(today.year, today.month)
+    return crud.get_releases_in_range(db, first_day, last_day, release_type)
+
+def _parse_release_type(release_type: str) -> Optional[str]:
+    if release_type == "all":
+        return None
+    if release_type not in crud.RELEASE_TYPES:
+        raise HTTPException(status_code=400, detail="release_type must be one of: all, theater, ott")
+    return release_type
+
+def _format_calendar_release(release):
+    release_data = {
+        "id": release.id,
+        "release_type": release.release_type,
+        "movie_name": release.movie_name,
+        "language": release.language,
+        "release_date": release.release_date,
+        "movie_image": release.movie_image,
+        "created_at": release.created_at
+    }
+    if release.release_type == "theater":
+        release_data["movie_banner"] = release.movie_banner
+    else:
+        release_data["ott_platform"] = release.ott_platform
+    return release_data
+
+@api_router.get("/releases/calendar")
+async def get_release_calendar(
+    start_date: date,
+    end_date: date,
+    release_type: str = "all",  # "all", "theater" or "ott"
+    db: Session = Depends(get_db)
+):
+    """Get theater and OTT releases in a date range, merged and sorted by release date"""
+    kind = _parse_release_type(release_type)
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date must not be before start_date")
+    if (end_date - start_date).days >= RELEASE_CALENDAR_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"Date range cannot exceed {RELEASE_CALENDAR_MAX_DAYS} days")
+
+    releases = crud.get_releases_in_range(db, start_date, end_date, kind)
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "total": len(releases),
+        "releases": [_format_calendar_release(release) for release in releases]
+    }
+
+@api_router.get("/releases/calendar/{year}/{month}")
+async def get_release_calendar_month(
+    year: int,
+    month: int,
+    release_type: str = "all",  # "all", "theater" or "ott"
+    include_releases: bool = False,
+    db: Session = Depends(get_db)
+):
+    """Get per-day release counts for a month grid, optionally with the releases themselves"""
+    kind = _parse_release_type(release_type)
+    if not 1 <= month <= 12 or not 1900 <= year <= 2999:
+        raise HTTPException(status_code=400, detail="Invalid year or month")
+
+    first_day, last_day = _month_bounds(year, month)
+    counts = crud.get_release_day_counts(db, first_day, last_day, kind)
+    days = []
+    for day in range(1, last_day.day + 1):
+        day_date = date(year, month, day)
+        day_counts = counts.get(day_date, {"theater": 0, "ott": 0})
+        days.append({
+            "date": day_date,
+            "theater": day_counts["theater"],
+            "ott": day_counts["ott"],
+            "total": day_counts["theater"] + day_counts["ott"]
+        })
+
+    response = {
+        "year": year,
+        "month": month,
+        "total": sum(day["total"] for day in days),
+        "days": days
+    }
+    if include_releases:
+        releases = crud.get_releases_in_range(db, first_day, last_day, kind)
+        response["releases"] = [_format_calendar_release(release) for release in releases]
+    return response
+
 # Frontend endpoints for theater-ott-releases page
 @api_router.get("/releases/theater-ott/page")
 async def get_theater_ott_page_releases(
@@ -1388,6 +1647,8 @@ async def get_theater_ott_page_releases(
         if release_type == "theater":
             if filter_type == "upcoming":
                 releases = crud.get_upcoming_theater_releases(db, limit=limit)
+            elif filter_type == "this_month":
+                releases = _get_this_month_releases(db, "theater")[skip:skip + limit]
             else:
                 releases = crud.get_theater_releases(db, skip=skip, limit=limit)
             
@@ -1410,6 +1671,8 @@ async def get_theater_ott_page_releases(
         else:  # ott
             if filter_type == "upcoming":
                 releases = crud.get_upcoming_ott_releases(db, limit=limit)
+            elif filter_type == "this_month":
+                releases = _get_this_month_releases(db, "ott")[skip:skip + limit]
             else:
                 releases = crud.get_ott_releases(db, skip=skip, limit=limit)
             
@@ -1432,38 +1695,189 @@ async def get_theater_ott_page_releases(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-# Movie content endpoints
-@api_router.get("/articles/movie/{movie_name}")
-async def get_articles_by_movie_name(movie_name: str, db: Session = Depends(get_db)):
-    """Get all articles tagged with a specific movie name"""
+# Homepage snapshot
+# Category slugs read by the homepage snapshot; writes to any of these trigger a rebuild
+HOMEPAGE_CATEGORIES = {
+    "top-stories", "national-top-stories", "movie-reviews", "movie-reviews-bollywood",
+    "ott-reviews", "ott-reviews-bollywood", "state-politics", "national-politics",
+    "movie-news", "movie-news-bollywood", "cricket", "other-sports",
+    "trending-videos", "bollywood-trending-videos", "nri-news", "world-news",
+    "viral-shorts", "viral-shorts-bollywood", "events-interviews", "events-interviews-bollywood",
+    "hot-topics", "hot-topics-bollywood", "photoshoots", "travel-pics",
+    "theater-releases-bollywood", "ott-releases-bollywood",
+    content_events.THEATER_RELEASES, content_events.OTT_RELEASES
+}
+
+def _build_homepage_snapshot(db: Session, state_codes: List[str]) -> dict:
+    """Render every homepage section for one state cohort, mirroring the section endpoints"""
+    def section(category_slug: str, limit: int, by_state: bool = False):
+        if by_state and state_codes:
+            articles = crud.get_articles_by_states(db, category_slug=category_slug, state_codes=state_codes, limit=limit)
+        else:
+            articles = crud.get_articles_by_category_slug(db, category_slug=category_slug, limit=limit)
+        return _format_article_response(articles, db)
+    
+    return {
+        "top_stories": {"top_stories": section("top-stories", 4), "national": section("national-top-stories", 4)},
+        "movie_reviews": {"movie_reviews": section("movie-reviews", 20), "bollywood": section("movie-reviews-bollywood", 20)},
+        "ott_movie_reviews": {"ott_movie_reviews": section("ott-reviews", 4), "web_series": section("ott-reviews-bollywood", 4)},
+        "politics": {"state_politics": section("state-politics", 20, by_state=True), "national_politics": section("national-politics", 20)},
+        "movies": {"movies": section("movie-news", 20), "bollywood": section("movie-news-bollywood", 20)},
+        "sports": {"cricket": section("cricket", 4), "other_sports": section("other-sports", 4)},
+        "trending_videos": {"trending_videos": section("trending-videos", 20, by_state=True), "bollywood": section("bollywood-trending-videos", 20)},
+        "nri_news": section("nri-news", 10, by_state=True),
+        "world_news": section("world-news", 10),
+        "viral_shorts": {"viral_shorts": section("viral-shorts", 20, by_state=True), "bollywood": section("viral-shorts-bollywood", 20)},
+        "events_interviews": {"events_interviews": section("events-interviews", 20), "bollywood": section("events-interviews-bollywood", 20)},
+        "hot_topics": {"hot_topics": section("hot-topics", 20, by_state=True), "bollywood": section("hot-topics-bollywood", 20)},
+        "photoshoots": section("photoshoots", 10),
+        "travel_pics": section("travel-pics", 10),
+        "releases": {
+            "theater_bollywood": _get_theater_bollywood_releases(db),
+            "ott_bollywood": _get_ott_bollywood_releases(db)
+        }
+    }
+
+homepage_snapshots.configure(_build_homepage_snapshot, HOMEPAGE_CATEGORIES)
+content_events.subscribe(homepage_snapshots.on_content_changed)
+content_events.subscribe_articles(related_content.on_articles_changed)
+
+@api_router.get("/homepage")
+async def get_homepage(request: Request, states: Optional[str] = None):
+    """Get the complete homepage for a state cohort from the materialized snapshot (no DB queries when warm)"""
+    cohort = cohort_key(states)
+    snapshot = homepage_snapshots.cached(cohort)
+    if snapshot is None:
+        # A miss renders the cohort from the database, so keep it off the event loop
+        snapshot = await run_in_threadpool(homepage_snapshots.get, cohort)
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == snapshot.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+content_events.subscribe(seo_feeds.on_content_changed)
+
+def _feed_file_response(request: Request, name: str, kind: str):
+    """Serve a generated sitemap or feed file, gzipped when the client accepts it, with conditional GET"""
+    path = seo_feeds.get_path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    headers = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    gz_path = path.with_name(path.name + ".gz")
+    if "gzip" in request.headers.get("accept-encoding", "") and gz_path.exists():
+        path = gz_path
+        headers["Content-Encoding"] = "gzip"
+    stat = path.stat()
+    headers["ETag"] = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers["Last-Modified"] = formatdate(stat.st_mtime, usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = headers["ETag"] in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*"
+    else:
+        try:
+            not_modified = parsedate_to_datetime(request.headers["if-modified-since"]).timestamp() >= int(stat.st_mtime)
+        except (KeyError, TypeError, ValueError):
+            not_modified = False
+    if not_modified:
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=FEED_MEDIA_TYPES[kind], headers=headers)
+
+@api_router.get("/sitemap.xml")
+def get_sitemap_index(request: Request):
+    """Sitemap index listing the per-category sitemaps"""
+    return _feed_file_response(request, SITEMAP_INDEX, "sitemap")
+
+@api_router.get("/sitemaps/{name}")
+def get_category_sitemap(request: Request, name: str):
+    """One page of a category's sitemap (sitemap-<category>-<page>.xml)"""
+    if not name.startswith("sitemap-"):
+        raise HTTPException(status_code=404, detail="Not found")
+    return _feed_file_response(request, name, "sitemap")
+
+@api_router.get("/feeds/{category}/{kind}.xml")
+def get_category_feed(request: Request, category: str, kind: str):
+    """Latest articles of a category as an RSS (rss.xml) or Atom (atom.xml) feed"""
+    if kind not in FEED_KINDS:
+        raise HTTPException(status_code=404, detail="Not found")
+    return _feed_file_response(request, feed_name(kind, category), kind)
+
+@api_router.get("/admin/feeds")
+async def get_feed_status():
+    """Get sitemap and feed generation status per category (Admin only)"""
+    return seo_feeds.stats()
+
+@api_router.post("/admin/feeds/rebuild")
+def rebuild_feeds():
+    """Regenerate every sitemap and feed now (Admin only)"""
+    return seo_feeds.rebuild()
+
+@api_router.get("/admin/homepage-snapshots")
+async def get_homepage_snapshot_status():
+    """Get homepage snapshot staleness and build timings (Admin only)"""
+    return homepage_snapshots.stats()
+
+@api_router.get("/admin/related-content")
+async def get_related_content_status():
+    """Get related content engine status (Admin only)"""
+    return related_content.stats()
+
+@api_router.post("/admin/related-content/rebuild")
+def rebuild_related_content():
+    """Rebuild the content similarity model and all neighbour lists now (Admin only)"""
+    articles = related_content.rebuild()
+    return {"message": "Related content rebuilt", "articles": articles}
+
+@api_router.get("/admin/backups")
+async def get_backup_status():
+    """List backup snapshots with last backup and verification results (Admin only)"""
+    return backup_service.stats()
+
+@api_router.post("/admin/backups")
+def run_backup():
+    """Take an online backup of the databases and uploads now (Admin only)"""
+    return backup_service.run_backup()
+
+@api_router.post("/admin/backups/verify")
+def verify_backup(snapshot_id: Optional[str] = None):
+    """Restore a backup into a temp dir and check its integrity (Admin only)"""
+    if snapshot_id is not None and snapshot_id not in {snapshot["id"] for snapshot in backup_service.list_snapshots()}:
+        raise HTTPException(status_code=404, detail="Backup not found")
     try:
-        # Search for articles by movie name in title or tags
-        articles = db.query(models.Article).filter(
-            or_(
-                models.Article.title.ilike(f"%{movie_name}%"),
-                models.Article.tags.ilike(f"%{movie_name}%")
-            )
-        ).filter(models.Article.is_published == True).order_by(desc(models.Article.published_at)).all()
-        
-        return articles
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        return backup_service.verify(snapshot_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
-@api_router.get("/articles/search")
-async def search_articles(q: str, db: Session = Depends(get_db)):
-    """Search articles by query in title, content, or tags"""
+@api_router.post("/admin/profile", dependencies=[Depends(require_admin)])
+async def profile_worker(seconds: float = 10, interval_ms: float = PROFILE_DEFAULT_INTERVAL_MS,
+                         format: str = "json", include_idle: bool = False):
+    """Sample the stacks of this worker's threads for a while (Admin only).
+
+    format=collapsed returns flamegraph-ready collapsed stacks as plain text.
+    """
+    if format not in ("json", "collapsed"):
+        raise HTTPException(status_code=400, detail="format must be 'json' or 'collapsed'")
+    sampling_profiler.configure_routes(app.routes)
     try:
-        articles = db.query(models.Article).filter(
-            or_(
-                models.Article.title.ilike(f"%{q}%"),
-                models.Article.content.ilike(f"%{q}%"),
-                models.Article.tags.ilike(f"%{q}%")
-            )
-        ).filter(models.Article.is_published == True).order_by(desc(models.Article.published_at)).limit(50).all()
-        
-        return articles
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        # Sample from a worker thread so the event loop keeps serving the traffic being profiled
+        result = await run_in_threadpool(sampling_profiler.profile, seconds, interval_ms, include_idle)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if format == "collapsed":
+        return PlainTextResponse(result["collapsed"] + "\n")
+    return result
+
+@api_router.get("/admin/profile", dependencies=[Depends(require_admin)])
+async def get_last_profile():
+    """Summary of the last profile taken on this worker (Admin only)"""
+    return {"last_profile": sampling_profiler.last_profile}
+
+@api_router.post("/admin/homepage-snapshots/rebuild")
+async def rebuild_homepage_snapshots():
+    """Rebuild all homepage snapshots now (Admin only)"""
+    rebuilt = await run_in_threadpool(homepage_snapshots.rebuild_all)
+    return {"message": "Homepage snapshots rebuilt", "cohorts": rebuilt}
 
 # Include routers
 app.include_router(api_router)
@@ -1479,6 +1893,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request SQL counts and timings (Server-Timing header, request log, slow-query and N+1 warnings).
+# Added last so it wraps the metrics middleware, which reads the request's statement count.
+instrument_engine(engine)
+app.add_middleware(metrics.MetricsMiddleware, statements_per_request=current_statement_count)
+app.add_middleware(SQLInstrumentationMiddleware)
+
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """Prometheus text-format metrics for this worker"""
+    return Response(content=metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -1486,18 +1911,95 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _ensure_schema():
+    """Check the schema with catalog queries instead of running DDL on every boot"""
+    missing = missing_tables()
+    pending = migrations.pending()
+    # Only a truly fresh database is migrated here; on an existing one the data
+    # migrations can rewrite live rows for minutes and must run out of band
+    fresh = len(pending) == len(migrations.MIGRATIONS) and "articles" in missing
+    if fresh:
+        if not SCHEMA_AUTO_CREATE:
+            raise RuntimeError("Database has no tables yet; run `python migrations.py migrate`")
+        # Every migration is quick on empty tables
+        logger.info(f"Creating the schema in a new database ({len(pending)} migrations)")
+        init_db()
+        return
+    if missing:
+        raise RuntimeError(
+            f"Database is missing tables {missing} with {len(pending)} pending migration(s); "
+            f"run `python migrations.py migrate`"
+        )
+    if pending:
+        logger.warning(
+            f"{len(pending)} pending schema migration(s) (first: {pending[0].version} {pending[0].name}); "
+            f"run `python migrations.py migrate`"
+        )
+
+async def _bootstrap_default_admin():
+    try:
+        await asyncio.wait_for(create_default_admin(), timeout=DEFAULT_ADMIN_TIMEOUT_SECONDS)
+    except Exception as e:
+        logger.warning(f"Default admin bootstrap failed (the API keeps serving): {str(e) or type(e).__name__}")
+
 @app.on_event("startup")
 async def startup_event():
     logger.info("Blog CMS API starting up...")
-    # Create default admin user
-    await create_default_admin()
+    _ensure_schema()
+    
+    # Load reference data and pre-serialize the CMS config
+    db = SessionLocal()
+    try:
+        reference_data.refresh_categories(db)
+    finally:
+        db.close()
+    
+    # Create default admin user without waiting on Mongo
+    if CREATE_DEFAULT_ADMIN:
+        app.state.admin_bootstrap = asyncio.create_task(_bootstrap_default_admin())
     
     # Initialize the article scheduler
     article_scheduler.initialize_scheduler()
     article_scheduler.start_scheduler()
+    
+    # Start the analytics flush, rollup and trending jobs
+    trending_engine.start()
+    analytics_service.add_listener(trending_engine.record_analytics_batch)
+    analytics_service.start()
+    analytics_rollups.start()
+    
+    # Keep homepage snapshots warm
+    homepage_snapshots.start()
+    
+    # Serve precomputed related content and rebuild the similarity model
+    related_content.start()
+    
+    # Periodic online backups and verification restores
+    backup_service.start()
+    
+    # Work off queued article translations
+    translation_queue.start()
+    
+    # Regenerate sitemaps and feeds for categories touched by content writes
+    seo_feeds.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Blog CMS API shutting down...")
+    admin_bootstrap = getattr(app.state, "admin_bootstrap", None)
+    if admin_bootstrap is not None and not admin_bootstrap.done():
+        admin_bootstrap.cancel()
+    
     # Stop the article scheduler
     article_scheduler.stop_scheduler()
+    
+    # Persist any buffered analytics events and roll them up
+    analytics_service.stop()
+    analytics_rollups.run_rollup()
+    analytics_rollups.stop()
+    trending_engine.stop()
+    homepage_snapshots.stop()
+    related_content.stop()
+    backup_service.stop()
+    translation_queue.stop()
+    seo_feeds.stop()
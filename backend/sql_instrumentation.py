@@ -0,0 +1,138 @@
+import logging
+import os
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from metrics import DB_STATEMENT_DURATION
+
+logger = logging.getLogger(__name__)
+
+# Statements slower than this are logged with their query plan
+SQL_SLOW_QUERY_MS = float(os.environ.get("SQL_SLOW_QUERY_MS", 100))
+# The same statement run more than this many times in one request is reported as a likely N+1
+SQL_N_PLUS_ONE_THRESHOLD = int(os.environ.get("SQL_N_PLUS_ONE_THRESHOLD", 10))
+# One structured log line per request with its SQL count and time
+SQL_LOG_REQUESTS = os.environ.get("SQL_LOG_REQUESTS", "true").lower() == "true"
+STATEMENT_LOG_LENGTH = 500
+
+
+class RequestSQLStats:
+    """SQL statements issued while handling one request"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def record(self, statement: str, duration: float):
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+
+_request_stats: ContextVar[Optional[RequestSQLStats]] = ContextVar("request_sql_stats", default=None)
+
+
+def current_stats() -> Optional[RequestSQLStats]:
+    """Stats for the request being handled, or None outside a request"""
+    return _request_stats.get()
+
+
+def current_statement_count() -> Optional[int]:
+    """Statements issued so far by the request being handled"""
+    stats = _request_stats.get()
+    return stats.count if stats is not None else None
+
+
+def _explain(cursor, statement: str, parameters) -> str:
+    try:
+        # A second cursor on the same connection leaves the original result set untouched
+        plan_cursor = cursor.connection.cursor()
+        try:
+            rows = plan_cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ()).fetchall()
+        finally:
+            plan_cursor.close()
+        return " | ".join(str(row[-1]) for row in rows)
+    except Exception as e:
+        return f"unavailable ({str(e)})"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info.pop("query_started", time.perf_counter())
+    DB_STATEMENT_DURATION.observe(duration)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+    if duration * 1000 >= SQL_SLOW_QUERY_MS:
+        plan = "n/a (executemany)" if executemany else _explain(cursor, statement, parameters)
+        logger.warning(
+            f"Slow query duration_ms={duration * 1000:.1f} statement={statement[:STATEMENT_LOG_LENGTH]!r} "
+            f"plan={plan!r}"
+        )
+
+
+def instrument_engine(engine: Engine):
+    """Time every statement on the engine and attribute it to the current request"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class SQLInstrumentationMiddleware:
+    """ASGI middleware: per-request SQL stats as a Server-Timing header and a log line"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestSQLStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                total_ms = (time.perf_counter() - started) * 1000
+                server_timing = (
+                    f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries", app;dur={total_ms:.2f}'
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", server_timing.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            self._report(scope, stats, status_code, time.perf_counter() - started)
+
+    @staticmethod
+    def _report(scope, stats: RequestSQLStats, status_code: int, duration: float):
+        method, path = scope.get("method"), scope.get("path")
+        if SQL_LOG_REQUESTS:
+            logger.info(
+                f"request method={method} path={path} status={status_code} duration_ms={duration * 1000:.1f} "
+                f"sql_count={stats.count} sql_ms={stats.duration * 1000:.1f}"
+            )
+        for statement, count in stats.statements.items():
+            if count > SQL_N_PLUS_ONE_THRESHOLD:
+                logger.warning(
+                    f"Possible N+1 query method={method} path={path} executions={count} "
+                    f"statement={statement[:STATEMENT_LOG_LENGTH]!r}"
+                )
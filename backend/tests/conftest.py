@@ -0,0 +1,23 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Backend modules import each other flat, as they do when the server runs from backend/
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+# Keep every database and generated file out of the working tree; set before any backend import
+_DATA_DIR = Path(tempfile.mkdtemp(prefix="blog_cms_tests_"))
+for _name, _default in (
+    ("BLOG_CMS_DB_PATH", _DATA_DIR / "blog_cms.db"),
+    ("ANALYTICS_DB_PATH", _DATA_DIR / "analytics.db"),
+    ("RATE_LIMIT_DB_PATH", _DATA_DIR / "rate_limits.db"),
+    ("FEED_DIR", _DATA_DIR / "feeds"),
+    ("HOMEPAGE_SNAPSHOT_DIR", _DATA_DIR / "snapshots"),
+    ("BACKUP_DIR", _DATA_DIR / "backups"),
+    ("BACKUP_UPLOAD_DIR", _DATA_DIR / "uploads"),
+):
+    os.environ.setdefault(_name, str(_default))
+os.environ.setdefault("CREATE_DEFAULT_ADMIN", "false")
+os.environ.setdefault("MIGRATION_BATCH_PAUSE_MS", "0")
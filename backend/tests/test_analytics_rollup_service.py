@@ -0,0 +1,71 @@
+import sqlite3
+import time
+
+import pytest
+
+import analytics_rollup_service
+from analytics_rollup_service import AnalyticsRollupService
+from analytics_service import AnalyticsIngestionService
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "analytics.db"
+
+
+def ingest(db_path, events):
+    ingestion = AnalyticsIngestionService(db_path=db_path)
+    ingestion.ingest(events)
+    ingestion.flush()
+
+
+def totals(rollups, granularity="hour"):
+    rows = rollups.query(granularity, 0, time.time() + 86400, group_by=["article_id"])
+    result = {}
+    for row in rows:
+        events, views = result.get(row["article_id"], (0, 0))
+        result[row["article_id"]] = (events + row["events"], views + row["views"])
+    return result
+
+
+def test_counts_only_article_views(db_path):
+    ingest(db_path, [
+        {"action": "article_view", "articleId": 1},
+        {"action": "view", "articleId": 1},
+        {"action": "gallery_page_view", "galleryId": 1},
+        {"action": "image_navigation_fullscreen_view", "articleId": 1},
+        {"action": "view"},
+    ])
+    rollups = AnalyticsRollupService(db_path=db_path)
+    assert rollups.run_rollup() == 5
+    assert totals(rollups) == {0: (2, 0), 1: (3, 2)}
+    assert rollups.most_read(3600) == [{"article_id": 1, "views": 2}]
+
+
+def test_rerun_does_not_double_count(db_path):
+    ingest(db_path, [{"action": "view", "articleId": 1}] * 3)
+    rollups = AnalyticsRollupService(db_path=db_path)
+    assert rollups.run_rollup() == 3
+    assert rollups.run_rollup() == 0
+    # A second process starts from the stored watermark, not from zero
+    assert AnalyticsRollupService(db_path=db_path).run_rollup() == 0
+    assert totals(rollups) == {1: (3, 3)}
+
+    ingest(db_path, [{"action": "view", "articleId": 1}, {"action": "view", "articleId": 2}])
+    assert rollups.run_rollup() == 2
+    assert rollups.last_event_id == 5
+    assert totals(rollups) == {1: (4, 4), 2: (1, 1)}
+
+
+def test_chunks_upsert_into_the_same_buckets(db_path, monkeypatch):
+    monkeypatch.setattr(analytics_rollup_service, "ROLLUP_CHUNK_SIZE", 2)
+    ingest(db_path, [{"action": "view", "articleId": 1 + index % 2} for index in range(7)])
+    rollups = AnalyticsRollupService(db_path=db_path)
+    assert rollups.run_rollup() == 7
+    for granularity in ("minute", "hour", "day"):
+        assert totals(rollups, granularity) == {1: (4, 4), 2: (3, 3)}
+
+    connection = sqlite3.connect(str(db_path))
+    watermark = connection.execute("SELECT last_event_id FROM analytics_rollup_state WHERE name = 'events'").fetchone()
+    connection.close()
+    assert watermark == (7,)
@@ -0,0 +1,64 @@
+import json
+
+import analytics_service
+from analytics_service import EVENT_COLUMNS, normalize_event
+
+
+def as_dict(row):
+    return dict(zip(EVENT_COLUMNS, row))
+
+
+def test_maps_payload_aliases_to_columns():
+    row = as_dict(normalize_event({
+        "userAction": "article_view", "articleId": "42", "section": "politics",
+        "state": "ap", "lang": "te", "sessionId": "s1", "timestamp": "2024-01-01T00:00:00Z"
+    }, 100.0))
+    assert row["received_at"] == 100.0
+    assert row["action"] == "article_view"
+    assert row["article_id"] == 42
+    assert row["category"] == "politics"
+    assert row["language"] == "te"
+    assert row["session_id"] == "s1"
+    assert row["props"] is None
+
+
+def test_rejects_non_objects_and_missing_action():
+    assert normalize_event(["action", "view"], 1.0) is None
+    assert normalize_event({"articleId": 1}, 1.0) is None
+    assert normalize_event({"action": ""}, 1.0) is None
+
+
+def test_uncoercible_values_become_null():
+    row = as_dict(normalize_event({"action": "view", "articleId": "abc", "category": {"x": 1}}, 1.0))
+    assert row["article_id"] is None
+    assert row["category"] is None
+    assert as_dict(normalize_event({"action": "view", "articleId": True}, 1.0))["article_id"] is None
+
+
+def test_truncates_strings_to_schema_length():
+    row = as_dict(normalize_event({"action": "x" * 500}, 1.0))
+    assert len(row["action"]) == 64
+
+
+def test_gallery_id_is_kept_out_of_article_id():
+    row = as_dict(normalize_event({"action": "gallery_page_view", "galleryId": 7}, 1.0))
+    assert row["article_id"] is None
+    assert json.loads(row["props"]) == {"galleryId": 7}
+
+
+def test_unknown_keys_go_to_props_unless_too_large():
+    row = as_dict(normalize_event({"action": "click", "button": "share"}, 1.0))
+    assert json.loads(row["props"]) == {"button": "share"}
+
+    big = "x" * (analytics_service.ANALYTICS_MAX_PROPS_BYTES + 1)
+    assert as_dict(normalize_event({"action": "click", "blob": big}, 1.0))["props"] is None
+
+
+def test_listener_registered_twice_is_notified_once(tmp_path):
+    service = analytics_service.AnalyticsIngestionService(db_path=tmp_path / "analytics.db")
+    batches = []
+    service.add_listener(batches.append)
+    service.add_listener(batches.append)
+    service.ingest([{"action": "view", "article_id": 1}])
+    assert service.flush() == 1
+    assert len(batches) == 1
@@ -0,0 +1,89 @@
+import re
+from datetime import datetime, timedelta
+
+import pytest
+
+import feed_service
+import models
+from database import DB_PATH, SessionLocal
+from feed_service import FeedService, iter_feed_rows, iter_sitemap_rows
+from migrations import migrate
+
+ARTICLES = 25
+
+
+@pytest.fixture(scope="module")
+def article_ids():
+    migrate(DB_PATH)
+    db = SessionLocal()
+    published_at = datetime(2024, 1, 1)
+    articles = [
+        models.Article(
+            title=f"Article {index}", slug=f"article-{index}", content="body", summary="summary",
+            author="desk", category="feed-test", is_published=index % 5 != 0,
+            # Pairs share a timestamp so feed paging has to break ties on id
+            published_at=published_at + timedelta(hours=index // 2)
+        )
+        for index in range(ARTICLES)
+    ]
+    db.add_all(articles)
+    db.commit()
+    ids = [article.id for article in articles if article.is_published]
+    yield ids
+    db.query(models.Article).filter(models.Article.category == "feed-test").delete()
+    db.commit()
+    db.close()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 20, 1000])
+def test_sitemap_rows_page_by_id(db, article_ids, batch_size):
+    assert [row.id for row in iter_sitemap_rows(db, "feed-test", batch_size=batch_size)] == article_ids
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 1000])
+def test_feed_rows_page_newest_first(db, article_ids, batch_size):
+    expected = [
+        row.id for row in db.query(models.Article).filter(models.Article.id.in_(article_ids))
+        .order_by(models.Article.published_at.desc(), models.Article.id.desc()).limit(7)
+    ]
+    assert [row.id for row in iter_feed_rows(db, "feed-test", limit=7, batch_size=batch_size)] == expected
+
+
+def sitemap_ids(path):
+    return [int(match) for match in re.findall(r"/article/(\d+)/", path.read_text())]
+
+
+def test_sitemap_split_across_files(article_ids, tmp_path, monkeypatch):
+    monkeypatch.setattr(feed_service, "SITEMAP_MAX_URLS", 7)
+    service = FeedService(feed_dir=tmp_path)
+    result = service.rebuild(["feed-test"])
+    assert result["categories"] == ["feed-test"]
+
+    files = [name for name in service.manifest["categories"]["feed-test"]["files"] if name.startswith("sitemap-")]
+    assert files == [f"sitemap-feed-test-{page}.xml" for page in (1, 2, 3)]
+    pages = [sitemap_ids(tmp_path / name) for name in files]
+    assert [len(page) for page in pages] == [7, 7, 6]
+    assert [article_id for page in pages for article_id in page] == article_ids
+
+    index = (tmp_path / "sitemap.xml").read_text()
+    assert all(f"/sitemaps/{name}" in index for name in files)
+
+
+def test_unchanged_rebuild_rewrites_nothing(article_ids, tmp_path, monkeypatch):
+    monkeypatch.setattr(feed_service, "SITEMAP_MAX_URLS", 7)
+    service = FeedService(feed_dir=tmp_path)
+    service.rebuild(["feed-test"])
+    assert service.rebuild(["feed-test"])["files_changed"] == 0
+
+    # A larger page size needs fewer files; the surplus page is removed
+    monkeypatch.setattr(feed_service, "SITEMAP_MAX_URLS", 10)
+    service.rebuild(["feed-test"])
+    assert not (tmp_path / "sitemap-feed-test-3.xml").exists()
+    assert [len(sitemap_ids(tmp_path / f"sitemap-feed-test-{page}.xml")) for page in (1, 2)] == [10, 10]
@@ -0,0 +1,31 @@
+import pytest
+
+from homepage_snapshot_service import HomepageSnapshotService, cohort_key
+
+
+@pytest.mark.parametrize("states, expected", [
+    (None, "all"),
+    ("", "all"),
+    ("all", "all"),
+    ("ap", "ap"),
+    ("ts,ap", "ap,ts"),
+    (" TS , ap,ap ", "ap,ts"),
+    ("all,ap", "ap"),
+    ("zz,qq", "all"),
+    ("ap,zz", "ap"),
+    (",,", "all"),
+])
+def test_cohort_key(states, expected):
+    assert cohort_key(states) == expected
+
+
+def test_unknown_states_do_not_create_cohorts(tmp_path):
+    builds = []
+    service = HomepageSnapshotService(snapshot_dir=tmp_path)
+    service.configure(lambda db, codes: builds.append(codes) or {"codes": codes}, {"politics"})
+
+    first = service.get(cohort_key("zz"))
+    second = service.get(cohort_key("qq,xx"))
+    assert first is second
+    assert list(service.snapshots) == ["all"]
+    assert len(builds) == 1
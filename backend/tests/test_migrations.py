@@ -0,0 +1,64 @@
+import pytest
+
+import migrations
+from migrations import MIGRATIONS, applied_versions, batched_update, connect, migrate, pending
+
+
+def test_migrate_applies_everything_once(tmp_path):
+    db_path = tmp_path / "blog_cms.db"
+    assert migrate(db_path) == [m.version for m in MIGRATIONS]
+    assert migrate(db_path) == []
+    assert pending(db_path) == []
+
+    connection = connect(db_path)
+    try:
+        assert set(applied_versions(connection)) == {m.version for m in MIGRATIONS}
+        assert migrations.table_exists(connection, "articles")
+        assert connection.execute("SELECT COUNT(*) FROM migration_progress").fetchone() == (0,)
+    finally:
+        connection.close()
+
+
+def test_migrate_stops_at_target(tmp_path):
+    db_path = tmp_path / "blog_cms.db"
+    assert migrate(db_path, target=3) == [m.version for m in MIGRATIONS if m.version <= 3]
+    assert [m.version for m in pending(db_path)] == [m.version for m in MIGRATIONS if m.version > 3]
+    assert migrate(db_path) == [m.version for m in MIGRATIONS if m.version > 3]
+
+
+@pytest.fixture
+def items(tmp_path):
+    connection = connect(tmp_path / "items.db")
+    connection.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, kind TEXT)")
+    connection.executemany("INSERT INTO items (id, kind) VALUES (?, ?)",
+                           [(item_id, "old" if item_id % 2 else "keep") for item_id in range(1, 26)])
+    yield connection
+    connection.close()
+
+
+def test_batched_update_resumes_after_interruption(items, monkeypatch):
+    batches = []
+
+    def interrupt_after_two_batches(seconds):
+        batches.append(seconds)
+        if len(batches) == 2:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(migrations, "MIGRATION_BATCH_PAUSE_MS", 1)
+    monkeypatch.setattr(migrations.time, "sleep", interrupt_after_two_batches)
+    with pytest.raises(KeyboardInterrupt):
+        batched_update(items, "0099_items", "items", "kind = 'new'", "kind = 'old'", batch_size=5)
+    # Both finished ranges are committed along with their progress
+    assert items.execute("SELECT last_id FROM migration_progress WHERE key = '0099_items'").fetchone() == (10,)
+    assert items.execute("SELECT COUNT(*) FROM items WHERE kind = 'new'").fetchone() == (5,)
+
+    monkeypatch.setattr(migrations.time, "sleep", lambda seconds: None)
+    assert batched_update(items, "0099_items", "items", "kind = 'new'", "kind = 'old'", batch_size=5) == 8
+    assert items.execute("SELECT COUNT(*) FROM items WHERE kind = 'old'").fetchone() == (0,)
+    assert items.execute("SELECT COUNT(*) FROM items WHERE kind = 'keep'").fetchone() == (12,)
+    assert items.execute("SELECT last_id FROM migration_progress WHERE key = '0099_items'").fetchone() == (25,)
+
+
+def test_batched_update_skips_missing_tables(items):
+    assert batched_update(items, "0099_missing", "missing", "kind = 'new'", "1") == 0
+
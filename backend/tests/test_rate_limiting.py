@@ -0,0 +1,83 @@
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+import rate_limiting
+from rate_limiting import MemoryBackend, RateLimit, RateLimiter, SQLiteBackend
+
+# One token every 2 seconds, up to 3 at once
+LIMIT = RateLimit(per_minute=30, burst=3)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryBackend()
+    return SQLiteBackend(tmp_path / "rate_limits.db")
+
+
+def test_burst_then_retry_after(backend):
+    assert [backend.take("c", LIMIT, 100.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert backend.take("c", LIMIT, 100.0) == pytest.approx(2.0)
+    # Other clients have buckets of their own
+    assert backend.take("other", LIMIT, 100.0) == 0.0
+
+
+def test_refill_over_time(backend):
+    for _ in range(3):
+        backend.take("c", LIMIT, 100.0)
+    assert backend.take("c", LIMIT, 101.0) == pytest.approx(1.0)
+    assert backend.take("c", LIMIT, 102.0) == 0.0
+    assert backend.take("c", LIMIT, 102.0) == pytest.approx(2.0)
+
+
+def test_refill_is_capped_at_burst(backend):
+    backend.take("c", LIMIT, 100.0)
+    results = [backend.take("c", LIMIT, 10000.0) for _ in range(4)]
+    assert results[:3] == [0.0, 0.0, 0.0]
+    assert results[3] > 0
+
+
+def test_memory_backend_forgets_least_recent_clients():
+    backend = MemoryBackend(max_clients=2)
+    for client in ("a", "b", "c"):
+        backend.take(client, LIMIT, 100.0)
+    assert list(backend._buckets) == ["b", "c"]
+
+
+def make_request(host="203.0.113.5", headers=()):
+    return Request({"type": "http", "client": (host, 1234),
+                    "headers": [(name.encode(), value.encode()) for name, value in headers]})
+
+
+def test_limit_dependency_raises_429_with_retry_after():
+    limiter = RateLimiter(backend=MemoryBackend(), route_classes={"search": LIMIT}, enabled=True)
+    dependency = limiter.limit("search")
+    for _ in range(3):
+        dependency(make_request())
+    with pytest.raises(HTTPException) as excinfo:
+        dependency(make_request())
+    assert excinfo.value.status_code == 429
+    assert int(excinfo.value.headers["Retry-After"]) >= 1
+    dependency(make_request(host="198.51.100.7"))
+
+
+def test_limit_rejects_unknown_route_class():
+    with pytest.raises(KeyError):
+        RateLimiter(backend=MemoryBackend(), route_classes={}).limit("search")
+
+
+def test_failing_backend_allows_requests():
+    class BrokenBackend:
+        def take(self, key, limit, now):
+            raise OSError("disk I/O error")
+
+    limiter = RateLimiter(backend=BrokenBackend(), route_classes={"search": LIMIT}, enabled=True)
+    assert limiter.check("search", "client") == 0.0
+
+
+def test_forwarded_for_is_only_trusted_when_enabled(monkeypatch):
+    request = make_request(headers=[("x-forwarded-for", "192.0.2.1, 10.0.0.1")])
+    assert rate_limiting.client_address(request) == "203.0.113.5"
+    monkeypatch.setattr(rate_limiting, "RATE_LIMIT_TRUST_FORWARDED_FOR", True)
+    assert rate_limiting.client_address(request) == "192.0.2.1"
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+
+import pytest
+
+from request_coalescing import SingleFlight
+
+
+def run_concurrently(flight, key, func, callers):
+    """Start callers of flight.run at once; func blocks until every caller has joined"""
+    async def main():
+        tasks = [asyncio.ensure_future(flight.run(key, func)) for _ in range(callers)]
+        await asyncio.sleep(0.05)
+        in_flight = flight.in_flight()
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return in_flight, results
+
+    release = threading.Event()
+    return release, main
+
+
+def test_concurrent_callers_share_one_result():
+    calls = []
+
+    def work():
+        calls.append(1)
+        release.wait(5)
+        return {"value": len(calls)}
+
+    flight = SingleFlight("test")
+    release, main = run_concurrently(flight, "key", work, 5)
+    in_flight, results = asyncio.run(main())
+    assert calls == [1]
+    assert in_flight == 1
+    assert all(result is results[0] for result in results)
+    assert flight.in_flight() == 0
+
+
+def test_concurrent_callers_share_one_exception():
+    calls = []
+
+    def work():
+        calls.append(1)
+        release.wait(5)
+        raise ValueError("boom")
+
+    flight = SingleFlight("test")
+    release, main = run_concurrently(flight, "key", work, 3)
+    _, results = asyncio.run(main())
+    assert calls == [1]
+    assert all(isinstance(result, ValueError) for result in results)
+    assert all(result is results[0] for result in results)
+    assert flight.in_flight() == 0
+
+
+def test_nothing_is_cached_after_a_run():
+    flight = SingleFlight("test")
+    counter = iter(range(10))
+
+    async def main():
+        return [await flight.run("key", next, counter) for _ in range(2)]
+
+    assert asyncio.run(main()) == [0, 1]
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight("test")
+
+    async def main():
+        return await asyncio.gather(flight.run("a", lambda: "a"), flight.run("b", lambda: "b"))
+
+    assert asyncio.run(main()) == ["a", "b"]
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    release = threading.Event()
+    flight = SingleFlight("test")
+
+    def work():
+        release.wait(5)
+        return "done"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.run("key", work))
+        follower = asyncio.ensure_future(flight.run("key", work))
+        await asyncio.sleep(0.05)
+        leader.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == "done"
@@ -0,0 +1,113 @@
+import pytest
+
+import models
+import translation_service
+from database import DB_PATH, SessionLocal
+from migrations import migrate
+from translation_service import DONE, FAILED, QUEUED, StubTranslator, TranslationQueue, Translator
+
+
+class FailingTranslator(Translator):
+    def translate(self, texts, source_language, target_language):
+        raise RuntimeError("translation backend unavailable")
+
+
+@pytest.fixture
+def db():
+    migrate(DB_PATH)
+    session = SessionLocal()
+    yield session
+    session.rollback()
+    session.query(models.TranslationJob).delete()
+    session.query(models.Article).filter(models.Article.category == "translation-test").delete()
+    session.commit()
+    session.close()
+
+
+@pytest.fixture
+def article(db):
+    article = models.Article(
+        title="Box office report", summary="Opening weekend numbers", content="Full story",
+        author="desk", slug="box-office-report", category="translation-test", language="en"
+    )
+    db.add(article)
+    db.commit()
+    return article
+
+
+def jobs_by_language(article_id):
+    session = SessionLocal()
+    try:
+        return {job.language: job for job in session.query(models.TranslationJob).filter(
+            models.TranslationJob.original_article_id == article_id
+        )}
+    finally:
+        session.close()
+
+
+def test_enqueue_deduplicates_by_article_and_language(db, article):
+    queue = TranslationQueue(translator=StubTranslator())
+    result = queue.enqueue(db, article, ["te", "hi", "te", "en"])
+    assert result["queued"] == ["te", "hi"]
+    assert result["deduplicated"] == []
+    assert result["counts"][QUEUED] == 2
+
+    again = queue.enqueue(db, article, ["hi", "ta"])
+    assert again["queued"] == ["ta"]
+    assert again["deduplicated"] == ["hi"]
+    assert sorted(jobs_by_language(article.id)) == ["hi", "ta", "te"]
+
+
+def test_enqueue_requeues_failed_jobs(db, article):
+    queue = TranslationQueue(translator=StubTranslator())
+    queue.enqueue(db, article, ["te"])
+    job = db.query(models.TranslationJob).filter_by(original_article_id=article.id, language="te").one()
+    job.status, job.attempts, job.error = FAILED, 3, "boom"
+    db.commit()
+
+    result = queue.enqueue(db, article, ["te"])
+    assert result["queued"] == ["te"]
+    job = jobs_by_language(article.id)["te"]
+    assert (job.status, job.attempts, job.error) == (QUEUED, 0, None)
+
+
+def test_run_pending_claims_and_finishes_jobs(db, article):
+    queue = TranslationQueue(workers=2, translator=StubTranslator())
+    queue.enqueue(db, article, ["te", "hi", "ta"])
+    assert queue.run_pending() == 3
+    assert queue.run_pending() == 0
+
+    jobs = jobs_by_language(article.id)
+    assert {job.status for job in jobs.values()} == {DONE}
+    translated = db.get(models.Article, jobs["te"].translated_article_id)
+    assert translated.original_article_id == article.id
+    assert translated.language == "te"
+    assert translated.title == "[TE] Box office report"
+
+    # Only failed jobs are requeued; a finished translation is left alone
+    assert queue.enqueue(db, article, ["te"])["deduplicated"] == ["te"]
+
+
+def test_failing_translation_is_retried_then_failed(db, article, monkeypatch):
+    monkeypatch.setattr(translation_service, "TRANSLATION_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(translation_service, "TRANSLATION_RETRY_SECONDS", 0)
+    queue = TranslationQueue(workers=1, translator=FailingTranslator())
+    queue.enqueue(db, article, ["te"])
+
+    assert queue.run_pending() == 2
+    job = jobs_by_language(article.id)["te"]
+    assert job.status == FAILED
+    assert job.attempts == 2
+    assert job.error == "RuntimeError: translation backend unavailable"
+    assert job.translated_article_id is None
+
+
+def test_claimed_job_deleted_before_processing(db, article):
+    queue = TranslationQueue(translator=StubTranslator())
+    queue.enqueue(db, article, ["te"])
+    [(job_id, token)] = queue._claim(1)
+    db.query(models.TranslationJob).filter_by(id=job_id).delete()
+    db.commit()
+
+    queue._process(job_id, token)
+    assert jobs_by_language(article.id) == {}
@@ -0,0 +1,44 @@
+from trending_service import _TopKIndex
+
+
+def test_top_returns_best_first():
+    index = _TopKIndex()
+    for article_id, score in ((1, 0.5), (2, 2.0), (3, 1.0), (4, -1.0)):
+        index.update(article_id, score)
+    assert index.top(3) == [(2, 2.0), (3, 1.0), (1, 0.5)]
+    assert index.top(10) == [(2, 2.0), (3, 1.0), (1, 0.5), (4, -1.0)]
+    assert len(index) == 4
+
+
+def test_reading_top_keeps_entries():
+    index = _TopKIndex()
+    index.update(1, 1.0)
+    index.update(2, 2.0)
+    assert index.top(1) == [(2, 2.0)]
+    assert index.top(2) == [(2, 2.0), (1, 1.0)]
+
+
+def test_updates_supersede_older_scores():
+    index = _TopKIndex()
+    index.update(1, 5.0)
+    index.update(2, 3.0)
+    index.update(1, 1.0)
+    assert index.top(2) == [(2, 3.0), (1, 1.0)]
+
+
+def test_removed_articles_are_skipped():
+    index = _TopKIndex()
+    index.update(1, 5.0)
+    index.update(2, 3.0)
+    index.remove(1)
+    index.remove(99)
+    assert index.top(2) == [(2, 3.0)]
+    assert len(index) == 1
+
+
+def test_stale_entries_trigger_a_rebuild():
+    index = _TopKIndex()
+    for step in range(1000):
+        index.update(step % 3, float(step))
+    assert len(index.heap) <= 2 * len(index) + 64
+    assert index.top(3) == [(0, 999.0), (2, 998.0), (1, 997.0)]
@@ -0,0 +1,313 @@
+import importlib
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+import crud
+import metrics
+import models
+from database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+TRANSLATION_WORKERS = int(os.environ.get("TRANSLATION_WORKERS", 4))
+TRANSLATION_POLL_INTERVAL_SECONDS = int(os.environ.get("TRANSLATION_POLL_INTERVAL_SECONDS", 5))
+TRANSLATION_MAX_ATTEMPTS = int(os.environ.get("TRANSLATION_MAX_ATTEMPTS", 3))
+# A failed attempt waits this long times the attempt number before it is retried
+TRANSLATION_RETRY_SECONDS = int(os.environ.get("TRANSLATION_RETRY_SECONDS", 30))
+# Running jobs older than this belonged to a worker that died and are queued again
+TRANSLATION_STALE_JOB_MINUTES = int(os.environ.get("TRANSLATION_STALE_JOB_MINUTES", 15))
+# "module:Class" of the Translator implementation
+TRANSLATOR = os.environ.get("TRANSLATOR", "translation_service:StubTranslator")
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+STATUSES = (QUEUED, RUNNING, DONE, FAILED)
+
+
+class Translator:
+    """Translates a batch of texts between two language codes; called from several worker threads at once"""
+
+    def translate(self, texts: List[str], source_language: str, target_language: str) -> List[str]:
+        raise NotImplementedError
+
+
+class StubTranslator(Translator):
+    """Local stand-in that tags each text with the target language, for development and tests"""
+
+    def __init__(self, delay_seconds: float = 0.0):
+        self.delay_seconds = delay_seconds
+
+    def translate(self, texts: List[str], source_language: str, target_language: str) -> List[str]:
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+        tag = f"[{target_language.upper()}] "
+        return [tag + text if text else text for text in texts]
+
+
+def load_translator(spec: str = TRANSLATOR) -> Translator:
+    module_name, _, class_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+class TranslationQueue:
+    """DB-backed queue of (article, language) translation jobs worked off by a pool of threads.
+
+    Jobs are claimed with a per-claim token, so several processes can share the
+    queue; a job survives restarts and is retried with backoff when it fails.
+    """
+
+    def __init__(self, workers: int = TRANSLATION_WORKERS, translator: Optional[Translator] = None):
+        self.workers = workers
+        self._translator = translator
+        self.scheduler = BackgroundScheduler()
+        self.job_id = "translation_queue"
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._drain_lock = threading.Lock()
+
+    @property
+    def translator(self) -> Translator:
+        if self._translator is None:
+            self._translator = load_translator()
+            logger.info(f"Using translator {TRANSLATOR}")
+        return self._translator
+
+    def set_translator(self, translator: Translator):
+        self._translator = translator
+
+    def enqueue(self, db: Session, article: models.Article, languages: Iterable[str]) -> Dict[str, Any]:
+        """Queue translations of the article, skipping languages that are already queued, running or done"""
+        languages = [language for language in dict.fromkeys(languages) if language != article.language]
+        Job = models.TranslationJob
+        existing_jobs = {job.language: job for job in db.query(Job).filter(
+            Job.original_article_id == article.id, Job.language.in_(languages)
+        )}
+        # Translations made before the queue existed (or through the synchronous endpoint) count as done
+        existing_articles = dict(db.query(models.Article.language, models.Article.id).filter(
+            models.Article.original_article_id == article.id, models.Article.language.in_(languages)
+        ).all())
+
+        now = datetime.utcnow()
+        queued, deduplicated, new_jobs = [], [], []
+        for language in languages:
+            job = existing_jobs.get(language)
+            if job is None:
+                translated_article_id = existing_articles.get(language)
+                new_jobs.append({
+                    "original_article_id": article.id,
+                    "language": language,
+                    "status": DONE if translated_article_id else QUEUED,
+                    "attempts": 0,
+                    "translated_article_id": translated_article_id,
+                    "created_at": now,
+                    "finished_at": now if translated_article_id else None
+                })
+                (deduplicated if translated_article_id else queued).append(language)
+            elif job.status == FAILED:
+                job.status, job.attempts, job.error = QUEUED, 0, None
+                job.claim_token, job.available_at, job.finished_at = None, None, None
+                queued.append(language)
+            else:
+                deduplicated.append(language)
+        if new_jobs:
+            # A job inserted by a concurrent request for the same pair wins; ours is dropped
+            db.execute(sqlite_insert(Job.__table__).on_conflict_do_nothing(), new_jobs)
+        db.commit()
+
+        if queued:
+            self.wake()
+        return {"queued": queued, "deduplicated": deduplicated, **self.progress(db, article.id)}
+
+    def progress(self, db: Session, article_id: int) -> Dict[str, Any]:
+        """Per-language job states for one article"""
+        jobs = db.query(models.TranslationJob).filter(
+            models.TranslationJob.original_article_id == article_id
+        ).order_by(models.TranslationJob.id).all()
+        counts = Counter(job.status for job in jobs)
+        return {
+            "article_id": article_id,
+            "total": len(jobs),
+            "counts": {status: counts.get(status, 0) for status in STATUSES},
+            "complete": counts[DONE] + counts[FAILED] == len(jobs),
+            "jobs": [
+                {
+                    "language": job.language,
+                    "status": job.status,
+                    "attempts": job.attempts,
+                    "translated_article_id": job.translated_article_id,
+                    "error": job.error,
+                    "created_at": job.created_at,
+                    "finished_at": job.finished_at
+                }
+                for job in jobs
+            ]
+        }
+
+    def _claim(self, limit: int) -> List[Tuple[int, str]]:
+        Job = models.TranslationJob
+        token = uuid.uuid4().hex
+        now = datetime.utcnow()
+        db = SessionLocal()
+        try:
+            candidates = select(Job.id).where(
+                Job.status == QUEUED, or_(Job.available_at.is_(None), Job.available_at <= now)
+            ).order_by(Job.id).limit(limit)
+            job_ids = [row[0] for row in db.execute(candidates)]
+            if not job_ids:
+                return []
+            # The status check in the UPDATE makes the claim atomic against other processes
+            db.execute(update(Job).where(Job.id.in_(job_ids), Job.status == QUEUED).values(
+                status=RUNNING, claim_token=token, started_at=now, attempts=Job.attempts + 1
+            ))
+            db.commit()
+            return [(row[0], token) for row in db.execute(select(Job.id).where(Job.claim_token == token))]
+        finally:
+            db.close()
+
+    def _requeue_stale(self) -> int:
+        Job = models.TranslationJob
+        cutoff = datetime.utcnow() - timedelta(minutes=TRANSLATION_STALE_JOB_MINUTES)
+        db = SessionLocal()
+        try:
+            result = db.execute(update(Job).where(Job.status == RUNNING, Job.started_at < cutoff).values(
+                status=QUEUED, claim_token=None
+            ))
+            db.commit()
+            if result.rowcount:
+                logger.warning(f"Re-queued {result.rowcount} stale translation jobs")
+            return result.rowcount
+        finally:
+            db.close()
+
+    def _finish(self, db: Session, job_id: int, token: str, **values):
+        Job = models.TranslationJob
+        # A job re-queued as stale and claimed again belongs to the new claim
+        db.execute(update(Job).where(and_(Job.id == job_id, Job.claim_token == token)).values(**values))
+        db.commit()
+
+    def _process(self, job_id: int, token: str):
+        started = time.perf_counter()
+        db = SessionLocal()
+        try:
+            job = db.get(models.TranslationJob, job_id)
+            if job is None:
+                # Deleted after it was claimed; there is nothing left to record
+                logger.warning(f"Translation job {job_id} no longer exists")
+                return
+            try:
+                original = db.get(models.Article, job.original_article_id)
+                if original is None:
+                    raise LookupError(f"Article {job.original_article_id} no longer exists")
+                existing = db.query(models.Article.id).filter(
+                    models.Article.original_article_id == original.id, models.Article.language == job.language
+                ).first()
+                if existing is not None:
+                    translated_article_id = existing.id
+                else:
+                    originals = [getattr(original, field) for field in crud.TRANSLATABLE_FIELDS]
+                    translated = self.translator.translate(
+                        [text or "" for text in originals], original.language or "en", job.language
+                    )
+                    if len(translated) != len(originals):
+                        raise ValueError(f"Translator returned {len(translated)} texts for {len(originals)}")
+                    translations = {
+                        field: text if source is not None else None
+                        for field, source, text in zip(crud.TRANSLATABLE_FIELDS, originals, translated)
+                    }
+                    translated_article_id = crud.create_translated_article(
+                        db, original, job.language, translations
+                    ).id
+                self._finish(db, job_id, token, status=DONE, translated_article_id=translated_article_id,
+                             error=None, finished_at=datetime.utcnow())
+                metrics.TRANSLATION_JOBS.inc((DONE,))
+            except Exception as e:
+                db.rollback()
+                error = f"{type(e).__name__}: {str(e)}"[:1000]
+                if job.attempts < TRANSLATION_MAX_ATTEMPTS:
+                    retry_at = datetime.utcnow() + timedelta(seconds=TRANSLATION_RETRY_SECONDS * job.attempts)
+                    self._finish(db, job_id, token, status=QUEUED, error=error, claim_token=None,
+                                 available_at=retry_at)
+                    metrics.TRANSLATION_JOBS.inc(("retry",))
+                else:
+                    self._finish(db, job_id, token, status=FAILED, error=error, finished_at=datetime.utcnow())
+                    metrics.TRANSLATION_JOBS.inc((FAILED,))
+                logger.warning(f"Translation job {job_id} ({job.language}) attempt {job.attempts} failed: {error}")
+        finally:
+            db.close()
+            metrics.TRANSLATION_DURATION.observe(time.perf_counter() - started)
+
+    def run_pending(self) -> int:
+        """Work off the queue, keeping every worker busy, until nothing is claimable; returns jobs processed"""
+        if not self._drain_lock.acquire(blocking=False):
+            return 0
+        executor = self._executor or ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="translate")
+        processed = 0
+        try:
+            self._requeue_stale()
+            in_flight = set()
+            while True:
+                free = self.workers - len(in_flight)
+                if free > 0:
+                    for job_id, token in self._claim(free):
+                        in_flight.add(executor.submit(self._process, job_id, token))
+                if not in_flight:
+                    break
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                processed += len(done)
+        except Exception as e:
+            logger.error(f"Translation queue run failed: {str(e)}")
+        finally:
+            if executor is not self._executor:
+                executor.shutdown(wait=True)
+            self._drain_lock.release()
+        if processed:
+            logger.info(f"Processed {processed} translation jobs")
+        return processed
+
+    def wake(self):
+        """Run the queue now instead of at the next poll"""
+        # A run in progress picks up new jobs itself before it finishes
+        if self.scheduler.running and not self._drain_lock.locked():
+            self.scheduler.modify_job(self.job_id, next_run_time=datetime.now())
+
+    def start(self, interval_seconds: int = TRANSLATION_POLL_INTERVAL_SECONDS):
+        """Poll the queue in the background and work jobs off on a thread pool"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="translate")
+        self.scheduler.add_job(
+            func=self.run_pending,
+            trigger=IntervalTrigger(seconds=interval_seconds),
+            id=self.job_id,
+            name="Process translation jobs",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            next_run_time=datetime.now()
+        )
+        if not self.scheduler.running:
+            self.scheduler.start()
+            logger.info(f"Translation queue started with {self.workers} workers")
+
+    def stop(self):
+        """Stop polling; jobs still running are re-queued as stale by the next process if they never finish"""
+        if self.scheduler.running:
+            self.scheduler.shutdown()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            logger.info("Translation queue stopped")
+
+
+# Global translation queue instance
+translation_queue = TranslationQueue()
@@ -0,0 +1,255 @@
+import heapq
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from analytics_service import ANALYTICS_DB_PATH, EVENT_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+TRENDING_HALF_LIFE_HOURS = float(os.environ.get("TRENDING_HALF_LIFE_HOURS", 6))
+TRENDING_PERSIST_INTERVAL_SECONDS = int(os.environ.get("TRENDING_PERSIST_INTERVAL_SECONDS", 60))
+# Articles whose decayed score falls below this are forgotten
+TRENDING_MIN_SCORE = 0.01
+
+# Weight of each event type; anything not listed does not move the score
+TRENDING_ACTION_WEIGHTS = {
+    "article_view": 1.0,
+    "view": 1.0,
+    "blog_modal_view": 1.0,
+    "social_share": 3.0,
+    "related_article_click": 0.5,
+}
+
+# Scores are stored as log(sum(w * exp(lambda * (t - EPOCH)))). Ranking by this
+# value is identical to ranking by the decayed score at any instant, so stored
+# scores never need to be decayed in place.
+TRENDING_EPOCH = 1704067200  # 2024-01-01T00:00:00Z
+
+CREATE_TRENDING_TABLE = """
+    CREATE TABLE IF NOT EXISTS trending_scores (
+        article_id INTEGER PRIMARY KEY,
+        log_score REAL NOT NULL,
+        category TEXT,
+        updated_at REAL NOT NULL
+    )
+"""
+
+ACTION_INDEX = EVENT_COLUMNS.index("action")
+ARTICLE_ID_INDEX = EVENT_COLUMNS.index("article_id")
+CATEGORY_INDEX = EVENT_COLUMNS.index("category")
+RECEIVED_AT_INDEX = EVENT_COLUMNS.index("received_at")
+
+
+class _TopKIndex:
+    """Max-heap over (log_score, article_id) with lazy invalidation.
+
+    Updates push a new entry in O(log n); superseded entries are skipped when
+    popped and the heap is rebuilt once stale entries outnumber live ones.
+    Reading the top K costs O((K + stale) log n) and never sorts all scores.
+    """
+
+    def __init__(self):
+        self.heap: List[Tuple[float, int]] = []
+        self.scores: Dict[int, float] = {}
+
+    def __len__(self):
+        return len(self.scores)
+
+    def update(self, article_id: int, log_score: float):
+        self.scores[article_id] = log_score
+        heapq.heappush(self.heap, (-log_score, article_id))
+        if len(self.heap) > 2 * len(self.scores) + 64:
+            self._rebuild()
+
+    def remove(self, article_id: int):
+        self.scores.pop(article_id, None)
+
+    def _rebuild(self):
+        self.heap = [(-score, article_id) for article_id, score in self.scores.items()]
+        heapq.heapify(self.heap)
+
+    def top(self, k: int) -> List[Tuple[int, float]]:
+        result = []
+        popped = []
+        heap = self.heap
+        while heap and len(result) < k:
+            entry = heapq.heappop(heap)
+            neg_score, article_id = entry
+            if self.scores.get(article_id) != -neg_score:
+                continue  # superseded or removed entry, drop it for good
+            popped.append(entry)
+            result.append((article_id, -neg_score))
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        return result
+
+
+class TrendingEngine:
+    """Maintains exponentially time-decayed popularity scores per article"""
+
+    def __init__(self, db_path=ANALYTICS_DB_PATH, half_life_hours: float = TRENDING_HALF_LIFE_HOURS):
+        self.db_path = db_path
+        self.decay_rate = math.log(2) / (half_life_hours * 3600)
+        self.scheduler = BackgroundScheduler()
+        self.job_id = "persist_trending_scores"
+        self._lock = threading.Lock()
+        self._connection = None
+        self._global = _TopKIndex()
+        self._by_category: Dict[str, _TopKIndex] = {}
+        self._categories: Dict[int, str] = {}
+        self._dirty: Dict[int, float] = {}
+        self.last_persist_at = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(CREATE_TRENDING_TABLE)
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def _set_score(self, article_id: int, log_score: float, category: Optional[str]):
+        self._global.update(article_id, log_score)
+        if category:
+            previous = self._categories.get(article_id)
+            if previous and previous != category and previous in self._by_category:
+                self._by_category[previous].remove(article_id)
+            self._categories[article_id] = category
+        category = self._categories.get(article_id)
+        if category:
+            self._by_category.setdefault(category, _TopKIndex()).update(article_id, log_score)
+
+    def record(self, article_id: int, weight: float = 1.0, timestamp: Optional[float] = None,
+               category: Optional[str] = None):
+        """Add a weighted event for an article at the given time (defaults to now)"""
+        if not article_id or weight <= 0:
+            return
+        timestamp = timestamp if timestamp is not None else time.time()
+        contribution = math.log(weight) + self.decay_rate * (timestamp - TRENDING_EPOCH)
+        with self._lock:
+            current = self._global.scores.get(article_id)
+            if current is None:
+                log_score = contribution
+            else:
+                high, low = max(current, contribution), min(current, contribution)
+                log_score = high + math.log1p(math.exp(low - high))
+            self._set_score(article_id, log_score, category)
+            self._dirty[article_id] = log_score
+
+    def record_analytics_batch(self, rows: List[Tuple]):
+        """Analytics listener: fold persisted tracking events into the scores"""
+        for row in rows:
+            weight = TRENDING_ACTION_WEIGHTS.get(row[ACTION_INDEX])
+            if weight and row[ARTICLE_ID_INDEX]:
+                # Only server-side article_view events carry the category slug;
+                # frontend events put a display section name there instead
+                category = row[CATEGORY_INDEX] if row[ACTION_INDEX] == "article_view" else None
+                self.record(row[ARTICLE_ID_INDEX], weight, row[RECEIVED_AT_INDEX], category)
+
+    def decayed_score(self, log_score: float, now: Optional[float] = None) -> float:
+        now = now if now is not None else time.time()
+        return math.exp(log_score - self.decay_rate * (now - TRENDING_EPOCH))
+
+    def top(self, limit: int = 15, category: Optional[str] = None) -> List[Dict[str, float]]:
+        """Highest-scoring article ids with their current decayed scores"""
+        now = time.time()
+        with self._lock:
+            index = self._by_category.get(category) if category else self._global
+            ranked = index.top(limit) if index else []
+        return [
+            {"article_id": article_id, "score": round(self.decayed_score(log_score, now), 4)}
+            for article_id, log_score in ranked
+        ]
+
+    def score_of(self, article_id: int) -> float:
+        with self._lock:
+            log_score = self._global.scores.get(article_id)
+        return self.decayed_score(log_score) if log_score is not None else 0.0
+
+    def load(self):
+        """Restore scores persisted by a previous run"""
+        try:
+            rows = self._get_connection().execute(
+                "SELECT article_id, log_score, category FROM trending_scores"
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to load trending scores: {str(e)}")
+            return
+        with self._lock:
+            for article_id, log_score, category in rows:
+                self._set_score(article_id, log_score, category)
+        logger.info(f"Loaded {len(rows)} trending scores")
+
+    def persist(self):
+        """Write changed scores and forget articles that have decayed to nothing"""
+        threshold = math.log(TRENDING_MIN_SCORE) + self.decay_rate * (time.time() - TRENDING_EPOCH)
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = {}
+            expired = [article_id for article_id, score in self._global.scores.items() if score < threshold]
+            for article_id in expired:
+                self._global.remove(article_id)
+                category = self._categories.pop(article_id, None)
+                if category in self._by_category:
+                    self._by_category[category].remove(article_id)
+                dirty.pop(article_id, None)
+            rows = [
+                (article_id, log_score, self._categories.get(article_id), time.time())
+                for article_id, log_score in dirty.items()
+            ]
+        try:
+            connection = self._get_connection()
+            with connection:
+                connection.executemany(
+                    "INSERT INTO trending_scores (article_id, log_score, category, updated_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (article_id) DO UPDATE SET log_score = excluded.log_score, "
+                    "category = excluded.category, updated_at = excluded.updated_at",
+                    rows
+                )
+                connection.execute("DELETE FROM trending_scores WHERE log_score < ?", (threshold,))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to persist trending scores: {str(e)}")
+            with self._lock:
+                for article_id, log_score, _, _ in rows:
+                    self._dirty.setdefault(article_id, log_score)
+            return
+        self.last_persist_at = time.time()
+
+    def start(self, interval_seconds: int = TRENDING_PERSIST_INTERVAL_SECONDS):
+        """Load persisted scores and start the periodic persistence job"""
+        self.load()
+        self.scheduler.add_job(
+            func=self.persist,
+            trigger=IntervalTrigger(seconds=interval_seconds),
+            id=self.job_id,
+            name="Persist trending scores",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True
+        )
+        if not self.scheduler.running:
+            self.scheduler.start()
+            logger.info("Trending engine started")
+
+    def stop(self):
+        """Stop the persistence job after a final write"""
+        if self.scheduler.running:
+            self.scheduler.shutdown()
+        self.persist()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        logger.info("Trending engine stopped")
+
+
+# Global trending engine instance
+trending_engine = TrendingEngine()
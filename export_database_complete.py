@@ -4,119 +4,40 @@ Complete database export script for Tadka News Platform
 Exports all data and creates migration scripts for fresh installation
 """
 
-import sqlite3
 import json
 import os
-from datetime import datetime
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent
+sys.path.append(str(ROOT_DIR / 'backend'))
+
+from database_export import export_database
+
+DB_PATH = ROOT_DIR / 'backend' / 'blog_cms.db'
+EXPORT_DIR = ROOT_DIR / 'database_export'
 
 def export_database_data():
-    """Export all database data to SQL and JSON formats"""
+    """Export all database data to streamed, gzip-compressed NDJSON and SQL files"""
     
-    db_path = '/app/backend/blog_cms.db'
-    if not os.path.exists(db_path):
+    if not DB_PATH.exists():
         print("❌ Database file not found!")
         return
     
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row  # Enable column access by name
-    cursor = conn.cursor()
-    
-    # Get all tables
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-    tables = [table[0] for table in cursor.fetchall()]
-    
-    print(f"📊 Found {len(tables)} tables to export")
-    
-    # Export data
-    exported_data = {}
-    sql_exports = []
-    
-    # Add header to SQL export
-    sql_exports.append("-- Tadka News Platform Database Export")
-    sql_exports.append(f"-- Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    sql_exports.append("-- This file contains all data to recreate the complete database")
-    sql_exports.append("")
-    
-    total_records = 0
-    
-    for table in tables:
-        print(f"📄 Exporting table: {table}")
-        
-        # Get table schema
-        cursor.execute(f"SELECT sql FROM sqlite_master WHERE type='table' AND name='{table}'")
-        schema = cursor.fetchone()
-        if schema:
-            sql_exports.append(f"-- Table: {table}")
-            sql_exports.append(schema[0] + ";")
-            sql_exports.append("")
-        
-        # Get all data from table
-        cursor.execute(f"SELECT * FROM {table}")
-        rows = cursor.fetchall()
-        
-        if rows:
-            # Convert to list of dictionaries for JSON export
-            table_data = []
-            for row in rows:
-                table_data.append(dict(row))
-            
-            exported_data[table] = table_data
-            total_records += len(rows)
-            
-            # Generate INSERT statements for SQL export
-            if len(rows) > 0:
-                # Get column names
-                columns = [description[0] for description in cursor.description]
-                
-                sql_exports.append(f"-- Data for table: {table} ({len(rows)} records)")
-                
-                for row in rows:
-                    values = []
-                    for value in row:
-                        if value is None:
-                            values.append("NULL")
-                        elif isinstance(value, str):
-                            # Escape single quotes
-                            escaped_value = value.replace("'", "''")
-                            values.append(f"'{escaped_value}'")
-                        else:
-                            values.append(str(value))
-                    
-                    columns_str = ", ".join(columns)
-                    values_str = ", ".join(values)
-                    sql_exports.append(f"INSERT INTO {table} ({columns_str}) VALUES ({values_str});")
-                
-                sql_exports.append("")
-            
-            print(f"   ✅ {len(rows)} records exported")
-        else:
-            exported_data[table] = []
-            print(f"   📭 No records found")
-    
-    conn.close()
-    
-    # Write JSON export
-    json_file = '/app/database_export.json'
-    with open(json_file, 'w', encoding='utf-8') as f:
-        json.dump(exported_data, f, indent=2, ensure_ascii=False, default=str)
-    
-    # Write SQL export
-    sql_file = '/app/database_export.sql'
-    with open(sql_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(sql_exports))
+    print(f"📊 Exporting {DB_PATH} to {EXPORT_DIR}")
+    manifest = export_database(db_path=DB_PATH, output_dir=EXPORT_DIR, resume='--resume' in sys.argv)
+    tables = {table: result['rows'] for table, result in manifest['tables'].items()}
+    total_records = manifest['total_records']
     
     # Create summary report
     summary = {
-        'export_timestamp': datetime.now().isoformat(),
-        'total_tables': len(tables),
+        'export_timestamp': manifest['export_timestamp'],
+        'total_tables': manifest['total_tables'],
         'total_records': total_records,
-        'tables': {}
+        'tables': tables
     }
     
-    for table in tables:
-        summary['tables'][table] = len(exported_data.get(table, []))
-    
-    summary_file = '/app/database_export_summary.json'
+    summary_file = ROOT_DIR / 'database_export_summary.json'
     with open(summary_file, 'w', encoding='utf-8') as f:
         json.dump(summary, f, indent=2)
     
@@ -124,31 +45,24 @@ def export_database_data():
     ✅ Database export completed!
     
     📊 Export Summary:
-    - Total Tables: {len(tables)}
+    - Total Tables: {manifest['total_tables']}
     - Total Records: {total_records}
-    - JSON Export: {json_file}
-    - SQL Export: {sql_file}
+    - Export Directory: {EXPORT_DIR}
     - Summary: {summary_file}
     
     📋 Key Content Exported:
-    - Articles: {len(exported_data.get('articles', []))} records
-    - Categories: {len(exported_data.get('categories', []))} records  
-    - Movie Reviews: {len(exported_data.get('movie_reviews', []))} records
-    - Theater Releases: {len(exported_data.get('theater_releases', []))} records
-    - OTT Releases: {len(exported_data.get('ott_releases', []))} records
-    - Topics: {len(exported_data.get('topics', []))} records
-    - Galleries: {len(exported_data.get('galleries', []))} records
+    - Articles: {tables.get('articles', 0)} records
+    - Categories: {tables.get('categories', 0)} records  
+    - Movie Reviews: {tables.get('movie_reviews', 0)} records
+    - Theater Releases: {tables.get('theater_releases', 0)} records
+    - OTT Releases: {tables.get('ott_releases', 0)} records
+    - Topics: {tables.get('topics', 0)} records
+    - Galleries: {tables.get('galleries', 0)} records
     """)
     
-    # Print detailed breakdown
-    print("\n📊 Detailed Table Breakdown:")
-    for table, count in summary['tables'].items():
-        print(f"   {table}: {count} records")
-    
     return {
-        'json_file': json_file,
-        'sql_file': sql_file,
-        'summary_file': summary_file,
+        'export_dir': str(EXPORT_DIR),
+        'summary_file': str(summary_file),
         'total_records': total_records
     }
 
@@ -162,11 +76,17 @@ This script sets up a fresh database with all exported data
 """
 
 import sqlite3
-import json
 import os
 import sys
 from datetime import datetime
 
+sys.path.append('backend')
+
+from bulk_import import bulk_load
+from migrations import migrate
+
+EXPORT_DIR = 'database_export'
+
 def setup_fresh_database():
     """Setup fresh database with all data"""
     
@@ -175,39 +95,36 @@ def setup_fresh_database():
     # Database path
     db_path = 'backend/blog_cms.db'
     
+    # Check if data files exist
+    manifest_file = os.path.join(EXPORT_DIR, 'manifest.json')
+    if not os.path.exists(manifest_file):
+        print(f"❌ {manifest_file} not found!")
+        print("   Make sure to place the exported database directory in the project root")
+        sys.exit(1)
+    
     # Remove existing database if it exists
     if os.path.exists(db_path):
         backup_name = f"blog_cms_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
         os.rename(db_path, backup_name)
         print(f"📦 Existing database backed up as: {backup_name}")
     
-    # Check if data files exist
-    if not os.path.exists('database_export.json'):
-        print("❌ database_export.json not found!")
-        print("   Make sure to place the exported database files in the project root")
-        sys.exit(1)
-    
-    if not os.path.exists('database_export.sql'):
-        print("❌ database_export.sql not found!")
-        sys.exit(1)
-    
     # Create database directory if it doesn't exist
     os.makedirs('backend', exist_ok=True)
     
-    # Execute SQL import
+    # Bulk load: indexes are built once after the data, with synchronous=OFF during the load
     print("📊 Importing database schema and data...")
     
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
+    conn = None
     try:
-        # Read and execute SQL file
-        with open('database_export.sql', 'r', encoding='utf-8') as f:
-            sql_content = f.read()
+        bulk_load(EXPORT_DIR, db_path)
+        
+        # Bring exports taken from older installs up to the current schema
+        applied = migrate(db_path)
+        if applied:
+            print(f"🔧 Applied schema migrations: {applied}")
         
-        # Execute SQL statements
-        cursor.executescript(sql_content)
-        conn.commit()
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
         
         # Verify import
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
@@ -228,11 +145,11 @@ def setup_fresh_database():
         
     except Exception as e:
         print(f"❌ Error during database setup: {str(e)}")
-        conn.rollback()
         sys.exit(1)
     
     finally:
-        conn.close()
+        if conn is not None:
+            conn.close()
     
     # Create .env file with database URL if it doesn't exist
     env_file = 'backend/.env'
@@ -252,7 +169,7 @@ if __name__ == "__main__":
     setup_fresh_database()
 '''
     
-    migration_file = '/app/fresh_install_migration.py'
+    migration_file = ROOT_DIR / 'fresh_install_migration.py'
     with open(migration_file, 'w', encoding='utf-8') as f:
         f.write(migration_script)
     
@@ -337,8 +254,7 @@ app/
 │   │   ├── contexts/       # React contexts
 │   │   └── services/       # API services
 │   └── public/             # Static files
-├── database_export.json    # Database backup (JSON)
-├── database_export.sql     # Database backup (SQL)
+├── database_export/        # Database backup (gzip NDJSON + SQL per table)
 └── fresh_install_migration.py # Setup script
 ```
 
@@ -402,7 +318,7 @@ If you encounter issues:
 **🔥 Your complete Tadka News Platform is ready to go!**
 '''
     
-    readme_file = '/app/FRESH_INSTALL_README.md'
+    readme_file = ROOT_DIR / 'FRESH_INSTALL_README.md'
     with open(readme_file, 'w', encoding='utf-8') as f:
         f.write(readme_content)
     
@@ -424,8 +340,7 @@ if __name__ == "__main__":
 🎉 COMPLETE DATABASE EXPORT READY!
 
 📦 Files Created:
-- {export_result['json_file']} (JSON backup)
-- {export_result['sql_file']} (SQL backup)  
+- {export_result['export_dir']} (NDJSON + SQL backup)
 - {migration_file} (Fresh install script)
 - {readme_file} (Installation guide)
 
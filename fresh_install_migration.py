@@ -5,11 +5,17 @@ This script sets up a fresh database with all exported data
 """
 
 import sqlite3
-import json
 import os
 import sys
 from datetime import datetime
 
+sys.path.append('backend')
+
+from bulk_import import bulk_load
+from migrations import migrate
+
+EXPORT_DIR = 'database_export'
+
 def setup_fresh_database():
     """Setup fresh database with all data"""
     
@@ -18,39 +24,36 @@ def setup_fresh_database():
     # Database path
     db_path = 'backend/blog_cms.db'
     
+    # Check if data files exist
+    manifest_file = os.path.join(EXPORT_DIR, 'manifest.json')
+    if not os.path.exists(manifest_file):
+        print(f"❌ {manifest_file} not found!")
+        print("   Make sure to place the exported database directory in the project root")
+        sys.exit(1)
+    
     # Remove existing database if it exists
     if os.path.exists(db_path):
         backup_name = f"blog_cms_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
         os.rename(db_path, backup_name)
         print(f"📦 Existing database backed up as: {backup_name}")
     
-    # Check if data files exist
-    if not os.path.exists('database_export.json'):
-        print("❌ database_export.json not found!")
-        print("   Make sure to place the exported database files in the project root")
-        sys.exit(1)
-    
-    if not os.path.exists('database_export.sql'):
-        print("❌ database_export.sql not found!")
-        sys.exit(1)
-    
     # Create database directory if it doesn't exist
     os.makedirs('backend', exist_ok=True)
     
-    # Execute SQL import
+    # Bulk load: indexes are built once after the data, with synchronous=OFF during the load
     print("📊 Importing database schema and data...")
     
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
+    conn = None
     try:
-        # Read and execute SQL file
-        with open('database_export.sql', 'r', encoding='utf-8') as f:
-            sql_content = f.read()
+        bulk_load(EXPORT_DIR, db_path)
+        
+        # Bring exports taken from older installs up to the current schema
+        applied = migrate(db_path)
+        if applied:
+            print(f"🔧 Applied schema migrations: {applied}")
         
-        # Execute SQL statements
-        cursor.executescript(sql_content)
-        conn.commit()
+        conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
         
         # Verify import
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
@@ -71,11 +74,11 @@ def setup_fresh_database():
         
     except Exception as e:
         print(f"❌ Error during database setup: {str(e)}")
-        conn.rollback()
         sys.exit(1)
     
     finally:
-        conn.close()
+        if conn is not None:
+            conn.close()
     
     # Create .env file with database URL if it doesn't exist
     env_file = 'backend/.env'
@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
+import { fetchAllPages } from '../../utils/pagination';
 
 const AdminControls = () => {
   const navigate = useNavigate();
@@ -35,9 +36,8 @@ const AdminControls = () => {
 
   const fetchScheduledArticles = async () => {
     try {
-      const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/cms/scheduled-articles`);
-      if (response.ok) {
-        const data = await response.json();
+      const data = await fetchAllPages(`${process.env.REACT_APP_BACKEND_URL}/api/cms/scheduled-articles`);
+      if (data) {
         setScheduledArticles(data);
       }
     } catch (error) {
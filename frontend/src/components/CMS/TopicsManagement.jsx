@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
+import { fetchAllPages } from '../../utils/pagination';
 
 const TopicsManagement = () => {
   const navigate = useNavigate();
@@ -177,8 +178,7 @@ const TopicsManagement = () => {
       const articles = articlesResponse.ok ? await articlesResponse.json() : [];
       
       // Fetch galleries associated with this topic
-      const galleriesResponse = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/topics/${topic.id}/galleries`);
-      const galleries = galleriesResponse.ok ? await galleriesResponse.json() : [];
+      const galleries = await fetchAllPages(`${process.env.REACT_APP_BACKEND_URL}/api/topics/${topic.id}/galleries`) || [];
       
       setTopicContent({ articles, galleries });
     } catch (error) {
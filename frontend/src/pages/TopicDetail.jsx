@@ -4,6 +4,7 @@ import { useTheme } from '../contexts/ThemeContext';
 import { useLanguage } from '../contexts/LanguageContext';
 import dataService from '../services/dataService';
 import { PlaceholderImage } from '../utils/imageUtils';
+import { fetchAllPages } from '../utils/pagination';
 import ImageModal from '../components/ImageModal';
 
 const TopicDetail = () => {
@@ -190,9 +191,8 @@ const TopicDetail = () => {
           }
 
           // Fetch galleries for this topic
-          const galleriesResponse = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/topics/${topicData.id}/galleries`);
-          if (galleriesResponse.ok) {
-            const topicGalleries = await galleriesResponse.json();
+          const topicGalleries = await fetchAllPages(`${process.env.REACT_APP_BACKEND_URL}/api/topics/${topicData.id}/galleries`);
+          if (topicGalleries) {
             setGalleries(topicGalleries);
           }
         } else {
@@ -2,6 +2,10 @@ import React, { useState, useEffect } from 'react';
 import { useNavigate, useParams } from 'react-router-dom';
 import { useTheme } from '../contexts/ThemeContext';
 import { useLanguage } from '../contexts/LanguageContext';
+import { fetchPage } from '../utils/pagination';
+
+// Matches the API's default page size for movie articles
+const MOVIE_PAGE_SIZE = 50;
 
 const ViewMovieContent = () => {
   const navigate = useNavigate();
@@ -16,14 +20,20 @@ const ViewMovieContent = () => {
   const [selectedFilter, setSelectedFilter] = useState('all');
   const [isFilterOpen, setIsFilterOpen] = useState(false);
   const [filteredContent, setFilteredContent] = useState([]);
+  const [hasMore, setHasMore] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [loadMoreError, setLoadMoreError] = useState(null);
 
   // Decode movie name from URL
   const decodedMovieName = decodeURIComponent(movieName || '');
+  const movieArticlesUrl = `${process.env.REACT_APP_BACKEND_URL}/api/articles/movie/${encodeURIComponent(decodedMovieName)}`;
 
   useEffect(() => {
     const fetchMovieContent = async () => {
       try {
         setLoading(true);
+        setHasMore(false);
+        setLoadMoreError(null);
         
         // Initialize movieInfo to null for this fetch
         let currentMovieInfo = null;
@@ -70,15 +80,15 @@ const ViewMovieContent = () => {
           console.warn('Error fetching movie release info:', err);
         }
         
-        // Fetch all articles tagged with the movie name
-        const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/articles/movie/${encodeURIComponent(decodedMovieName)}`);
+        // Fetch the first page of articles tagged with the movie name; more load on demand
+        const firstPage = await fetchPage(movieArticlesUrl, 0, MOVIE_PAGE_SIZE);
         
-        if (response.ok) {
-          const movieArticles = await response.json();
-          setMovieContent(movieArticles);
+        if (firstPage.rows) {
+          setMovieContent(firstPage.rows);
+          setHasMore(firstPage.hasMore);
           
           // Initialize filtered content with all articles
-          setFilteredContent(movieArticles);
+          setFilteredContent(firstPage.rows);
         } else {
           // Fallback: search by movie name in title or tags
           const fallbackResponse = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/articles/search?q=${encodeURIComponent(decodedMovieName)}`);
@@ -123,6 +133,31 @@ const ViewMovieContent = () => {
     }
   }, [decodedMovieName]);
 
+  // Append the next page of movie articles (the endpoint is rate limited, so only on request)
+  const loadMoreMovieContent = async () => {
+    setLoadingMore(true);
+    setLoadMoreError(null);
+    try {
+      const page = await fetchPage(movieArticlesUrl, movieContent.length, MOVIE_PAGE_SIZE);
+      if (page.rows) {
+        setMovieContent(prev => {
+          const seen = new Set(prev.map(article => article.id));
+          return [...prev, ...page.rows.filter(article => !seen.has(article.id))];
+        });
+        setHasMore(page.hasMore);
+      } else if (page.status === 429) {
+        setLoadMoreError('Too many requests. Please wait a moment and try again.');
+      } else {
+        setLoadMoreError('Failed to load more content. Please try again.');
+      }
+    } catch (err) {
+      console.error('Error loading more movie content:', err);
+      setLoadMoreError('Failed to load more content. Please try again.');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // Update filtered content when filter changes
   useEffect(() => {
     const filtered = filterContentByType(movieContent, selectedFilter);
@@ -401,6 +436,22 @@ const ViewMovieContent = () => {
                 </div>
               )}
             </div>
+
+            {/* Load More */}
+            {(hasMore || loadMoreError) && (
+              <div className="text-center mb-8">
+                {loadMoreError && (
+                  <p className="text-sm text-red-600 mb-3">{loadMoreError}</p>
+                )}
+                <button
+                  onClick={loadMoreMovieContent}
+                  disabled={loadingMore}
+                  className="px-4 py-2 text-sm font-medium text-gray-700 bg-white border border-gray-300 rounded-lg hover:bg-gray-50 disabled:opacity-50 transition-colors duration-200"
+                >
+                  {loadingMore ? 'Loading...' : 'Load More'}
+                </button>
+              </div>
+            )}
           </div>
 
           {/* Related Posts Section - 30% width (Sidebar) */}
@@ -0,0 +1,32 @@
+// List endpoints return at most `limit` rows per request (the API caps limit at 100)
+export const MAX_PAGE_SIZE = 100;
+
+// Fetch one page of a skip/limit paged list endpoint.
+// rows is null when the request failed (status 429 means it was rate limited);
+// hasMore is true when the page came back full.
+export const fetchPage = async (url, skip = 0, pageSize = MAX_PAGE_SIZE) => {
+  const separator = url.includes('?') ? '&' : '?';
+  const response = await fetch(`${url}${separator}skip=${skip}&limit=${pageSize}`);
+  if (!response.ok) {
+    return { rows: null, hasMore: false, status: response.status };
+  }
+  const rows = await response.json();
+  return { rows, hasMore: rows.length === pageSize, status: response.status };
+};
+
+// Fetch every row of a skip/limit paged list endpoint. Only for small CMS lists
+// on endpoints that are not rate limited; public pages should load page by page.
+// Returns null when the first page fails so callers can fall back;
+// a failure on a later page throws rather than returning a truncated list.
+export const fetchAllPages = async (url, pageSize = MAX_PAGE_SIZE) => {
+  const rows = [];
+  for (let skip = 0; ; skip += pageSize) {
+    const page = await fetchPage(url, skip, pageSize);
+    if (!page.rows) {
+      if (skip === 0) return null;
+      throw new Error(`Failed to load ${url} (HTTP ${page.status})`);
+    }
+    rows.push(...page.rows);
+    if (!page.hasMore) return rows;
+  }
+};